@@ -0,0 +1,84 @@
+"""Benchmark the edit-distance kernels in ``cltk.text_reuse.distance``
+against the nested-loop implementation ``Levenshtein.Levenshtein_Distance``
+used before them, on Latin words and on sentence-length lines.
+
+Run with ``python benchmarks/edit_distance.py``.
+"""
+
+import timeit
+
+from cltk.text_reuse import distance
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+AENEID = """Arma virumque cano, Troiae qui primus ab oris
+Italiam, fato profugus, Laviniaque venit
+litora, multum ille et terris iactatus et alto
+vi superum saevae memorem Iunonis ob iram;
+multa quoque et bello passus, dum conderet urbem,
+inferretque deos Latio, genus unde Latinum,
+Albanique patres, atque altae moenia Romae.
+Musa, mihi causas memora, quo numine laeso,
+quidve dolens, regina deum tot volvere casus
+insignem pietate virum, tot adire labores
+impulerit. Tantaene animis caelestibus irae?"""
+
+
+def legacy_distance(w1, w2):
+    """The dynamic programming loop formerly in
+    ``Levenshtein.Levenshtein_Distance``.
+    """
+    m, n = len(w1), len(w2)
+    v1 = [i for i in range(n + 1)]
+    v2 = [0 for i in range(n + 1)]
+    for i in range(m):
+        v2[0] = i + 1
+        for j in range(n):
+            sub_cost = v1[j] + (w1[i] != w2[j])
+            v2[j + 1] = min(v1[j + 1] + 1, v2[j] + 1, sub_cost)
+        v1, v2 = v2, v1
+    return v1[-1]
+
+
+def report(name, func, pairs, number):
+    """Print the time per comparison of ``func`` over ``pairs``."""
+    seconds = timeit.timeit(lambda: [func(a, b) for a, b in pairs], number=number)
+    print('{:<44}{:>10.2f} us'.format(name, seconds / number / len(pairs) * 1e6))
+
+
+def main():
+    """Run the benchmark."""
+    words = sorted(set(AENEID.lower().replace(',', ' ').replace('.', ' ')
+                       .replace(';', ' ').replace('?', ' ').split()))
+    lines = AENEID.splitlines()
+    word_pairs = [(a, b) for a in words for b in words]
+    line_pairs = [(a, b) for a in lines for b in lines]
+    print('backend: {}'.format(distance.BACKEND))
+    print('{} word pairs, {} line pairs\n'.format(len(word_pairs), len(line_pairs)))
+
+    for label, pairs, number in (('words', word_pairs, 3), ('lines', line_pairs, 3)):
+        report('legacy loops ({})'.format(label), legacy_distance, pairs, number)
+        report('bit-parallel, pure Python ({})'.format(label),
+               lambda a, b: distance._myers_distance(*sorted((a, b), key=len)), pairs, number)
+        report('bit-parallel, max_distance=2 ({})'.format(label),
+               lambda a, b: distance._myers_distance(*sorted((a, b), key=len), max_distance=2),
+               pairs, number)
+        report('levenshtein_distance() ({})'.format(label), distance.levenshtein_distance,
+               pairs, number)
+        if distance.np is not None:
+            # Batched kernels: each query against a larger candidate list.
+            strings = words if label == 'words' else lines
+            candidates = strings * 20
+            encoded = distance._EncodedStrings(candidates)
+            seconds = timeit.timeit(lambda: [encoded.distances(s) for s in strings], number=number)
+            print('{:<44}{:>10.2f} us'.format('NumPy one-vs-many ({})'.format(label),
+                                              seconds / number / len(strings) / len(candidates) * 1e6))
+            seconds = timeit.timeit(lambda: distance.distance_matrix(strings, candidates), number=number)
+            print('{:<44}{:>10.2f} us'.format('distance_matrix() ({})'.format(label),
+                                              seconds / number / len(strings) / len(candidates) * 1e6))
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,10 +6,9 @@ more information and documentation: http://cltk.org
 import sys
 import os
 import builtins
-from pkg_resources import get_distribution
 
-if sys.version_info[0] != 3:  # pragma: no cover
-    raise ImportError('Python Version 3 or above is required for cltk.')
+if sys.version_info < (3, 7):  # pragma: no cover
+    raise ImportError('Python 3.7 or above is required for cltk.')
 
 __copyright__ = 'Copyright (c) 2016 Kyle P. Johnson. Distributed and Licensed under the MIT License.'  # pylint: disable=line-too-long
 
@@ -19,7 +18,9 @@ __license__ = 'MIT'
 
 __url__ = 'http://cltk.org'
 
-__version__ = get_distribution('cltk').version  # pylint: disable=no-member
+# Subpackages with heavy third-party dependencies (NLTK taggers, gensim,
+# whoosh, scikit-learn); ``cltk.<name>`` imports them on first access only.
+_LAZY_SUBPACKAGES = ('ir', 'stop', 'tag', 'vector')
 
 if 'CLTK_DATA' in os.environ:
     __cltk_data_dir__ = os.path.expanduser(
@@ -49,8 +50,33 @@ def get_cltk_data_dir() -> str:
 
 builtins.get_cltk_data_dir = get_cltk_data_dir
 
+
+def _get_version() -> str:
+    """Look up the installed version without scanning every distribution,
+    as ``pkg_resources`` does."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # pragma: no cover; Python 3.7
+        from pkg_resources import get_distribution
+        return get_distribution('cltk').version  # pylint: disable=no-member
+    try:
+        return version('cltk')
+    except PackageNotFoundError:  # pragma: no cover; running from a source tree
+        return 'unknown'
+
+
+def __getattr__(name: str):
+    """Resolve ``__version__`` and heavy subpackages on first access
+    (PEP 562), keeping ``import cltk`` cheap."""
+    if name == '__version__':
+        globals()['__version__'] = _get_version()
+        return globals()['__version__']
+    if name in _LAZY_SUBPACKAGES:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
 # rm these namespaces from memory, or these show up in dir(cltk)
-del get_distribution
 del builtins
 del os
 del sys
@@ -1,7 +1,12 @@
 """Converts legacy encodings into Unicode."""
 
+from functools import lru_cache
+import re
+
 import regex
 
+from cltk.utils.cltk_logger import logger
+
 __author__ = ['Patrick J. Burns <patrick@diyclassics.org>', 'Kyle P. Johnson <kyle@kyle-p-johnson.com>', ]
 __license__ = 'MIT License. See LICENSE.'
 
@@ -362,6 +367,171 @@ PUNCT = [
 ]
 
 
+# Characters with a special meaning in a regular expression
+REGEX_METACHARACTERS = set('.^$*+?{}[]|()')
+
+
+def _literal(beta_regex):
+    """Return the string a Beta Code pattern matches and whether it is
+    anchored to the end of the text (by a final ``$``), or None if the
+    pattern is not a plain, escaped literal.
+    :param beta_regex: str
+    :rtype: tuple or None
+    """
+    chars = []
+    at_end = False
+    escaped = False
+    for i, char in enumerate(beta_regex):
+        if escaped:
+            if char.isalnum():
+                return None  # a class such as \d
+            chars.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '$' and i == len(beta_regex) - 1:
+            at_end = True
+        elif char in REGEX_METACHARACTERS:
+            return None
+        else:
+            chars.append(char)
+    literal = ''.join(chars)
+    if escaped or not literal or '\n' in literal:
+        return None
+    return literal, at_end
+
+
+def _overlaps(suffix_of, prefix_of):
+    """Whether a proper suffix of one string can be the start of a match of
+    another, i.e. both can match overlapping text (``prefix_of`` starting
+    inside ``suffix_of``).
+    """
+    for offset in range(1, len(suffix_of)):
+        tail = suffix_of[offset:]
+        if tail.startswith(prefix_of) or prefix_of.startswith(tail):
+            return True
+    return False
+
+
+def _crosses(text, pattern):
+    """Whether ``pattern`` can match text that starts or ends inside
+    ``text`` but is not contained in it.
+    """
+    for offset in range(len(text)):
+        tail = text[offset:]
+        if len(tail) < len(pattern) and pattern.startswith(tail):
+            return True
+    return _overlaps(pattern, text)
+
+
+class BetaCodeTransducer(object):  # pylint: disable=R0903
+    """Single-pass equivalent of applying a list of Beta Code substitutions
+    one after the other.
+
+    The substitutions are built into a trie, which is compiled into one
+    regular expression with common prefixes factored out, so the text is
+    scanned once, left to right, taking the longest match at each position.
+    This gives the same result as the sequential substitutions provided that
+    no substitution can match text overlapping that of an earlier one, and
+    that what a substitution writes only interacts with later ones on its
+    own; both are checked here, as well as that every pattern is a literal
+    (optionally ending in ``$``). Otherwise ``ValueError`` is raised.
+    Substitutions which can never apply, because an earlier one always
+    consumes the start of their text, are dropped.
+    """
+
+    def __init__(self, substitutions):
+        """
+        :param substitutions: (pattern, replacement) pairs, in the order in
+            which they would be applied.
+        :type substitutions: list
+        """
+        rules = []
+        for beta_regex, repl in substitutions:
+            literal = _literal(beta_regex)
+            if literal is None:
+                raise ValueError('Not a literal pattern: {0!r}'.format(beta_regex))
+            rules.append(literal + (repl,))
+
+        # What each substitution finally writes, once later ones are applied
+        outputs = []
+        for index, (_, _, repl) in enumerate(rules):
+            for later, later_at_end, later_repl in rules[index + 1:]:
+                if _crosses(repl, later) or (later_at_end and later in repl):
+                    raise ValueError('Replacement {0!r} depends on its context.'.format(repl))
+                repl = repl.replace(later, later_repl)
+            outputs.append(repl)
+
+        live = []
+        for index, (literal, at_end, _) in enumerate(rules):
+            shadowed = any(literal.startswith(earlier) and (not earlier_at_end or (at_end and literal == earlier))
+                           for earlier, earlier_at_end, _ in rules[:index])
+            if shadowed:
+                continue
+            for earlier, _, _ in rules[:index]:
+                if _overlaps(literal, earlier):
+                    raise ValueError('Pattern {0!r} overlaps earlier pattern {1!r}.'.format(literal, earlier))
+            live.append((literal, at_end, outputs[index]))
+
+        self.trie = {}
+        self.outputs = {}
+        for literal, at_end, output in live:
+            node = self.trie
+            for char in literal:
+                node = node.setdefault(char, {})
+            node.setdefault(None, {})[at_end] = output
+            if not at_end:
+                self.outputs[literal] = output
+
+        # Replacements of the patterns anchored to the end, in the order of
+        # the groups they capture. The standard library's engine is the
+        # faster one for this plain syntax.
+        self.end_outputs = []
+        self.pattern = re.compile('(' + self._node_regex(self.trie, True) + ')')
+        self.pattern_not_at_end = re.compile('(' + self._node_regex(self.trie, False) + ')')
+
+    def _node_regex(self, node, at_end):
+        """Regular expression for the subtrie ``node``: its children, longest
+        match first, then a match ending here. With ``at_end``, matches only
+        allowed at the end of the text come before other ones and capture an
+        empty group whose number leads to their replacement.
+        """
+        alternatives = []
+        for char in sorted(key for key in node if key is not None):
+            alternatives.append(re.escape(char) + self._node_regex(node[char], at_end))
+        terminals = node.get(None, {})
+        if at_end and True in terminals:
+            alternatives.append(r'(?=\n?\Z)()')
+            self.end_outputs.append(terminals[True])
+        if False in terminals:
+            alternatives.append('')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    def convert(self, text, at_end=True):
+        """Convert text (already upper-cased).
+        :param at_end: Whether ``text`` ends where the whole text does;
+            patterns anchored to the end of the text only match if so.
+        :rtype: str
+        """
+        pattern = self.pattern if at_end else self.pattern_not_at_end
+        # split() gives the text between matches, then each match followed
+        # by the groups of the patterns anchored to the end, and so on.
+        parts = pattern.split(text)
+        step = pattern.groups + 1
+        outputs = list(map(self.outputs.get, parts[1::step]))
+        if outputs and step > 2:
+            # Only the last match can be at the end.
+            for output, group in zip(self.end_outputs, parts[1 - step:-1]):
+                if group is not None:
+                    outputs[-1] = output
+        pieces = [None] * (2 * len(outputs) + 1)
+        pieces[0::2] = parts[0::step]
+        pieces[1::2] = outputs
+        return ''.join(pieces)
+
+
 class Replacer(object):  # pylint: disable=R0903
     """Replace Beta Code with Unicode."""
     def __init__(self, pattern1=None, pattern2=None, pattern3=None):
@@ -380,12 +550,31 @@ class Replacer(object):  # pylint: disable=R0903
         self.pattern3 = \
             [(regex.compile(beta_regex, flags=regex.VERSION1), repl)
              for (beta_regex, repl) in pattern3]
+        # Tables the transducer cannot reproduce exactly (e.g. with patterns
+        # other than literals) are applied one pattern at a time.
+        try:
+            self.transducer = _transducer(*(tuple(map(tuple, patterns))
+                                            for patterns in (pattern1, pattern2, pattern3)))
+        except ValueError as exc:
+            logger.info('Converting Beta Code pattern by pattern: %s', exc)
+            self.transducer = None
+
+    @staticmethod
+    def _prepare(text):
+        """Upper-case and drop hyphens, before any substitution."""
+        return text.upper().replace('-', '')
 
     def beta_code(self, text):
+        """Replace Beta Code with Unicode, in a single pass over the text."""
+        text = self._prepare(text)
+        if self.transducer is None:
+            return self._beta_code_sequential(text)
+        return self.transducer.convert(text)
+
+    def _beta_code_sequential(self, text):
         """Replace method. Note: regex.subn() returns a tuple (new_string,
         number_of_subs_made).
         """
-        text = text.upper().replace('-', '')
         for (pattern, repl) in self.pattern1:
             text = pattern.subn(repl, text)[0]
         for (pattern, repl) in self.pattern2:
@@ -394,3 +583,39 @@ class Replacer(object):  # pylint: disable=R0903
         for (pattern, repl) in self.pattern3:
             text = pattern.subn(repl, text)[0]
         return text
+
+    def beta_code_lines(self, lines):
+        """Convert an iterable of lines, such as an open file, one line at a
+        time, yielding converted lines. ``''.join()`` of the output equals
+        ``beta_code()`` of the joined lines.
+        :param lines: iterable of str, each ending with its line break
+        :rtype: generator
+        """
+        if self.transducer is None:
+            yield self.beta_code(''.join(lines))
+            return
+        previous = None
+        for line in lines:
+            line = self._prepare(line)
+            if not line:
+                continue
+            if previous is not None:
+                yield self.transducer.convert(previous, at_end=False)
+            previous = line
+        if previous is not None:
+            yield self.transducer.convert(previous)
+
+    def beta_code_file(self, input_path, output_path):
+        """Convert a Beta Code file to a Unicode one, line by line.
+        :param input_path: str
+        :param output_path: str
+        """
+        with open(input_path, encoding='utf-8') as file_in, \
+                open(output_path, 'w', encoding='utf-8') as file_out:
+            file_out.writelines(self.beta_code_lines(file_in))
+
+
+@lru_cache(maxsize=None)
+def _transducer(pattern1, pattern2, pattern3):
+    """Build (once per set of tables) the transducer for ``Replacer``."""
+    return BetaCodeTransducer(pattern1 + pattern2 + pattern3)
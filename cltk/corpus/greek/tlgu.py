@@ -10,9 +10,16 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>', 'Stephen Margheim <st
 __license__ = 'MIT License. See LICENSE.'
 
 from cltk.utils.cltk_logger import logger
+from cltk.utils.file_operations import md5
 from cltk.corpus.utils.importer import CorpusImporter
+from multiprocessing.pool import ThreadPool
+import json
 import os
 import subprocess
+import tempfile
+import time
+
+MANIFEST_NAME = '.tlgu_manifest.json'
 
 
 # this currently not in use
@@ -36,6 +43,140 @@ ARGS = {
 }
 
 
+def _tlgu_options(markup=None, break_lines=False, divide_works=False, latin=False,
+                  extra_args=None):
+    """Assemble the tlgu flags, without dashes, for the options of
+    ``TLGU.convert()``. They are sorted so that equal options always give the
+    same command line (and the same manifest entry).
+    """
+    tlgu_options = []
+    if markup == 'full':
+        tlgu_options += ['v', 'w', 'x', 'y', 'z']
+    if break_lines:
+        tlgu_options.append('N')
+    if divide_works:
+        tlgu_options.append('W')
+    if latin:
+        tlgu_options.append('r')
+    if extra_args is not None:
+        try:
+            tlgu_options += list(extra_args)
+        except Exception as exc:
+            logger.error("Argument 'extra_args' must be a list: %s.", exc)
+            raise
+    return sorted(set(tlgu_options))
+
+
+def _run_tlgu(input_path, output_path, tlgu_options):
+    """Run tlgu with its output going to a scratch directory beside
+    ``output_path``, then move the file(s) written into place, so that a
+    failed or interrupted conversion never leaves a partial file behind.
+    With the ``W`` option tlgu writes one ``<output_path>-xxx.txt`` file per
+    work instead of ``output_path``.
+    :param input_path: TLG or PHI file to convert.
+    :param output_path: Converted file to write.
+    :param tlgu_options: tlgu flags, without dashes.
+    :rtype: tuple of tlgu's exit status and the names of the files written
+    """
+    output_dir, output_name = os.path.split(output_path)
+    with tempfile.TemporaryDirectory(prefix='.tlgu-', dir=output_dir or os.curdir) as tmp_dir:
+        tlgu_call = ['tlgu'] + ['-' + option for option in tlgu_options]
+        tlgu_call += [input_path, os.path.join(tmp_dir, output_name)]
+        logger.info(' '.join(tlgu_call))
+        p_out = subprocess.call(tlgu_call)
+        if p_out != 0:
+            return p_out, []
+        outputs = sorted(os.listdir(tmp_dir))
+        for name in outputs:
+            os.replace(os.path.join(tmp_dir, name), os.path.join(output_dir, name))
+    return p_out, outputs
+
+
+def _convert_job(job):
+    """Convert one file; run in the worker threads of ``_convert_files()``.
+    :param job: Tuple of input path, output path and tlgu flags.
+    :rtype: tuple of input path, error message (None on success), names of
+        the files written and seconds taken
+    """
+    input_path, output_path, tlgu_options = job
+    start = time.time()
+    try:
+        p_out, outputs = _run_tlgu(input_path, output_path, tlgu_options)
+        error = None if p_out == 0 else 'tlgu exited with status {0}'.format(p_out)
+    except Exception as exc:  # pylint: disable=broad-except
+        outputs, error = [], str(exc)
+    return input_path, error, outputs, time.time() - start
+
+
+def _convert_files(jobs, manifest_path, processes=1, force=False):
+    """Convert files with tlgu, skipping those converted before.
+
+    The manifest at ``manifest_path`` records, for every file converted, the
+    md5 checksum of the source, the tlgu flags used and the files written. A
+    file is converted again only if one of these changed, or an output has
+    gone missing. The manifest is saved after each file, so an interrupted
+    run resumes where it stopped.
+
+    Conversions run in a pool of ``processes`` threads (one per CPU if None);
+    each only waits on its own tlgu process.
+
+    :param jobs: Tuples of input path, output path and tlgu flags.
+    :param manifest_path: JSON file in which to keep track of conversions.
+    :param processes: Number of conversions to run at once.
+    :param force: Convert all files, whatever the manifest says.
+    :return: dict with 'converted' (input path to seconds taken), 'skipped'
+        and 'failed' (lists of input paths)
+    :rtype: dict
+    """
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as file_open:
+            manifest = json.load(file_open)
+    else:
+        manifest = {}
+
+    results = {'converted': {}, 'skipped': [], 'failed': []}
+    with ThreadPool(processes) as pool:
+        checksums = pool.map(md5, [input_path for input_path, _, _ in jobs])
+        todo, entries = [], {}
+        for (input_path, output_path, tlgu_options), checksum in zip(jobs, checksums):
+            entry = {'md5': checksum, 'options': tlgu_options}
+            previous = manifest.get(input_path, {})
+            output_dir = os.path.dirname(output_path)
+            if not force \
+                    and all(previous.get(key) == value for key, value in entry.items()) \
+                    and all(os.path.isfile(os.path.join(output_dir, name))
+                            for name in previous['outputs']):
+                results['skipped'].append(input_path)
+            else:
+                todo.append((input_path, output_path, tlgu_options))
+                entries[input_path] = entry
+        logger.info('Converting %s of %s files; %s unchanged since last conversion.',
+                    len(todo), len(jobs), len(results['skipped']))
+
+        for count, (input_path, error, outputs, seconds) in \
+                enumerate(pool.imap_unordered(_convert_job, todo), 1):
+            if error:
+                logger.error('[%s/%s] Failed to convert %s: %s',
+                             count, len(todo), input_path, error)
+                results['failed'].append(input_path)
+                manifest.pop(input_path, None)
+            else:
+                logger.info('[%s/%s] Converted %s in %.2fs.',
+                            count, len(todo), input_path, seconds)
+                results['converted'][input_path] = seconds
+                manifest[input_path] = dict(entries[input_path], outputs=outputs)
+            _dump_manifest(manifest, manifest_path)
+    return results
+
+
+def _dump_manifest(manifest, path):
+    """Write the manifest without leaving a partial file behind."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as file_open:
+        json.dump(manifest, file_open, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
 class TLGU(object):
     """Check, install, and call TLGU."""
     def __init__(self, testing=False):
@@ -129,41 +270,12 @@ class TLGU(object):
         # check input path exists
         assert os.path.isfile(input_path), 'File {0} does not exist.'.format(input_path)
 
-        # setup tlgu flags
-        tlgu_options = []
-        if markup == 'full':
-            full_args = ['v', 'w', 'x', 'y', 'z']
-            [tlgu_options.append(x) for x in full_args]  # pylint: disable=W0106
-        if break_lines:
-            tlgu_options.append('N')
-        if divide_works:
-            tlgu_options.append('W')
-        if latin:
-            tlgu_options.append('r')
-        # setup extra args
-        if extra_args is None:
-            extra_args = []
-        else:
-            try:
-                extra_args = list(extra_args)
-            except Exception as exc:
-                logger.error("Argument 'extra_args' must be a list: %s.", exc)
-                raise
-        tlgu_options = tlgu_options + extra_args
-        # assemble all tlgu flags
-        tlgu_options = list(set(tlgu_options))
-        if tlgu_options:
-            tlgu_flags = '-' + ' -'.join(tlgu_options)
-        else:
-            tlgu_flags = ''
-        # make tlgu call
-        tlgu_call = 'tlgu {0} {1} {2}'.format(tlgu_flags,
-                                              input_path,
-                                              output_path)
-        logger.info(tlgu_call)
+        tlgu_options = _tlgu_options(markup=markup, break_lines=break_lines,
+                                     divide_works=divide_works, latin=latin,
+                                     extra_args=extra_args)
         try:
-            p_out = subprocess.call(tlgu_call, shell=True)
-            if p_out == 1:
+            p_out, _ = _run_tlgu(input_path, output_path, tlgu_options)
+            if p_out != 0:
                 logger.error('Failed to convert %s to %s.',
                              input_path,
                              output_path)
@@ -174,9 +286,21 @@ class TLGU(object):
                          exc)
             raise
 
-    def convert_corpus(self, corpus, markup=None, break_lines=False, divide_works=False, latin=None, extra_args=None):  # pylint: disable=W0613
+    def convert_corpus(self, corpus, markup=None, break_lines=False, divide_works=False, latin=None, extra_args=None,  # pylint: disable=W0613
+                       processes=1, force=False):
         """Look for imported TLG or PHI files and convert them all to
         ``~/cltk_data/greek/text/tlg/<plaintext>``.
+
+        Files unchanged since a previous conversion (by md5 checksum, as kept
+        in a ``.tlgu_manifest.json`` in the target directory) are skipped
+        unless ``force`` is set. Progress and the time taken by each file are
+        logged.
+
+        :param processes: Number of files to convert at once; None for one
+            per CPU.
+        :param force: Convert all files again.
+        :return: dict with 'converted' (file path to seconds taken),
+            'skipped' and 'failed' (lists of file paths)
         TODO: Should this and/or convert() be static?
         TODO: Add markup options to input.
         TODO: Do something with break_lines, divide_works, and extra_args or rm them
@@ -204,27 +328,29 @@ class TLGU(object):
             logger.error("Failed to find TLG files: %s", exception)
             raise
         # make a list of files to be converted
-        txts = []
-        [txts.append(x) for x in corpus_files if x.endswith('TXT')]  # pylint: disable=W0106
-        # loop through list and convert one at a time
-        for txt in txts:
-            orig_txt_path = os.path.join(orig_path, txt)
-            if markup is None:
-                target_txt_dir = os.path.join(target_path, 'plaintext')
-            else:
-                target_txt_dir = os.path.join(target_path, str(markup))
-            if not os.path.isdir(target_txt_dir):
-                os.makedirs(target_txt_dir)
-            target_txt_path = os.path.join(target_txt_dir, txt)
-            try:
-                self.convert(orig_txt_path, target_txt_path, markup=None,
-                             break_lines=False, divide_works=False, latin=latin,
-                             extra_args=None)
-            except Exception as exception:
-                logger.error("Failed to convert file '%s' to '%s': %s", orig_txt_path, target_txt_path, exception)
+        txts = [x for x in corpus_files if x.endswith('TXT')]
+        if markup is None:
+            target_txt_dir = os.path.join(target_path, 'plaintext')
+        else:
+            target_txt_dir = os.path.join(target_path, str(markup))
+        if not os.path.isdir(target_txt_dir):
+            os.makedirs(target_txt_dir)
+        tlgu_options = _tlgu_options(latin=latin)
+        jobs = [(os.path.join(orig_path, txt), os.path.join(target_txt_dir, txt), tlgu_options)
+                for txt in sorted(txts)]
+        return _convert_files(jobs, os.path.join(target_txt_dir, MANIFEST_NAME),
+                              processes=processes, force=force)
 
-    def divide_works(self, corpus):
+    def divide_works(self, corpus, processes=1, force=False):
         """Use the work-breaking option.
+
+        As with ``convert_corpus()``, files are converted ``processes`` at a
+        time and those unchanged since the previous run are skipped.
+
+        :param processes: Number of files to convert at once; None for one
+            per CPU.
+        :param force: Convert all files again.
+        :rtype: dict
         TODO: Maybe incorporate this into ``convert_corpus()``
         TODO: Write test for this
         """
@@ -247,12 +373,9 @@ class TLGU(object):
         files = os.listdir(orig_dir)
         texts = [x for x in files if x.endswith('.TXT') and x.startswith(file_prefix)]
 
-        for file in texts:
-            orig_file_path = os.path.join(orig_dir, file)
-            new_file_path = os.path.join(works_dir, file)
-
-            try:
-                self.convert(orig_file_path, new_file_path, divide_works=True, latin=latin)
-                logger.info('Writing files at %s to %s.', orig_file_path, works_dir)
-            except Exception as err:
-                logger.error('Failed to convert files: %s.', err)
+        tlgu_options = _tlgu_options(divide_works=True, latin=latin)
+        jobs = [(os.path.join(orig_dir, file), os.path.join(works_dir, file), tlgu_options)
+                for file in sorted(texts)]
+        logger.info('Writing files at %s to %s.', orig_dir, works_dir)
+        return _convert_files(jobs, os.path.join(works_dir, MANIFEST_NAME),
+                              processes=processes, force=force)
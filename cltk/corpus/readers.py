@@ -1,12 +1,23 @@
 """`reader.py` - Corpus reader utility objects."""
 import json
+import mmap
 import os
+import pickle
 import re
 import codecs
+import fcntl
+import sys
 import time
+import uuid
 
 import logging
-from typing import List, Dict, Tuple, Set, Any, Generator
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
+from json.decoder import scanstring
+from multiprocessing import Pool
+from typing import List, Dict, Tuple, Set, Any, Generator, Iterator
 
 from nltk.corpus.reader.api import CorpusReader
 from nltk.corpus.reader import PlaintextCorpusReader
@@ -21,6 +32,27 @@ from cltk.tokenize.word import WordTokenizer
 LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
 
+# Token cache of FilteredPlaintextCorpusReader: a manifest holding the vocabulary
+# and the version of each file cached, and the token ids of each file. Each file
+# starts with the id of the vocabulary its ids index and the size it had then.
+TOKEN_CACHE_VERSION = 2
+TOKEN_CACHE_MANIFEST = 'manifest.pickle'
+TOKEN_CACHE_LOCK = 'manifest.lock'
+TOKEN_CACHE_SUFFIX = '.tokens'
+TOKEN_CACHE_HEADER = 5
+
+# Parsed text nodes of JsonfileCorpusReader files kept in memory, in characters.
+JSON_CACHE_CHARS = 2 ** 25
+
+# Documents JsonfileCorpusReader hands to its worker processes at a time.
+JSON_WINDOW = 16
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_DECODER = json.JSONDecoder()
+
+# Tokenizers of the worker processes of a corpus reader.
+_WORKER_TOKENIZERS = None
+
 # TODO add your corpus here:
 SUPPORTED_CORPORA = {
     'latin': ['latin_text_latin_library',
@@ -33,11 +65,16 @@ SUPPORTED_CORPORA = {
 }  # type: Dict[str, List[str]]
 
 
-def get_corpus_reader(corpus_name: str = None, language: str = None) -> CorpusReader:
+def get_corpus_reader(corpus_name: str = None, language: str = None, cache_dir: str = None,
+                      processes: int = 1) -> CorpusReader:
     """
     Corpus reader factory method
     :param corpus_name: the name of the supported corpus, available as: [package].SUPPORTED_CORPORA
     :param langugage: the language for search in
+    :param cache_dir: directory to cache the tokens of plaintext corpora in; see
+    FilteredPlaintextCorpusReader
+    :param processes: number of processes to tokenize plaintext files not yet cached, or
+    Perseus JSON documents, with
     :return: NLTK compatible corpus reader
     """
     BASE = get_cltk_data_dir() + '/{}/text'.format(language)
@@ -58,12 +95,14 @@ def get_corpus_reader(corpus_name: str = None, language: str = None) -> CorpusRe
             return FilteredPlaintextCorpusReader(root=root, fileids=doc_pattern,
                                                  sent_tokenizer=sentence_tokenizer,
                                                  word_tokenizer=the_word_tokenizer,
-                                                 skip_keywords=skip_keywords)
+                                                 skip_keywords=skip_keywords,
+                                                 cache_dir=cache_dir, processes=processes)
         if corpus_name == 'latin_text_perseus':
             valid_json_root = os.path.join(root, 'cltk_json')  #: we only support this subsection
             return JsonfileCorpusReader(root=valid_json_root,
                                         sent_tokenizer=sentence_tokenizer,
                                         word_tokenizer=the_word_tokenizer,
+                                        processes=processes,
                                         target_language='latin')  # perseus also contains English
 
         if corpus_name == 'latin_text_tesserae':
@@ -78,6 +117,7 @@ def get_corpus_reader(corpus_name: str = None, language: str = None) -> CorpusRe
             return JsonfileCorpusReader(root=valid_json_root,
                                         sent_tokenizer=sentence_tokenizer,
                                         word_tokenizer=the_word_tokenizer,
+                                        processes=processes,
                                         target_language='grc')  #: this abbreviation is required
 
         if corpus_name == 'greek_text_tesserae':
@@ -133,21 +173,82 @@ def assemble_corpus(corpus_reader: CorpusReader,
         LOG.exception('failure in corpus building')
 
 
+def _tokenizer_name(tokenizer) -> str:
+    """Name a tokenizer, to tell whether a token cache was made with it."""
+    kind = getattr(tokenizer, '__qualname__', type(tokenizer).__qualname__)
+    return '{0}.{1}({2})'.format(type(tokenizer).__module__, kind,
+                                 getattr(tokenizer, 'language', ''))
+
+
+def _read_paras(root, fileid: str, encoding: str, tokenizers: Tuple) -> List[List[List[str]]]:
+    """Tokenize the paragraphs of a file as ``PlaintextCorpusReader.paras()`` does.
+
+    :param tokenizers: sentence tokenizer, word tokenizer and paragraph block reader
+    """
+    sent_tokenizer, word_tokenizer, para_block_reader = tokenizers
+    reader = PlaintextCorpusReader(root, [fileid], word_tokenizer=word_tokenizer,
+                                   sent_tokenizer=sent_tokenizer,
+                                   para_block_reader=para_block_reader, encoding=encoding)
+    return list(reader.paras())
+
+
+def _init_worker(tokenizers: Tuple):
+    """Keep the tokenizers of a worker process."""
+    global _WORKER_TOKENIZERS  # pylint: disable=global-statement
+    _WORKER_TOKENIZERS = tokenizers
+
+
+def _read_paras_in_worker(job: Tuple) -> List[List[List[str]]]:
+    """Tokenize one file; run in worker processes filling a token cache."""
+    return _read_paras(*job, _WORKER_TOKENIZERS)
+
+
+def _encode_paras(paras: List[List[List[str]]], vocabulary: List[str],
+                  token_ids: Dict[str, int]) -> array:
+    """
+    Encode the paragraphs of a file as token ids, adding new tokens to the vocabulary:
+    the number of paragraphs, then for each its number of sentences, and for each
+    sentence its number of tokens followed by their ids. The header is left for the
+    caller to fill in.
+    """
+    encoded = array('I', [0] * TOKEN_CACHE_HEADER + [len(paras)])
+    for para in paras:
+        encoded.append(len(para))
+        for sent in para:
+            encoded.append(len(sent))
+            for token in sent:
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = token_ids[token] = len(vocabulary)
+                    vocabulary.append(token)
+                encoded.append(token_id)
+    return encoded
+
+
 class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
     """
     A corpus reader for plain text documents with simple filtration for streamlined pipeline use.
     A list keywords may be provided, and if any of these keywords are found in a document's
     paragraph, that whole paragraph will be skipped, same for sentences and words.
+
+    Given a ``cache_dir``, the first pass over a file tokenizes it and stores its paragraphs
+    there as token ids; later passes, such as further Word2Vec epochs, read them back through
+    a memory map instead of tokenizing again. A file is tokenized again when it changes on disk.
+    Readers in several processes may share a ``cache_dir``: they take turns writing to it, and
+    a file whose ids do not belong to the vocabulary read with the manifest is not used.
     """
 
     def __init__(self, root, fileids=None, encoding='utf8', skip_keywords=None,
-                 **kwargs):
+                 cache_dir=None, processes=1, **kwargs):
         """
         :param root: The file root of the corpus directory
         :param fileids: the list of file ids to consider, or wildcard expression
         :param skip_keywords: a list of words which indicate whole paragraphs that should
         be skipped by the paras and words methods()
         :param encoding: utf8
+        :param cache_dir: directory to keep the tokens of the files in; None not to cache them
+        :param processes: number of processes to tokenize files not yet cached with; None for
+        one per CPU
         :param kwargs: Any values to be passed to NLTK super classes, such as sent_tokenizer,
         word_tokenizer.
         """
@@ -162,6 +263,11 @@ class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
         if 'word_tokenizer' in kwargs:
             self._word_tokenizer = kwargs['word_tokenizer']
         self.skip_keywords = skip_keywords
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.processes = processes
+        self._manifest = None
+        self._vocabulary_ids = None  # type: Dict[str, int]
+        self._file_tokens = {}  # type: Dict[str, memoryview]
 
     def words(self, fileids=None) -> Generator[str, str, None]:
         """
@@ -172,14 +278,17 @@ class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
         """
         if not fileids:
             fileids = self.fileids()
+        if self.cache_dir:
+            vocabulary = self._cache_vocabulary(fileids)
+            for para in self._cached_paras(fileids, self._skip_ids()):
+                for sent in para:
+                    for token_id in sent:
+                        yield vocabulary[token_id]
+            return
+        skip = set(self.skip_keywords or ())
         for para in self.paras(fileids):
             flat_para = flatten(para)
-            skip = False
-            if self.skip_keywords:
-                for keyword in self.skip_keywords:
-                    if keyword in flat_para:
-                        skip = True
-            if not skip:
+            if skip.isdisjoint(flat_para):
                 for word in flat_para:
                     yield word
 
@@ -191,14 +300,14 @@ class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
         """
         if not fileids:
             fileids = self.fileids()
+        if self.cache_dir:
+            vocabulary = self._cache_vocabulary(fileids)
+            for para in self._cached_paras(fileids, self._skip_ids()):
+                yield [[vocabulary[token_id] for token_id in sent] for sent in para]
+            return
+        skip = set(self.skip_keywords or ())
         for para in super().paras(fileids):
-            flat_para = flatten(para)
-            skip = False
-            if self.skip_keywords:
-                for keyword in self.skip_keywords:
-                    if keyword in flat_para:
-                        skip = True
-            if not skip:
+            if skip.isdisjoint(flatten(para)):
                 yield para
 
     def sents(self, fileids=None) -> Generator[str, str, None]:
@@ -209,15 +318,166 @@ class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
         """
         if not fileids:
             fileids = self.fileids()
+        if self.cache_dir:
+            vocabulary = self._cache_vocabulary(fileids)
+            skip = self._skip_ids()
+            for para in self._cached_paras(fileids):
+                for sent in para:
+                    if skip.isdisjoint(sent):
+                        yield [vocabulary[token_id] for token_id in sent]
+            return
+        skip = set(self.skip_keywords or ())
         for sent in super().sents(fileids):
-            skip = False
-            if self.skip_keywords:
-                for keyword in self.skip_keywords:
-                    if keyword in sent:
-                        skip = True
-            if not skip:
+            if skip.isdisjoint(sent):
                 yield sent
 
+    def _cache_vocabulary(self, fileids) -> List[str]:
+        """Cache the tokens of any of the files not cached yet, map those of all of them,
+        and return the vocabulary their ids index."""
+        if isinstance(fileids, str):
+            fileids = [fileids]
+        stamps = {}
+        for fileid in fileids:
+            stat = os.stat(self.abspath(fileid))
+            stamps[fileid] = (stat.st_mtime, stat.st_size)
+        if not self._stale_files(stamps):
+            return self._manifest['vocabulary']
+
+        with self._lock_cache():
+            # Another reader may have written to the cache since the manifest was read.
+            self._manifest = None
+            self._vocabulary_ids = None
+            self._file_tokens = {}
+            manifest = self._load_manifest()
+            stale = self._stale_files(stamps)
+            if stale:
+                tokenizers = (self._sent_tokenizer, self._word_tokenizer, self._para_block_reader)
+                jobs = [(self._root, fileid, self.encoding(fileid)) for fileid in stale]
+                if self.processes == 1:
+                    results = (_read_paras(*job, tokenizers) for job in jobs)
+                    self._write_cache(manifest, stale, stamps, results)
+                else:
+                    with Pool(self.processes, initializer=_init_worker,
+                              initargs=(tokenizers,)) as pool:
+                        self._write_cache(manifest, stale, stamps,
+                                          pool.imap(_read_paras_in_worker, jobs))
+                for fileid in stale:
+                    self._map_tokens(fileid)
+        return manifest['vocabulary']
+
+    def _stale_files(self, stamps: Dict[str, Tuple]) -> List[str]:
+        """Return the files to tokenize again: those changed since they were cached, or
+        whose cached ids do not belong to the vocabulary of the manifest."""
+        manifest = self._load_manifest()
+        return [fileid for fileid in stamps if manifest['files'].get(fileid) != stamps[fileid]
+                or not self._map_tokens(fileid)]
+
+    @contextmanager
+    def _lock_cache(self):
+        """Hold an exclusive lock on the cache directory."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, TOKEN_CACHE_LOCK), 'wb') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_cache(self, manifest, fileids, stamps, results):
+        """Write the token ids of files, then the manifest; called with the cache locked."""
+        if self._vocabulary_ids is None:
+            self._vocabulary_ids = {token: token_id
+                                    for token_id, token in enumerate(manifest['vocabulary'])}
+        for fileid, paras in zip(fileids, results):
+            path = self._cache_path(fileid)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            encoded = _encode_paras(paras, manifest['vocabulary'], self._vocabulary_ids)
+            header = array('I')
+            header.frombytes(manifest['vocabulary_id'])
+            header.append(len(manifest['vocabulary']))
+            encoded[:TOKEN_CACHE_HEADER] = header
+            with open(path + '.tmp', 'wb') as file_open:
+                encoded.tofile(file_open)
+            os.replace(path + '.tmp', path)
+            manifest['files'][fileid] = stamps[fileid]
+        path = os.path.join(self.cache_dir, TOKEN_CACHE_MANIFEST)
+        with open(path + '.tmp', 'wb') as file_open:
+            pickle.dump(manifest, file_open)
+        os.replace(path + '.tmp', path)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Return the manifest of the cache, read on first use; a cache made by another
+        version, machine or pair of tokenizers is started again under a new vocabulary id."""
+        if self._manifest is not None:
+            return self._manifest
+        tokenizers = [_tokenizer_name(self._sent_tokenizer), _tokenizer_name(self._word_tokenizer)]
+        manifest = None
+        try:
+            with open(os.path.join(self.cache_dir, TOKEN_CACHE_MANIFEST), 'rb') as file_open:
+                manifest = pickle.load(file_open)
+        except FileNotFoundError:
+            pass
+        if (manifest is None or manifest['version'] != TOKEN_CACHE_VERSION
+                or manifest['byteorder'] != sys.byteorder or manifest['tokenizers'] != tokenizers):
+            manifest = {'version': TOKEN_CACHE_VERSION,
+                        'byteorder': sys.byteorder,
+                        'tokenizers': tokenizers,
+                        'vocabulary_id': uuid.uuid4().bytes,
+                        'vocabulary': [],
+                        'files': {}}
+        self._manifest = manifest
+        return manifest
+
+    def _map_tokens(self, fileid: str) -> bool:
+        """Map the cached ids of a file, unless they index another vocabulary than that of
+        the manifest, or a later version of it; return whether they were mapped."""
+        tokens = self._file_tokens.get(fileid)
+        if tokens is None:
+            try:
+                with open(self._cache_path(fileid), 'rb') as file_open:
+                    mapped = mmap.mmap(file_open.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):  # ValueError: an empty file
+                return False
+            tokens = memoryview(mapped).cast('I')
+        if (len(tokens) <= TOKEN_CACHE_HEADER
+                or tokens[:TOKEN_CACHE_HEADER - 1].tobytes() != self._manifest['vocabulary_id']
+                or tokens[TOKEN_CACHE_HEADER - 1] > len(self._manifest['vocabulary'])):
+            return False
+        self._file_tokens[fileid] = tokens
+        return True
+
+    def _cache_path(self, fileid: str) -> str:
+        return os.path.join(self.cache_dir, fileid + TOKEN_CACHE_SUFFIX)
+
+    def _skip_ids(self) -> Set[int]:
+        """Return the ids of the skip keywords found in the vocabulary."""
+        if not self.skip_keywords:
+            return set()
+        if self._vocabulary_ids is None:
+            self._vocabulary_ids = {token: token_id
+                                    for token_id, token in enumerate(self._manifest['vocabulary'])}
+        return {self._vocabulary_ids[keyword] for keyword in self.skip_keywords
+                if keyword in self._vocabulary_ids}
+
+    def _cached_paras(self, fileids, skip_ids: Set[int] = frozenset()) -> Iterator[List[memoryview]]:
+        """Yield the paragraphs of cached files as lists of sentences of token ids, leaving
+        out those with any of ``skip_ids``."""
+        if isinstance(fileids, str):
+            fileids = [fileids]
+        # The files mapped along with the vocabulary, even if another pass maps them again.
+        for tokens in [self._file_tokens[fileid] for fileid in fileids]:
+            position = TOKEN_CACHE_HEADER + 1
+            for _ in range(tokens[TOKEN_CACHE_HEADER]):
+                para = []
+                sents = tokens[position]
+                position += 1
+                for _ in range(sents):
+                    start = position + 1
+                    position = start + tokens[position]
+                    para.append(tokens[start:position])
+                if not skip_ids or skip_ids.isdisjoint(chain.from_iterable(para)):
+                    yield para
+
     def docs(self, fileids=None) -> Generator[str, str, None]:
         """
         Returns the complete text of an Text document, closing the document
@@ -258,6 +518,70 @@ class FilteredPlaintextCorpusReader(PlaintextCorpusReader, CorpusReader):
             yield sent
 
 
+def _sorted_text_nodes(my_dict: Dict[str, Any]) -> List[str]:
+    """Collect the values of nested dictionaries, traversing their keys in sorted order."""
+    vals = []  # type: List[str]
+    for mkey in sorted(my_dict):
+        if isinstance(my_dict[mkey], dict):
+            vals += _sorted_text_nodes(my_dict[mkey])
+        else:
+            vals.append(my_dict[mkey])
+    return vals
+
+
+def _json_skip(text: str, index: int) -> int:
+    """Return the index of the first character from ``index`` on that is not whitespace."""
+    return _JSON_WHITESPACE.match(text, index).end()
+
+
+def _stream_values(text: str, index: int, key: str = None) -> Generator[Any, None, int]:
+    """
+    Yield the values nested in the JSON value at ``index`` as they are parsed, in the order of
+    the file, and return the index past it. With ``key``, only the member of that name of the
+    object at ``index`` is descended into; the other members are skipped over.
+    """
+    if not text.startswith('{', index):
+        value, index = _JSON_DECODER.raw_decode(text, index)
+        yield value
+        return index
+    index = _json_skip(text, index + 1)
+    while not text.startswith('}', index):
+        if not text.startswith('"', index):
+            raise json.JSONDecodeError('Expecting property name enclosed in double quotes',
+                                       text, index)
+        name, index = scanstring(text, index + 1)
+        index = _json_skip(text, index)
+        if not text.startswith(':', index):
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, index)
+        index = _json_skip(text, index + 1)
+        if key is not None and name != key:
+            index = _JSON_DECODER.raw_decode(text, index)[1]
+        elif text.startswith('"', index):
+            value, index = scanstring(text, index + 1)
+            yield value
+        else:
+            index = yield from _stream_values(text, index)
+        index = _json_skip(text, index)
+        if text.startswith(',', index):
+            index = _json_skip(text, index + 1)
+        elif not text.startswith('}', index):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+    return index + 1
+
+
+def _json_doc_sents(paras: List[str]) -> List[str]:
+    """Tokenize the paragraphs of a document into sentences; run in worker processes."""
+    sent_tokenizer = _WORKER_TOKENIZERS[0]
+    return [sentence for para in paras for sentence in sent_tokenizer.tokenize(para)]
+
+
+def _json_doc_words(paras: List[str]) -> List[str]:
+    """Tokenize the paragraphs of a document into words; run in worker processes."""
+    word_tokenizer = _WORKER_TOKENIZERS[1]
+    return [word for sentence in _json_doc_sents(paras)
+            for word in word_tokenizer.tokenize(sentence)]
+
+
 class JsonfileCorpusReader(CorpusReader):
     """
     A corpus reader for Json documents where contents are stored in a dictionary.
@@ -271,10 +595,14 @@ class JsonfileCorpusReader(CorpusReader):
     Or with one level of subsections:
     doc['text']['1']['1'] = "some text"
     doc['text']['1']['2'] = "more text"
+
+    The text sections of a document are kept in memory once parsed, so that reading its
+    paragraphs, sentences and words again does not parse it again until it changes on disk.
     """
 
     def __init__(self, root, fileids=None, encoding='utf8', skip_keywords=None,
-                 target_language=None, paragraph_separator='\n\n', **kwargs):
+                 target_language=None, paragraph_separator='\n\n', streaming=False,
+                 cache_chars=JSON_CACHE_CHARS, processes=1, **kwargs):
         """
         :param root: The file root of the corpus directory
         :param fileids: the list of file ids to consider, or wildcard expression
@@ -284,6 +612,12 @@ class JsonfileCorpusReader(CorpusReader):
          translations, we expect these files to be named ...english.json -- if not, pass in fileids
         :param paragraph_separator: character sequence demarcating paragraph separation
         :param encoding: utf8
+        :param streaming: yield the text sections of a document as they are parsed, in the order
+        of the file, instead of in the sorted order of their keys once it is parsed; the first
+        sections of a large document come sooner, but parsing all of it is slower
+        :param cache_chars: characters of parsed text sections to keep in memory; a document is
+        parsed again once it changes on disk or is evicted. 0 not to keep any
+        :param processes: number of processes to tokenize documents with; None for one per CPU
         :param kwargs: Any values to be passed to NLTK super classes, such as sent_tokenizer,
         word_tokenizer.
         """
@@ -301,6 +635,11 @@ class JsonfileCorpusReader(CorpusReader):
             self._word_tokenizer = kwargs['word_tokenizer']
         self.skip_keywords = skip_keywords
         self.paragraph_separator = paragraph_separator
+        self.streaming = streaming
+        self.cache_chars = cache_chars
+        self.processes = processes
+        self._parsed = OrderedDict()  # type: OrderedDict
+        self._parsed_chars = 0
 
     def words(self, fileids=None) -> Generator[str, str, None]:
         """
@@ -309,6 +648,10 @@ class JsonfileCorpusReader(CorpusReader):
         :param fileids:
         :return: words, including punctuation, one by one
         """
+        if self.processes != 1:
+            for words in self._map_docs(_json_doc_words, fileids):
+                yield from words
+            return
         for sentence in self.sents(fileids):
             words = self._word_tokenizer.tokenize(sentence)
             for word in words:
@@ -319,6 +662,10 @@ class JsonfileCorpusReader(CorpusReader):
         :param fileids:
         :return: A generator of sentences
         """
+        if self.processes != 1:
+            for sentences in self._map_docs(_json_doc_sents, fileids):
+                yield from sentences
+            return
         for para in self.paras(fileids):
             sentences = self._sent_tokenizer.tokenize(para)
             for sentence in sentences:
@@ -331,31 +678,66 @@ class JsonfileCorpusReader(CorpusReader):
         and section subkey
         :return: a generator of paragraphs
         """
-
-        def _recurse_to_strings(my_dict: Dict[str, Any]) -> List[str]:
-            """Internal accumulator method."""
-            vals = []  # type: List[str]
-            m_keys = sorted(list(my_dict.keys()))
-            for mkey in m_keys:
-                if isinstance(my_dict[mkey], dict):
-                    vals += _recurse_to_strings(my_dict[mkey])
-                else:
-                    vals += [my_dict[mkey]]
-            return vals
-
-        for doc in self.docs(fileids):
-            text_data = _recurse_to_strings(doc['text'])  # type: List[str]
-            text_sections = []  # type: List[str]
-            for text_part in text_data:
-                skip = False
-                if self.skip_keywords:
-                    for keyword in self.skip_keywords:
-                        if keyword in text_part:
-                            skip = True
-                if not skip:
-                    text_sections.append(text_part)
-            for para in text_sections:
-                yield para.strip()
+        for path, encoding in self.abspaths(fileids, include_encoding=True):
+            yield from self._doc_paras(path, encoding)
+
+    def _doc_paras(self, path: str, encoding: str) -> Iterator[str]:
+        """Yield the paragraphs of a document not flagged by the skip keywords."""
+        skip_keywords = tuple(self.skip_keywords or ())
+        for text_part in self._text_nodes(path, encoding):
+            if not any(keyword in text_part for keyword in skip_keywords):
+                yield text_part.strip()
+
+    def _text_nodes(self, path: str, encoding: str) -> Iterator[str]:
+        """Yield the text sections of a document, parsing it only if it is not in the parsed
+        cache or changed on disk since."""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime, stat.st_size)
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == stamp:
+            self._parsed.move_to_end(path)
+            yield from cached[1]
+            return
+        with codecs.open(path, 'r', encoding=encoding) as reader:
+            text = reader.read()
+        if self.streaming:
+            index = _json_skip(text, 0)
+            if not text.startswith('{', index):
+                raise json.JSONDecodeError('Expecting object', text, index)
+            nodes = _stream_values(text, index, 'text')
+        else:
+            nodes = iter(_sorted_text_nodes(json.loads(text)['text']))
+        parsed = []  # type: List[str]
+        for node in nodes:
+            parsed.append(node)
+            yield node
+        self._cache_text_nodes(path, stamp, parsed)
+
+    def _cache_text_nodes(self, path: str, stamp: Tuple, nodes: List[str]):
+        """Keep the text sections of a document, evicting the least recently read documents
+        beyond ``cache_chars``."""
+        chars = sum(len(node) for node in nodes)
+        if path in self._parsed:
+            self._parsed_chars -= self._parsed.pop(path)[2]
+        if chars > self.cache_chars:
+            return
+        self._parsed[path] = (stamp, nodes, chars)
+        self._parsed_chars += chars
+        while self._parsed_chars > self.cache_chars:
+            self._parsed_chars -= self._parsed.popitem(last=False)[1][2]
+
+    def _map_docs(self, func, fileids) -> Iterator[List[str]]:
+        """Apply a worker function to the paragraphs of each document in a pool of processes,
+        handing it ``JSON_WINDOW`` documents at a time, and yield the results in order."""
+        docs = (list(self._doc_paras(path, encoding))
+                for path, encoding in self.abspaths(fileids, include_encoding=True))
+        tokenizers = (self._sent_tokenizer, getattr(self, '_word_tokenizer', None))
+        with Pool(self.processes, initializer=_init_worker, initargs=(tokenizers,)) as pool:
+            window = list(islice(docs, JSON_WINDOW))
+            while window:
+                pending = pool.map_async(func, window)
+                window = list(islice(docs, JSON_WINDOW))
+                yield from pending.get()
 
     def docs(self, fileids=None) -> Generator[Dict[str, Any], Dict[str, Any], None]:
         """
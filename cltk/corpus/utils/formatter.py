@@ -7,7 +7,6 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>', 'Stephen Margheim <st
               'Natasha Voake <natashavoake@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
-from builtins import bytes
 from cltk.corpus.greek.tlg_index import TLG_INDEX
 from cltk.corpus.greek.tlg_index import TLG_WORKS_INDEX
 from cltk.corpus.latin.phi5_index import PHI5_INDEX
@@ -82,38 +81,72 @@ def remove_non_latin(input_string, also_keep=None):
     return no_latin
 
 
+# Precompiled patterns for the TLG/PHI5 cleanup functions below, which run
+# over entire corpora. Junk and (optionally) punctuation are removed in a
+# single pass, then whitespace, including line breaks, is collapsed.
+TLG_REMOVE = r'-\n|«|»|<|>|\.\.\.|‘|’|_|{.+?}|\(.+?\)|[a-zA-Z0-9]'
+PHI5_REMOVE = r'-\n|«|»|\<|\>|\.\.\.|‘|’|_|{.+?}|\(.+?\)|\(|\)|“|#|%|⚔|&|=|/|\\|〚|†|『|⚖|–|˘|⚕|☾|◌|◄|►|⌐|⌊|⌋|≈|∷|≈|∞|”|[0-9]'
+TLG_PUNCTUATION = r',·:"\'?\-!*\[\]{}'
+TLG_PERIODS = '.;'
+# PHI5 punctuation includes the combining acute accents made by TLGU
+PHI5_PUNCTUATION = '\u0301' + r',;:"\'?\-!*\[\]{}'
+PHI5_PERIODS = '.'
+
+# (rm_punctuation, rm_periods) -> pattern; rm_periods only applies along
+# with rm_punctuation
+TLG_REMOVE_COMPS = {
+    (False, False): regex.compile(TLG_REMOVE, flags=regex.VERSION1),
+    (True, False): regex.compile(TLG_REMOVE + '|[' + TLG_PUNCTUATION + ']', flags=regex.VERSION1),
+    (True, True): regex.compile(TLG_REMOVE + '|[' + TLG_PUNCTUATION + TLG_PERIODS + ']', flags=regex.VERSION1),
+}
+PHI5_REMOVE_COMPS = {
+    (False, False): regex.compile(PHI5_REMOVE),
+    (True, False): regex.compile(PHI5_REMOVE + '|[' + PHI5_PUNCTUATION + ']'),
+    (True, True): regex.compile(PHI5_REMOVE + '|[' + PHI5_PUNCTUATION + PHI5_PERIODS + ']'),
+}
+WHITESPACE = regex.compile(r'\s+')
+
+
+def _plaintext_cleanup(text, remove_comps, rm_punctuation, rm_periods):
+    """Remove junk and optionally punctuation, then collapse all whitespace
+    (including line breaks) to single spaces.
+    """
+    remove_comp = remove_comps[bool(rm_punctuation), bool(rm_punctuation and rm_periods)]
+    return WHITESPACE.sub(' ', remove_comp.sub('', text))
+
+
+def _plaintext_cleanup_lines(lines, remove_comps, rm_punctuation, rm_periods):
+    """Clean an iterable of lines (keeping their line endings, as file
+    objects yield them), yielding cleaned chunks whose concatenation equals
+    the cleanup of the joined lines. None of the junk patterns spans a line
+    break except ``-\\n``, which ends its line, so only whitespace runs across
+    lines need carrying over.
+    """
+    space_pending = False
+    for line in lines:
+        chunk = _plaintext_cleanup(line, remove_comps, rm_punctuation, rm_periods)
+        if space_pending and chunk.startswith(' '):
+            chunk = chunk[1:]
+        if chunk:
+            space_pending = chunk.endswith(' ')
+            yield chunk
+
+
 def tlg_plaintext_cleanup(text, rm_punctuation=False, rm_periods=False):
     """Remove and substitute post-processing for Greek TLG text.
     TODO: Surely more junk to pull out. Please submit bugs!
     TODO: {.+?}|\(.+?\) working?
-    TODO: This is a rather slow now, help in speeding up welcome.
     """
-    remove_comp = regex.compile(r'-\n|«|»|<|>|\.\.\.|‘|’|_|{.+?}|\(.+?\)|[a-zA-Z0-9]', flags=regex.VERSION1)
-    text = remove_comp.sub('', text)
-
-    new_text = None
-    if rm_punctuation:
-        new_text = ''
-        punctuation = [',', '·', ':', '"', "'", '?', '-', '!', '*', '[', ']', '{', '}']
-        if rm_periods:
-            punctuation += ['.', ';']
-        for char in text:
-            # second try at rming some punctuation; merge with above regex
-            if char in punctuation:
-                pass
-            else:
-                new_text += char
-    if new_text:
-        text = new_text
-
-    # replace line breaks w/ space
-    replace_comp = regex.compile(r'\n')
-    text = replace_comp.sub(' ', text)
-
-    comp_space = regex.compile(r'\s+')
-    text = comp_space.sub(' ', text)
+    return _plaintext_cleanup(text, TLG_REMOVE_COMPS, rm_punctuation, rm_periods)
 
-    return text
+
+def tlg_plaintext_cleanup_lines(lines, rm_punctuation=False, rm_periods=False):
+    """Streaming ``tlg_plaintext_cleanup()``: take an iterable of lines, such
+    as an open file, and yield cleaned chunks, holding only one line in
+    memory at a time. ``''.join()`` of the chunks equals
+    ``tlg_plaintext_cleanup()`` of the whole text.
+    """
+    return _plaintext_cleanup_lines(lines, TLG_REMOVE_COMPS, rm_punctuation, rm_periods)
 
 
 def cltk_normalize(text, compatibility=True):
@@ -126,40 +159,18 @@ def cltk_normalize(text, compatibility=True):
 def phi5_plaintext_cleanup(text, rm_punctuation=False, rm_periods=False):
     """Remove and substitute post-processing for Greek PHI5 text.
     TODO: Surely more junk to pull out. Please submit bugs!
-    TODO: This is a rather slow now, help in speeding up welcome.
     """
-    # This works OK, doesn't get some
     # Note: rming all characters between {} and ()
-    remove_comp = regex.compile(r'-\n|«|»|\<|\>|\.\.\.|‘|’|_|{.+?}|\(.+?\)|\(|\)|“|#|%|⚔|&|=|/|\\|〚|†|『|⚖|–|˘|⚕|☾|◌|◄|►|⌐|⌊|⌋|≈|∷|≈|∞|”|[0-9]')
-    text = remove_comp.sub('', text)
-
-    new_text = None
-    if rm_punctuation:
-        new_text = ''
-        punctuation = [',', ';', ':', '"', "'", '?', '-', '!', '*', '[', ']', '{', '}']
-        if rm_periods:
-            punctuation += ['.']
-        for char in text:
-            # rm acute combining acute accents made by TLGU
-            # Could be caught by regex, tried and failed, not sure why
-            if bytes(char, 'utf-8') == b'\xcc\x81':
-                pass
-            # second try at rming some punctuation; merge with above regex
-            elif char in punctuation:
-                pass
-            else:
-                new_text += char
-    if new_text:
-        text = new_text
-
-    # replace line breaks w/ space
-    replace_comp = regex.compile(r'\n')
-    text = replace_comp.sub(' ', text)
-
-    comp_space = regex.compile(r'\s+')
-    text = comp_space.sub(' ', text)
+    return _plaintext_cleanup(text, PHI5_REMOVE_COMPS, rm_punctuation, rm_periods)
 
-    return text
+
+def phi5_plaintext_cleanup_lines(lines, rm_punctuation=False, rm_periods=False):
+    """Streaming ``phi5_plaintext_cleanup()``: take an iterable of lines, such
+    as an open file, and yield cleaned chunks, holding only one line in
+    memory at a time. ``''.join()`` of the chunks equals
+    ``phi5_plaintext_cleanup()`` of the whole text.
+    """
+    return _plaintext_cleanup_lines(lines, PHI5_REMOVE_COMPS, rm_punctuation, rm_periods)
 
 
 def assemble_tlg_author_filepaths():
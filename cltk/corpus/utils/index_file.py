@@ -0,0 +1,118 @@
+"""Read-only, lazily loaded mappings stored in compact index files.
+
+Large corpus indices (``TLG_INDEX``, ``WORK_NUMBERS``, etc.) used to be dict
+literals which Python had to compile and execute on import. They are now
+shipped as ``.idx`` files and exposed through ``LazyIndex``, which keeps the
+dict interface but does not touch the disk until the first lookup, and then
+only decodes the values actually requested.
+
+File layout (UTF-8):
+
+* line 1: JSON object ``{"keys": [...], "offsets": [...]}``, where
+  ``offsets`` has one more element than ``keys`` and gives the byte offsets,
+  relative to the start of line 2, at which each value begins;
+* following lines: one JSON-encoded value per line, in key order.
+
+The file is memory-mapped, so processes forked from a parent that has
+already opened it share the pages.
+"""
+
+from collections.abc import Mapping
+import json
+import mmap
+import os
+import threading
+from typing import Any, Dict
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+def write_index(mapping: Dict[str, Any], path: str):
+    """Write a mapping with string keys and JSON-serializable values to an
+    index file readable by ``LazyIndex``. Key order is preserved.
+
+    :param mapping: Mapping to serialize.
+    :type mapping: dict
+    :param path: Destination file path.
+    :type path: str
+    """
+    keys = []
+    offsets = [0]
+    records = []
+    for key, value in mapping.items():
+        record = (json.dumps(value, ensure_ascii=False) + '\n').encode('utf-8')
+        keys.append(key)
+        records.append(record)
+        offsets.append(offsets[-1] + len(record))
+    header = json.dumps({'keys': keys, 'offsets': offsets}, ensure_ascii=False)
+    with open(path, 'wb') as file_open:
+        file_open.write(header.encode('utf-8') + b'\n')
+        file_open.writelines(records)
+
+
+class LazyIndex(Mapping):
+    """Read-only ``Mapping`` over an index file written by ``write_index()``.
+
+    >>> from cltk.corpus.greek.tlg_index import TLG_INDEX
+    >>> TLG_INDEX['TLG0012']
+    'Homerus Epic., Homer'
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: File path to the index file.
+        :type path: str
+        """
+        self.path = path
+        self._positions = None  # key -> position in offsets
+        self._offsets = None
+        self._data_start = None
+        self._mmap = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Map the index file and read its key/offset table."""
+        with self._lock:
+            if self._positions is not None:
+                return
+            with open(self.path, 'rb') as file_open:
+                mapped = mmap.mmap(file_open.fileno(), 0, access=mmap.ACCESS_READ)
+            header_end = mapped.find(b'\n')
+            header = json.loads(mapped[:header_end].decode('utf-8'))
+            self._mmap = mapped
+            self._data_start = header_end + 1
+            self._offsets = header['offsets']
+            self._positions = {key: position for position, key in enumerate(header['keys'])}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if self._positions is None:
+            self._load()
+        position = self._positions[key]
+        start = self._data_start + self._offsets[position]
+        stop = self._data_start + self._offsets[position + 1]
+        value = json.loads(self._mmap[start:stop].decode('utf-8'))
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key):
+        if self._positions is None:
+            self._load()
+        return key in self._positions
+
+    def __iter__(self):
+        if self._positions is None:
+            self._load()
+        return iter(self._positions)
+
+    def __len__(self):
+        if self._positions is None:
+            self._load()
+        return len(self._positions)
+
+    def __repr__(self):
+        return f'<{type(self).__name__}: {os.path.basename(self.path)}>'
@@ -1,5 +1,7 @@
 """Search CLTK corpora with Whoosh, a Python-language index."""
 
+from html import escape
+import json
 import os
 import time
 
@@ -7,12 +9,17 @@ from whoosh.fields import ID
 from whoosh.fields import Schema
 from whoosh.fields import TEXT
 from whoosh.index import create_in
+from whoosh.index import exists_in
 from whoosh.index import open_dir
+from whoosh.highlight import ContextFragmenter
+from whoosh.highlight import Formatter
+from whoosh.highlight import PinpointFragmenter
 from whoosh.qparser import QueryParser
 
 from cltk.corpus.greek.tlg.id_author import ID_AUTHOR as TLG_AUTHOR_MAP
 from cltk.corpus.latin.phi5_index import PHI5_INDEX as PHI5_AUTHOR_MAP
 from cltk.utils.cltk_logger import logger
+from cltk.utils.file_operations import md5
 
 
 __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>']
@@ -32,7 +39,7 @@ class CLTKIndex:
         self.index_dir_base = os.path.join(self.index_dir_base, lang, 'index')
         self.index_path = os.path.join(self.index_dir_base, corpus, chunk)
 
-    def index_corpus(self):
+    def index_corpus(self, processes=1, multisegment=False, analyzer=None, rebuild=False):
         """Make a Whoosh index out of a pre-processed corpus, ie TLG, PHI5,
         or PHI7.
 
@@ -46,26 +53,112 @@ class CLTKIndex:
         # And to start indexing:
         >>> # cltk_index.index_corpus()
 
-        TODO: Prevent overwriting. Ask user to rm old dir before re-indexing.
+        The md5 checksum of each document is stored in the index, so running
+        this again only adds, re-indexes or deletes the documents which were
+        added to, changed in or removed from the corpus since. The index is
+        made from scratch if it does not exist, if ``rebuild`` is set or if
+        it was made with another analyzer.
+
+        :param processes: Number of processes to index with (Whoosh's
+            ``procs``); None for one per CPU.
+        :param multisegment: With several processes, keep the segment each
+            one writes instead of merging them: committing is faster,
+            searching slower until the index is optimized.
+        :param analyzer: Whoosh analyzer for the text, e.g.
+            ``RegexTokenizer() | LowercaseFilter()``; Whoosh's
+            ``StandardAnalyzer`` by default.
+        :param rebuild: Index all documents from scratch.
+        :return: Numbers of documents 'added', 'updated', 'deleted' and
+            'unchanged', and 'seconds' taken.
+        :rtype: dict
+
         TODO: Add option for lemmatizing.
-        TODO: Add for figure out lower() options.
         TODO: Process TLG through forthcoming normalize().
         TODO: Add name to each index.
-        TODO: Turn off any language-specific mods (eg, stemming, case) that
-        Whoosh might be doing by default.
         """
+        if processes is None:
+            processes = os.cpu_count()
 
         # Setup index dir
-        schema = Schema(path=ID(stored=True),
-                        author=TEXT(stored=True),
-                        content=TEXT)
-        try:
-            _index = create_in(self.index_path, schema)
-        except FileNotFoundError:
-            os.makedirs(self.index_path)
+        schema = self._schema(analyzer)
+        if not rebuild and exists_in(self.index_path):
+            _index = open_dir(self.index_path)
+            if _index.schema != schema or \
+                    _index.schema['content'].analyzer != schema['content'].analyzer:
+                logger.info('Index at "%s" was made with another schema or analyzer; rebuilding it.', self.index_path)  # pylint: disable=line-too-long
+                rebuild = True
+        else:
+            rebuild = True
+        if rebuild:
+            os.makedirs(self.index_path, exist_ok=True)
             _index = create_in(self.index_path, schema)
-        writer = _index.writer()
 
+        # Checksums of the documents already indexed
+        with _index.searcher() as searcher:
+            indexed = {fields['path']: fields['checksum']
+                       for fields in searcher.all_stored_fields()}
+
+        documents = self._corpus_documents()
+        time_0 = time.time()
+        logger.info("Commencing indexing of %s documents of '%s' corpus." % (len(documents), self.corpus))  # pylint: disable=line-too-long
+        logger.info('Index will be written to: "%s".' % self.index_path)
+        counts = {'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+        writer = _index.writer(procs=processes, multisegment=multisegment)
+        for count, (path, author) in enumerate(documents, 1):
+            checksum = md5(path)
+            previous = indexed.pop(path, None)
+            if previous == checksum:
+                counts['unchanged'] += 1
+                continue
+
+            with open(path) as file_open:
+                content = file_open.read()
+            if previous is None:
+                writer.add_document(path=path, author=author, checksum=checksum,
+                                    content=content)
+                counts['added'] += 1
+            else:
+                writer.update_document(path=path, author=author, checksum=checksum,
+                                       content=content)
+                counts['updated'] += 1
+
+            if count % 100 == 0:
+                elapsed = time.time() - time_0
+                logger.info('Indexed doc %s of %s (%.1f docs per sec.).', count, len(documents),
+                            count / elapsed)
+        for path in indexed:  # no longer in the corpus
+            writer.delete_by_term('path', path)
+            counts['deleted'] += 1
+
+        if counts['unchanged'] == len(documents) and not counts['deleted']:
+            logger.info('Index is up to date.')
+            writer.cancel()
+        else:
+            logger.info('Commencing to commit changes.')
+            writer.commit()
+
+        counts['seconds'] = time.time() - time_0
+        logger.info('Finished indexing in %.1f seconds: %s documents added, %s updated, %s deleted, %s unchanged.',  # pylint: disable=line-too-long
+                    counts['seconds'], counts['added'], counts['updated'], counts['deleted'],
+                    counts['unchanged'])
+        return counts
+
+    @staticmethod
+    def _schema(analyzer=None):
+        """Schema of the index; ``path`` identifies a document. The content is
+        stored along with the character offsets of its terms, so that hits
+        are highlighted from the index alone.
+        """
+        return Schema(path=ID(stored=True, unique=True),
+                      author=TEXT(stored=True),
+                      checksum=ID(stored=True),
+                      content=TEXT(analyzer=analyzer, stored=True, chars=True))
+
+    def _corpus_documents(self):
+        """List the path and author of each document of the corpus, by
+        author or by work.
+        :rtype: list
+        """
         # Setup corpus to be indexed
         if self.lang == 'greek' and self.corpus == 'tlg':
             corpus_path = os.path.normpath(get_cltk_data_dir() + '/greek/text/tlg/plaintext/')
@@ -79,70 +172,79 @@ class CLTKIndex:
 
         files = os.listdir(corpus_path)
         if self.lang == 'greek' and self.corpus == 'tlg':
-            files = [f[:-4] for f in files if f.startswith('TLG')]
+            files = [f for f in files if f.startswith('TLG')]
             corpus_index = TLG_AUTHOR_MAP
         elif self.lang == 'latin' and self.corpus == 'phi5':
-            files = [f[:-4] for f in files if f.startswith('LAT')]
+            files = [f for f in files if f.startswith('LAT')]
             corpus_index = PHI5_AUTHOR_MAP
 
-        time_0 = time.time()
-        logger.info("Commencing indexing of %s documents of '%s' corpus." % (len(files), self.corpus))  # pylint: disable=line-too-long
-        logger.info('Index will be written to: "%s".' % self.index_path)
-        if self.chunk == 'author':
-            for count, file in enumerate(files, 1):
-
-                try:
+        documents = []
+        for file in sorted(files):
+            name = file[:-4]  # eg 'TLG0012' or 'TLG0012.TXT-001'
+            try:
+                if self.chunk == 'author':
                     if self.lang == 'greek' and self.corpus == 'tlg':
-                        file = file[3:]
-                        author = corpus_index[file]
-                        path = os.path.join(corpus_path, 'TLG' + file + '.TXT')
+                        author = corpus_index[name[3:]]
                     if self.lang == 'latin' and self.corpus == 'phi5':
-                        author = corpus_index[file]
-                        path = os.path.join(corpus_path, file + '.TXT')
-                except KeyError as key_error:
-                    if file.startswith('LAT9999'):
-                        continue
-                    logger.error(key_error)
-                    raise
-
-                with open(path) as file_open:
-                    content = file_open.read()
-                writer.add_document(path=path,
-                                    author=author,
-                                    content=content)
-
-                if count % 100 == 0:
-                    logger.info('Indexed doc %s.' % count)
-
-        if self.chunk == 'work':
-            for count, file in enumerate(files, 1):
-                try:
+                        author = corpus_index[name]
+                else:
                     if self.lang == 'greek' and self.corpus == 'tlg':
-                        path = os.path.join(corpus_path, file + '.TXT')
-                        author = corpus_index[file[3:-8]]
+                        author = corpus_index[name[3:-8]]
                     if self.lang == 'latin' and self.corpus == 'phi5':
-                        path = os.path.join(corpus_path, file + '.TXT')
-                        author = corpus_index[file[:-8]]
-                except KeyError as key_error:
-                    if file.startswith('LAT9999'):
-                        continue
-                    logger.error(key_error)
-                    raise
-
-                with open(path) as file_open:
-                    content = file_open.read()
-
-                writer.add_document(path=path,
-                                    author=author,
-                                    content=content)
-                if count % 100 == 0:
-                    logger.info('Indexed doc %s.' % count)
-        logger.info('Commencing to commit changes.')
-        writer.commit()
+                        author = corpus_index[name[:-8]]
+            except KeyError as key_error:
+                if file.startswith('LAT9999'):
+                    continue
+                logger.error(key_error)
+                raise
+            documents.append((os.path.join(corpus_path, file), author))
+        return documents
+
+    def search(self, query, page=None, pagelen=20, window_size=300, surround_size=50):
+        """Send query to a corpus's index, yielding a dict for each document
+        matched, best first, with its 'author', 'path' and highlighted
+        'fragments'. Each fragment is a dict of its 'text' and the
+        ('start', 'end') offsets of the 'matches' in it.
+
+        Fragments are cut around the character offsets of the matched terms
+        kept in the index, from the content stored there; the source files
+        are only read for indices made before contents were stored.
+
+        >>> # cltk_index = CLTKIndex('latin', 'phi5')
+        >>> # for hit in cltk_index.search('amicitia', page=1):
+        >>> #     print(hit['author'], len(hit['fragments']))
+
+        :param query: Query in Whoosh's syntax.
+        :param page: Number of the page of results to return, from 1; all
+            results if None.
+        :param pagelen: Number of results per page.
+        :param window_size: Maximum length of a fragment.
+        :param surround_size: Characters of context around the matches.
+        :rtype: generator
+        """
+        _index = open_dir(self.index_path)
+        stored = _index.schema['content'].stored
 
-        time_1 = time.time()
-        elapsed = time_1 - time_0
-        logger.info('Finished indexing all documents in %s seconds (averaging %s docs per sec.)' % (elapsed, (len(files) / elapsed)))  # pylint: disable=line-too-long
+        with _index.searcher() as searcher:
+            _query = QueryParser("content", _index.schema).parse(query)
+            if page is None:
+                hits = results = searcher.search(_query, limit=None, terms=True)
+            else:
+                hits = searcher.search_page(_query, page, pagelen=pagelen, terms=True)
+                results = hits.results
+            fragmenter = PinpointFragmenter if stored else ContextFragmenter
+            results.fragmenter = fragmenter(maxchars=window_size, surround=surround_size,
+                                            charlimit=None)
+            results.formatter = FragmentFormatter()
+
+            for hit in hits:
+                text = None
+                if not stored:
+                    with open(hit['path']) as file_open:
+                        text = file_open.read()
+                yield {'author': hit['author'],
+                       'path': hit['path'],
+                       'fragments': hit.highlights("content", text=text, top=10000000)}
 
     def corpus_query(self, query, save_file=None, window_size=300, surround_size=50):
         """Send query to a corpus's index. `save_file` is a filename.
@@ -152,41 +254,8 @@ class CLTKIndex:
         >>> # results = cltk_index.corpus_query('amicitia')
 
         """
-        _index = open_dir(self.index_path)
-
-        output_str = ''
-
-        with _index.searcher() as searcher:
-            _query = QueryParser("content", _index.schema).parse(query)
-            results = searcher.search(_query, limit=None)
-            results.fragmenter.charlimit = None
-
-            # Allow larger fragments
-            results.fragmenter.maxchars = window_size
-            # Show more context before and after
-            results.fragmenter.surround = surround_size
-
-            docs_number = searcher.doc_count_all()
-
-            output_str += 'Docs containing hits: {}.'.format(docs_number) + '</br></br>'
-
-            for hit in results:
-                author = hit['author']
-                filepath = hit['path']
-                output_str += author + '</br>'
-                output_str += filepath + '</br>'
-
-                with open(filepath) as file_open:
-                    file_contents = file_open.read()
-
-                highlights = hit.highlights("content", text=file_contents, top=10000000)
-                lines = highlights.split('\n')
-                #lines_numbers = [l for l in lines]
-                lines_br = '</br>'.join(lines)
-                lines_number_approx = len(lines)
-                output_str += 'Approximate hits: {}.'.format(lines_number_approx) + '</br>'
-
-                output_str += lines_br + '</br></br>'
+        output_str = hits_to_html(self.search(query, window_size=window_size,
+                                              surround_size=surround_size))
 
         if save_file:
             user_dir = os.path.normpath(get_cltk_data_dir() + '/user_data/search')
@@ -202,6 +271,78 @@ class CLTKIndex:
         else:
             return output_str
 
+
+class FragmentFormatter(Formatter):
+    """Whoosh formatter which returns the highlighted fragments of a hit as
+    data, for ``hits_to_html()``, ``hits_to_json()`` or any other rendering.
+    """
+
+    def format(self, fragments, replace=False):
+        """Return a list of dicts of the 'text' of each fragment and the
+        (start, end) offsets of the 'matches' in it.
+        """
+        formatted = []
+        for fragment in fragments:
+            start = index = fragment.startchar
+            matches = []
+            for token in fragment.matches:
+                # Skip overlapping matches, as Whoosh's formatters do
+                if token.startchar is None or token.startchar < index:
+                    continue
+                matches.append((token.startchar - start, token.endchar - start))
+                index = token.endchar
+            formatted.append({'text': fragment.text[start:fragment.endchar],
+                              'matches': matches})
+        return formatted
+
+
+def hits_to_html(hits, tagname='b', maxclasses=5):
+    """Render the hits of ``CLTKIndex.search()`` in HTML, as
+    ``corpus_query()`` returns them. As with Whoosh's ``HtmlFormatter``,
+    each distinct matched word, regardless of case, gets a class, ``term0``
+    to ``term4``.
+    :param hits: iterable of dict
+    :rtype: str
+    """
+    term_classes = {}
+    output = []
+    docs_number = 0
+    for hit in hits:
+        docs_number += 1
+        output.append(hit['author'] + '</br>')
+        output.append(hit['path'] + '</br>')
+
+        highlights = []
+        for fragment in hit['fragments']:
+            text = fragment['text']
+            index = 0
+            for start, end in fragment['matches']:
+                term = escape(text[start:end], quote=False)
+                term_class = term_classes.setdefault(text[start:end].lower(),
+                                                     len(term_classes) % maxclasses)
+                highlights.append(escape(text[index:start], quote=False))
+                highlights.append('<{0} class="match term{1}">{2}</{0}>'.format(tagname, term_class, term))
+                index = end
+            highlights.append(escape(text[index:], quote=False))
+            highlights.append('...')
+        lines = ''.join(highlights[:-1]).split('\n')
+        output.append('Approximate hits: {}.'.format(len(lines)) + '</br>')
+        output.append('</br>'.join(lines) + '</br></br>')
+
+    output.insert(0, 'Docs containing hits: {}.'.format(docs_number) + '</br></br>')
+    return ''.join(output)
+
+
+def hits_to_json(hits, **kwargs):
+    """Render the hits of ``CLTKIndex.search()`` as a JSON list; keyword
+    arguments are passed to ``json.dumps()``.
+    :param hits: iterable of dict
+    :rtype: str
+    """
+    kwargs.setdefault('ensure_ascii', False)
+    return json.dumps(list(hits), **kwargs)
+
+
 if __name__ == '__main__':
     #cltk_index = CLTKIndex('latin', 'phi5')
     #cltk_index = CLTKIndex('latin', 'phi5', chunk='work')
@@ -0,0 +1,509 @@
+"""A positional inverted index of a corpus, for phrase, proximity, lemma and
+wildcard queries.
+
+The index maps each token of the corpus, as split by the CLTK word tokenizer
+of its language, to the documents and positions it occurs at. It is kept in
+a directory of three files: the postings of all terms (``postings.bin``),
+the character offsets of every token (``offsets.bin``) and the lexicon
+pointing into them (``lexicon.pickle``). The first two are memory-mapped, so
+opening an index only loads the lexicon and a query only reads the postings
+of its terms.
+
+A query is a word or a quoted phrase, or several joined by ``NEAR/n``. A
+word may contain the wildcards ``*`` and ``?``, or be a lemma, as in
+``lemma:amo``, if the index was made with a lemmatizer:
+
+>>> # index.find('"arma virumque"')
+>>> # index.find('lemma:amicus NEAR/3 fid*')
+"""
+
+import bisect
+import fnmatch
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+import time
+import zlib
+from array import array
+from itertools import accumulate
+from itertools import chain
+from multiprocessing import Pool
+from operator import sub
+
+import regex
+
+from cltk.corpus.greek.tlg_index import TLG_INDEX
+from cltk.corpus.latin.phi5_index import PHI5_INDEX
+from cltk.corpus.utils.formatter import assemble_phi5_author_filepaths
+from cltk.corpus.utils.formatter import assemble_tlg_author_filepaths
+from cltk.ir.query import CORPUS_LANGUAGES
+from cltk.ir.query import _paragraph_context
+from cltk.ir.query import _read_text
+from cltk.ir.query import _sentence_context
+from cltk.ir.query import _window_match
+from cltk.tokenize.utils import align_spans
+from cltk.tokenize.word import WordTokenizer
+from cltk.utils.cltk_logger import logger
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+FORMAT_VERSION = 3
+LEXICON_NAME = 'lexicon.pickle'
+POSTINGS_NAME = 'postings.bin'
+OFFSETS_NAME = 'offsets.bin'
+
+WORD_CHAR = regex.compile(r'\w', flags=regex.VERSION1)
+QUERY_PARTS = regex.compile(r'"[^"]*"|\S+', flags=regex.VERSION1)
+NEAR = regex.compile(r'NEAR/(\d+)', flags=regex.VERSION1)
+
+# Word tokenizers of worker processes, by language.
+_TOKENIZERS = {}
+
+
+def _normalize(token):
+    """Return the term a token is indexed as: case-folded, and without the
+    hyphen the Latin tokenizer puts before enclitics ('-que')."""
+    if len(token) > 1 and token.startswith('-'):
+        token = token[1:]
+    return token.casefold()
+
+
+def _deltas(values):
+    """Delta-code an ascending sequence of integers."""
+    return array('I', map(sub, values, chain((0,), values)))
+
+
+def _word_tokenizer(language, tokenizer):
+    """Return the tokenizer given to ``PositionalIndex.build()``, or the
+    ``WordTokenizer`` of the language if it is None."""
+    if tokenizer is None:
+        if language not in _TOKENIZERS:
+            _TOKENIZERS[language] = WordTokenizer(language)
+        tokenizer = _TOKENIZERS[language]
+    return tokenizer
+
+
+def _terms(text, tokenizer):
+    """Yield the term, start and end offsets of each token of a text that is
+    indexed.
+
+    Each token is indexed as the text it spans, so that a word is found as
+    it is written; a word the tokenizer rewrites into several tokens, like
+    Latin 'mecum', is indexed once. Tokens without a letter or digit are
+    left out.
+    """
+    if hasattr(tokenizer, 'tokenize_spans'):
+        spans = tokenizer.tokenize_spans(text)
+    else:
+        spans = align_spans(text, tokenizer(text))
+    previous = None
+    for i in range(0, len(spans), 2):
+        start, end = spans[i], spans[i + 1]
+        if (start, end) == previous:
+            continue
+        previous = (start, end)
+        term = _normalize(text[start:end])
+        if WORD_CHAR.search(term):
+            yield term, start, end
+
+
+def _index_document(job):
+    """Tokenize one document; run in worker processes by
+    ``PositionalIndex.build()``.
+    :param job: Tuple of document id, file path, language and tokenizer
+        (None for the language's ``WordTokenizer``).
+    :rtype: tuple of document id, dict of term to positions, and array of
+        the start and end offsets of each token
+    """
+    doc_id, path, language, tokenizer = job
+    postings = {}
+    offsets = array('I')
+    position = 0
+    for term, start, end in _terms(_read_text(path), _word_tokenizer(language, tokenizer)):
+        positions = postings.get(term)
+        if positions is None:
+            positions = postings[term] = array('I')
+        positions.append(position)
+        offsets.extend((start, end))
+        position += 1
+    return doc_id, postings, offsets
+
+
+def _file_stamp(path):
+    """Return what identifies a version of a file: its mtime and size."""
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+
+def _map_file(path):
+    """Memory-map a file for reading; an empty file gives empty bytes."""
+    with open(path, 'rb') as file_open:
+        if not os.fstat(file_open.fileno()).st_size:
+            return b''
+        return mmap.mmap(file_open.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _Span:
+    """The part of a regex match read by the context functions of
+    ``cltk.ir.query``."""
+
+    def __init__(self, string, start, end):
+        self.string = string
+        self._start = start
+        self._end = end
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._end
+
+
+class PositionalIndex:
+    """A positional inverted index, made with ``build()`` or
+    ``build_corpus()`` and opened from its directory."""
+
+    def __init__(self, index_dir):
+        """
+        :param index_dir: Directory the index was built in.
+        """
+        self.index_dir = os.path.expanduser(index_dir)
+        with open(os.path.join(self.index_dir, LEXICON_NAME), 'rb') as file_open:
+            lexicon = pickle.load(file_open)
+        if lexicon['version'] != FORMAT_VERSION:
+            raise ValueError("Index at '{0}' has format {1}, not {2}; build it again.".format(
+                self.index_dir, lexicon['version'], FORMAT_VERSION))
+        self.language = lexicon['language']
+        self.tokenizer = _word_tokenizer(self.language, lexicon['tokenizer'])
+        self.documents = lexicon['documents']
+        self._terms = lexicon['terms']
+        self._lemmas = lexicon['lemmas']
+        self._swap = lexicon['byteorder'] != sys.byteorder
+        self._offset_format = '<2I' if lexicon['byteorder'] == 'little' else '>2I'
+        self._sorted_terms = None
+        self._postings = _map_file(os.path.join(self.index_dir, POSTINGS_NAME))
+        self._offsets = _map_file(os.path.join(self.index_dir, OFFSETS_NAME))
+
+    def close(self):
+        """Unmap the index files."""
+        for mapped in (self._postings, self._offsets):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def corpus_dir(corpus):
+        """Return the directory ``build_corpus()`` puts the index of a corpus
+        in, next to the Whoosh indices of ``cltk.ir.boolean``.
+        :param corpus: 'phi5' or 'tlg'
+        :rtype: str
+        """
+        return os.path.join(get_cltk_data_dir(), CORPUS_LANGUAGES[corpus], 'index', corpus,
+                            'positional')
+
+    @classmethod
+    def build_corpus(cls, corpus, index_dir=None, lemmatizer=None, processes=1):
+        """Index the plaintext PHI5 or TLG, one document per author.
+        :param corpus: 'phi5' or 'tlg'
+        :param index_dir: Where to keep the index; ``corpus_dir(corpus)`` by
+            default.
+        :param lemmatizer: See ``build()``.
+        :param processes: See ``build()``.
+        :rtype: PositionalIndex
+        """
+        corpora = ['tlg', 'phi5']
+        assert corpus in corpora, "Available corpora: '{}'.".format(corpora)
+        if corpus == 'phi5':
+            index = PHI5_INDEX
+            paths = assemble_phi5_author_filepaths()
+        elif corpus == 'tlg':
+            index = TLG_INDEX
+            paths = assemble_tlg_author_filepaths()
+        names = [index[os.path.split(path)[1][:-4]] for path in paths]
+        return cls.build(index_dir or cls.corpus_dir(corpus), paths, CORPUS_LANGUAGES[corpus],
+                         names=names, lemmatizer=lemmatizer, processes=processes)
+
+    @classmethod
+    def build(cls, index_dir, paths, language, names=None, tokenizer=None, lemmatizer=None,
+              processes=1):
+        """Index plaintext files, replacing any index already in
+        ``index_dir``.
+
+        Tokens are case-folded and those without a letter or digit are left
+        out, so that a phrase may span punctuation.
+
+        :param index_dir: Directory to keep the index in.
+        :param paths: Files to index, one document each.
+        :param language: Language of the ``WordTokenizer`` to split them with
+            and of the sentence punctuation used for 'sentence' context.
+        :param names: Name of each document, returned with its matches; the
+            file name by default.
+        :param tokenizer: Tokenizer to split texts with instead, either an
+            object with a ``tokenize_spans()`` method, like the CLTK's, or a
+            callable returning a list of tokens. It is kept with the index,
+            to split the words of queries with, so it must be picklable.
+        :param lemmatizer: Callable taking a list of terms and returning the
+            list of their lemmas, e.g. ``LemmaReplacer('latin').lemmatize``,
+            to allow 'lemma:' queries.
+        :param processes: Number of processes to tokenize files with; None
+            for one per CPU.
+        :rtype: PositionalIndex
+        """
+        started = time.time()
+        index_dir = os.path.expanduser(index_dir)
+        os.makedirs(index_dir, exist_ok=True)
+        if names is None:
+            names = [os.path.basename(path) for path in paths]
+
+        jobs = [(doc_id, path, language, tokenizer) for doc_id, path in enumerate(paths)]
+        term_docs = {}  # term -> document ids and numbers of positions, alternating
+        term_positions = {}  # term -> positions, delta-coded within each document
+        documents = []
+        offsets_path = os.path.join(index_dir, OFFSETS_NAME)
+        with open(offsets_path + '.tmp', 'wb') as offsets_file:
+            for doc_id, postings, offsets in cls._index_documents(jobs, processes):
+                documents.append({'path': paths[doc_id],
+                                  'name': names[doc_id],
+                                  'stamp': _file_stamp(paths[doc_id]),
+                                  'offset': offsets_file.tell(),
+                                  'tokens': len(offsets) // 2})
+                offsets_file.write(offsets.tobytes())
+                for term, positions in postings.items():
+                    if term not in term_docs:
+                        term_docs[term] = array('I')
+                        term_positions[term] = array('I')
+                    term_docs[term].extend((doc_id, len(positions)))
+                    term_positions[term].extend(_deltas(positions))
+
+        terms = {}
+        postings_path = os.path.join(index_dir, POSTINGS_NAME)
+        with open(postings_path + '.tmp', 'wb') as postings_file:
+            for term in sorted(term_docs):
+                docs = term_docs.pop(term)
+                block = array('I', [len(docs) // 2])
+                block.extend(_deltas(docs[0::2]))
+                block.extend(docs[1::2])
+                block.extend(term_positions.pop(term))
+                data = zlib.compress(block.tobytes())
+                terms[term] = (postings_file.tell(), len(data), len(docs) // 2)
+                postings_file.write(data)
+
+        lemmas = {}
+        if lemmatizer is not None:
+            sorted_terms = sorted(terms)
+            for term, lemma in zip(sorted_terms, lemmatizer(sorted_terms)):
+                lemmas.setdefault(_normalize(lemma), []).append(term)
+
+        lexicon = {'version': FORMAT_VERSION,
+                   'language': language,
+                   'tokenizer': tokenizer,
+                   'byteorder': sys.byteorder,
+                   'documents': documents,
+                   'terms': terms,
+                   'lemmas': lemmas}
+        lexicon_path = os.path.join(index_dir, LEXICON_NAME)
+        with open(lexicon_path + '.tmp', 'wb') as file_open:
+            pickle.dump(lexicon, file_open, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(postings_path + '.tmp', postings_path)
+        os.replace(offsets_path + '.tmp', offsets_path)
+        os.replace(lexicon_path + '.tmp', lexicon_path)
+        logger.info('Indexed %s tokens (%s terms) of %s documents in %.1f seconds.',
+                    sum(document['tokens'] for document in documents), len(terms),
+                    len(documents), time.time() - started)
+        return cls(index_dir)
+
+    @staticmethod
+    def _index_documents(jobs, processes):
+        """Yield the output of ``_index_document()`` for each job, in order."""
+        if processes == 1:
+            for job in jobs:
+                yield _index_document(job)
+        else:
+            with Pool(processes) as pool:
+                yield from pool.imap(_index_document, jobs)
+
+    def postings(self, term):
+        """Return the positions of a term in each document it occurs in.
+        :param term: An indexed term, i.e. case-folded.
+        :rtype: dict of document id to list of positions
+        """
+        entry = self._terms.get(term)
+        if entry is None:
+            return {}
+        offset, length, ndocs = entry
+        block = array('I')
+        block.frombytes(zlib.decompress(self._postings[offset:offset + length]))
+        if self._swap:
+            block.byteswap()
+        doc_ids = accumulate(block[1:1 + ndocs])
+        counts = block[1 + ndocs:1 + 2 * ndocs]
+        postings = {}
+        start = 1 + 2 * ndocs
+        for doc_id, count in zip(doc_ids, counts):
+            postings[doc_id] = list(accumulate(block[start:start + count]))
+            start += count
+        return postings
+
+    def query_words(self, word):
+        """Split a word of a query as the texts indexed were: 'virumque' is
+        looked up as 'virum' followed by 'que'. A lemma or a word with
+        wildcards is looked up as it is.
+        :rtype: list
+        """
+        if word.startswith('lemma:') or '*' in word or '?' in word:
+            return [word]
+        return [term for term, _, _ in _terms(word, self.tokenizer)]
+
+    def terms(self, word):
+        """Return the indexed terms a word of a query stands for: the terms
+        of a lemma ('lemma:amo'), those matching wildcards ('amic*'), or the
+        word itself, if it is a single token as split by
+        ``query_words()``.
+        :rtype: list
+        """
+        if word.startswith('lemma:'):
+            return self._lemmas.get(_normalize(word[len('lemma:'):]), [])
+        term = _normalize(word)
+        if '*' not in term and '?' not in term:
+            return [term] if term in self._terms else []
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._terms)
+        prefix = regex.split(r'[*?\[]', term, maxsplit=1)[0]
+        match = re.compile(fnmatch.translate(term)).match
+        matching = []
+        for candidate in self._sorted_terms[bisect.bisect_left(self._sorted_terms, prefix):]:
+            if not candidate.startswith(prefix):
+                break
+            if match(candidate):
+                matching.append(candidate)
+        return matching
+
+    def _word_positions(self, word):
+        """Return the positions of any of the terms of a query word, by
+        document."""
+        terms = self.terms(word)
+        positions = {}
+        for term in terms:
+            for doc_id, term_positions in self.postings(term).items():
+                positions.setdefault(doc_id, []).extend(term_positions)
+        if len(terms) > 1:
+            for doc_positions in positions.values():
+                doc_positions.sort()
+        return positions
+
+    def _phrase(self, words):
+        """Return the spans of token positions, start included and end
+        excluded, matching a phrase, by document."""
+        postings = [self._word_positions(word) for word in words]
+        doc_ids = set(postings[0]).intersection(*postings[1:])
+        spans = {}
+        for doc_id in doc_ids:
+            following = [set(word_postings[doc_id]) for word_postings in postings[1:]]
+            doc_spans = [(position, position + len(words)) for position in postings[0][doc_id]
+                         if all(position + i in positions
+                                for i, positions in enumerate(following, 1))]
+            if doc_spans:
+                spans[doc_id] = doc_spans
+        return spans
+
+    @staticmethod
+    def _near(left, right, distance):
+        """Return the spans covering a span of ``left`` and one of ``right``
+        at most ``distance`` tokens apart, i.e. with fewer than ``distance``
+        tokens between them, in either order."""
+        spans = {}
+        for doc_id in left.keys() & right.keys():
+            rights = sorted(right[doc_id])
+            starts = [start for start, _ in rights]
+            longest = max(end - start for start, end in rights)
+            doc_spans = set()
+            for start, end in left[doc_id]:
+                low = bisect.bisect_left(starts, start - distance + 1 - longest)
+                high = bisect.bisect_right(starts, end + distance - 1)
+                for right_start, right_end in rights[low:high]:
+                    gap = max(right_start - end, start - right_end)
+                    if 0 <= gap < distance:
+                        doc_spans.add((min(start, right_start), max(end, right_end)))
+            if doc_spans:
+                spans[doc_id] = sorted(doc_spans)
+        return spans
+
+    def _evaluate(self, query):
+        """Parse and run a query, returning spans of token positions by
+        document."""
+        parts = QUERY_PARTS.findall(query)
+        if not parts or len(parts) % 2 == 0:
+            raise ValueError("Malformed query '{}'.".format(query))
+        spans = None
+        distance = None
+        for i, part in enumerate(parts):
+            near = NEAR.fullmatch(part)
+            if i % 2:
+                if not near or not int(near.group(1)):
+                    raise ValueError("Expected 'NEAR/n' with n > 0, not '{0}', in query '{1}'.".format(part, query))
+                distance = int(near.group(1))
+                continue
+            if near:
+                raise ValueError("Malformed query '{}'.".format(query))
+            words = part.strip('"').split() if part.startswith('"') else [part]
+            if not words:
+                raise ValueError("Empty phrase in query '{}'.".format(query))
+            words = [split for word in words for split in self.query_words(word)]
+            operand = self._phrase(words) if words else {}
+            spans = operand if spans is None else self._near(spans, operand, distance)
+        return spans
+
+    def find(self, query):
+        """Return the matches of a query, by document and position.
+        :param query: E.g. 'amicitia', '"arma virumque"', 'amic* NEAR/5
+            lemma:fides'.
+        :rtype: list of tuples of document id, start and end character
+            offsets
+        """
+        matches = []
+        for doc_id, spans in sorted(self._evaluate(query).items()):
+            base = self.documents[doc_id]['offset']
+            for start, end in spans:
+                start_char = struct.unpack_from(self._offset_format, self._offsets, base + 8 * start)[0]
+                end_char = struct.unpack_from(self._offset_format, self._offsets, base + 8 * (end - 1))[1]
+                matches.append((doc_id, start_char, end_char))
+        return matches
+
+    def search(self, query, context):
+        """Yield (document name, match in context) for each match of a
+        query, formatted as by ``cltk.ir.query.match_regex()``.
+        :param query: See ``find()``.
+        :param context: Integer or 'sentence' 'paragraph'
+        :rtype: generator of tuples
+        """
+        if type(context) is str:
+            contexts = ['sentence', 'paragraph']
+            assert context in contexts or type(context) is int, 'Available contexts: {}'.format(contexts)
+        else:
+            context = int(context)
+
+        text_doc_id = None
+        for doc_id, start, end in self.find(query):
+            document = self.documents[doc_id]
+            if doc_id != text_doc_id:
+                if _file_stamp(document['path']) != document['stamp']:
+                    logger.warning("'%s' changed since it was indexed; build the index again.",
+                                   document['path'])
+                text = _read_text(document['path'])
+                text_doc_id = doc_id
+            match = _Span(text, start, end)
+            if context == 'sentence':
+                yield document['name'], _sentence_context(match, self.language)
+            elif context == 'paragraph':
+                yield document['name'], _paragraph_context(match)
+            else:
+                yield document['name'], _window_match(match, context)
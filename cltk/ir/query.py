@@ -8,8 +8,16 @@ TODO: Add option of outputting to plaintext file.
 TODO: For whatever output, generate statistics on # of matches found, # docs searched.
 """
 
+import bisect
+import heapq
+import locale
+import mmap
 import os
 import string
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from multiprocessing import Pool
 
 from cltk.corpus.greek.tlg_index import TLG_INDEX
 from cltk.corpus.latin.phi5_index import PHI5_INDEX
@@ -21,22 +29,125 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>']
 __license__ = 'MIT License. See LICENSE.'
 
 
+CORPUS_LANGUAGES = {'phi5': 'latin',
+                    'tlg': 'greek'}
+
+SENTENCE_PUNCTUATION = {'greek': r'\.|;',
+                        'latin': r'\.|\?|!'}
+
+# (1) Optional any whitespaces, (2) one newline, (3) optional any whitespaces.
+PARAGRAPH_BREAK = r'\s*?\n\s*?'
+
+_BOUNDARY_PATTERNS = {'paragraph': regex.compile(PARAGRAPH_BREAK, flags=regex.VERSION1)}
+_BOUNDARY_PATTERNS.update((language, regex.compile(punct, flags=regex.VERSION1))
+                          for language, punct in SENTENCE_PUNCTUATION.items())
+
+# Boundaries of the strings most recently searched, by id of the string and
+# kind of boundary; see ``_boundaries()``.
+_BOUNDARY_CACHE = OrderedDict()
+BOUNDARY_CACHE_SIZE = 8
+
+# Files memory-mapped by ``CorpusSearcher(mmap=True)``, by path. A module
+# global so that worker processes forked by a search inherit the mappings.
+_MAPPED_FILES = {}
+
+
+@lru_cache(maxsize=128)
+def _compile_patterns(patterns, case_insensitive=True):
+    """Compile each of several patterns, once for all the files searched.
+
+    The patterns are not joined into one alternation: the ``regex`` module
+    only uses its fast literal search on patterns without one, and for the
+    literal terms of a keyword expansion several such scans are much faster
+    than a single scan for the alternation.
+
+    :param patterns: Regular expression patterns.
+    :type patterns: tuple
+    :rtype: tuple of regex.Pattern
+    """
+    if case_insensitive:
+        flags = regex.IGNORECASE | regex.FULLCASE | regex.VERSION1
+    else:
+        flags = regex.VERSION1
+    return tuple(regex.compile(pattern, flags=flags) for pattern in patterns)
+
+
 def _regex_span(_regex, _str, case_insensitive=True):
     """Return all matches in an input string.
     :rtype : regex.match.span
-    :param _regex: A regular expression pattern.
+    :param _regex: A regular expression pattern, a compiled one, or a list
+        of either, the matches of which are returned in order of position.
     :param _str: Text on which to run the pattern.
     """
-    if case_insensitive:
-        flags = regex.IGNORECASE | regex.FULLCASE | regex.VERSION1
+    if isinstance(_regex, (str, regex.Pattern)):
+        _regex = [_regex]
+    comps = [comp if isinstance(comp, regex.Pattern) else
+             _compile_patterns((comp,), case_insensitive=case_insensitive)[0]
+             for comp in _regex]
+    if len(comps) == 1:
+        matches = comps[0].finditer(_str)
     else:
-        flags = regex.VERSION1
-    comp = regex.compile(_regex, flags=flags)
-    matches = comp.finditer(_str)
+        matches = heapq.merge(*(comp.finditer(_str) for comp in comps),
+                              key=lambda match: match.span())
     for match in matches:
         yield match
 
 
+def _slice_bounds(start, stop, length):
+    """Return the non-negative offsets a slice ``[start:stop]`` of a sequence
+    of ``length`` covers, as (start, stop) with stop >= start."""
+    start, stop, _ = slice(start, stop).indices(length)
+    return start, max(start, stop)
+
+
+def _substring(string, bounds, start, stop):
+    """Return ``string[bounds[0]:bounds[1]][start:stop]`` without making the
+    intermediate slice."""
+    offset, end = bounds
+    start, stop = _slice_bounds(start, stop, end - offset)
+    return string[offset + start:offset + stop]
+
+
+def _boundaries(string, kind):
+    """Return the sorted end offsets of the sentence boundaries of a language
+    (``kind`` 'greek' or 'latin') or of the paragraph boundaries (``kind``
+    'paragraph') in a string.
+
+    They are found once per string; the offsets for the strings most
+    recently searched are cached, so the context of each further match is
+    found by binary search.
+
+    :rtype: array
+    """
+    key = (id(string), kind)
+    cached = _BOUNDARY_CACHE.get(key)
+    if cached is not None and cached[0] is string:
+        _BOUNDARY_CACHE.move_to_end(key)
+        return cached[1]
+    comp = _BOUNDARY_PATTERNS[kind]
+    ends = array('I', [boundary.end() for boundary in comp.finditer(string)])
+    _BOUNDARY_CACHE[key] = (string, ends)
+    if len(_BOUNDARY_CACHE) > BOUNDARY_CACHE_SIZE:
+        _BOUNDARY_CACHE.popitem(last=False)
+    return ends
+
+
+def _last_end(ends, bounds):
+    """Return the last of ``ends`` that falls within ``bounds``, or None."""
+    i = bisect.bisect_right(ends, bounds[1]) - 1
+    if i >= 0 and ends[i] > bounds[0]:
+        return ends[i]
+    return None
+
+
+def _first_end(ends, bounds):
+    """Return the first of ``ends`` that falls within ``bounds``, or None."""
+    i = bisect.bisect_right(ends, bounds[0])
+    if i < len(ends) and ends[i] <= bounds[1]:
+        return ends[i]
+    return None
+
+
 def _sentence_context(match, language='latin', case_insensitive=True):
     """Take one incoming regex match object and return the sentence in which
      the match occurs.
@@ -46,8 +157,7 @@ def _sentence_context(match, language='latin', case_insensitive=True):
     :param language: str
     """
 
-    language_punct = {'greek': r'\.|;',
-                      'latin': r'\.|\?|!'}
+    language_punct = SENTENCE_PUNCTUATION
 
     assert language in language_punct.keys(), \
         'Available punctuation schemes: {}'.format(language_punct.keys())
@@ -55,32 +165,28 @@ def _sentence_context(match, language='latin', case_insensitive=True):
     start = match.start()
     end = match.end()
     window = 1000
-    snippet_left = match.string[start - window:start + 1]
-    snippet_right = match.string[end:end + window]
-    re_match = match.string[match.start():match.end()]
+    string = match.string
+    snippet_left = _slice_bounds(start - window, start + 1, len(string))
+    snippet_right = _slice_bounds(end, end + window, len(string))
+    re_match = string[start:end]
 
-    comp_sent_boundary = regex.compile(language_punct[language], flags=regex.VERSION1)
+    ends = _boundaries(string, language)
     # Left
-    left_punct = []
-    for punct in comp_sent_boundary.finditer(snippet_left):
-        end = punct.end()
-        left_punct.append(end)
-    try:
-        last_period = left_punct.pop() + 1
-    except IndexError:
+    left_punct = _last_end(ends, snippet_left)
+    if left_punct is None:
         last_period = 0
+    else:
+        last_period = left_punct - snippet_left[0] + 1
 
     # Right
-    right_punct = []
-    for punct in comp_sent_boundary.finditer(snippet_right):
-        end = punct.end()
-        right_punct.append(end)
-    try:
-        first_period = right_punct.pop(0)
-    except IndexError:
+    right_punct = _first_end(ends, snippet_right)
+    if right_punct is None:
         first_period = 0
+    else:
+        first_period = right_punct - snippet_right[0]
 
-    sentence = snippet_left[last_period:-1] + '*' + re_match + '*' + snippet_right[0:first_period]
+    sentence = _substring(string, snippet_left, last_period, -1) + '*' + re_match + '*' + \
+        _substring(string, snippet_right, 0, first_period)
 
     return sentence
 
@@ -95,34 +201,28 @@ def _paragraph_context(match):
     start = match.start()
     end = match.end()
     window = 100000
-    snippet_left = match.string[start - window:start + 1]
-    snippet_right = match.string[end:end + window]
-    re_match = match.string[match.start():match.end()]
+    string = match.string
+    snippet_left = _slice_bounds(start - window, start + 1, len(string))
+    snippet_right = _slice_bounds(end, end + window, len(string))
+    re_match = string[start:end]
 
-    # (1) Optional any whitespaces, (2) one newline, (3) optional any whitespaces.
-    para_break_pattern = r'\s*?\n\s*?'
-    comp_sent_boundary = regex.compile(para_break_pattern, flags=regex.VERSION1)
+    ends = _boundaries(string, 'paragraph')
     # Left
-    left_punct = []
-    for punct in comp_sent_boundary.finditer(snippet_left):
-        end = punct.end()
-        left_punct.append(end)
-    try:
-        last_period = left_punct.pop()
-    except IndexError:
+    left_punct = _last_end(ends, snippet_left)
+    if left_punct is None:
         last_period = 0
+    else:
+        last_period = left_punct - snippet_left[0]
 
     # Right
-    right_punct = []
-    for punct in comp_sent_boundary.finditer(snippet_right):
-        end = punct.end()
-        right_punct.append(end)
-    try:
-        first_period = right_punct.pop(0)
-    except IndexError:
+    right_punct = _first_end(ends, snippet_right)
+    if right_punct is None:
         first_period = 0
+    else:
+        first_period = right_punct - snippet_right[0]
 
-    sentence = snippet_left[last_period:-1] + '*' + re_match + '*' + snippet_right[0:first_period - 1]
+    sentence = _substring(string, snippet_left, last_period, -1) + '*' + re_match + '*' + \
+        _substring(string, snippet_right, 0, first_period - 1)
 
     # Remove any trailing whitespace. Necessary?
     #comp_final_space = regex.compile(r'\s*$')
@@ -158,7 +258,7 @@ def match_regex(input_str, pattern, language, context, case_insensitive=True):
       code currently in search_corpus.
 
     :param input_str:
-    :param pattern:
+    :param pattern: A pattern, a compiled pattern or a list of either.
     :param language:
     :param context: Integer or 'sentence' 'paragraph'
     :rtype : str
@@ -177,58 +277,174 @@ def match_regex(input_str, pattern, language, context, case_insensitive=True):
             yield _window_match(match, context)
 
 
-def search_corpus(pattern, corpus, context, case_insensitive=True, expand_keyword=False, lemmatized=False, threshold=0.70):
-    """Search for pattern in TLG or PHI5.
-    TODO: Cleanup hyphenation.
+def _strip_pattern(pattern):
+    """Strip escapes and punctuation off a pattern, leaving the word to look
+    up for keyword expansion."""
+    # First rm escaped chars
+    # TODO: Add '\u', '\U', '\x' to this list
+    escapes_list = [r'\a', r'\b', r'\f', r'\n', r'\r', r'\t', r'\v', r'\\']
+    escapes_str = '|'.join(escapes_list)
+    comp_escapes = regex.compile(escapes_str, flags=regex.VERSION1)
+    pattern = comp_escapes.sub('', pattern)
+    # Second rm remaining punctuation
+    punctuation = set(string.punctuation)
+    return ''.join(ch for ch in pattern if ch not in punctuation)
+
+
+def _read_text(path):
+    """Return the text of a corpus file, from its memory map if it has one.
+
+    Decoded as ``open()`` would, with the locale's encoding and universal
+    newlines.
+    """
+    mapped = _MAPPED_FILES.get(path)
+    if mapped is None:
+        with open(path) as file_open:
+            return file_open.read()
+    text = mapped[:].decode(locale.getpreferredencoding(False))
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _search_file(job):
+    """Search one corpus file; run in worker processes by
+    ``CorpusSearcher.search()``.
+    :param job: Tuple of file path, patterns, language, context and case
+        insensitivity.
+    :rtype: tuple of file path and list of matches in context
     """
+    path, patterns, language, context, case_insensitive = job
+    comps = _compile_patterns(patterns, case_insensitive=case_insensitive)
+    text = _read_text(path)
+    return path, list(match_regex(text, comps, language=language, context=context))
 
-    corpora = ['tlg', 'phi5']
-    assert corpus in corpora, "Available corpora: '{}'.".format(corpora)
 
-    if type(context) is str:
-        contexts = ['sentence', 'paragraph']
-        assert context in contexts or type(context) is int, 'Available contexts: {}'.format(contexts)
-    else:
-        context = int(context)
+class CorpusSearcher:
+    """Search the plaintext TLG or PHI5 with regular expressions.
+
+    The patterns of a query, e.g. the terms of a keyword expansion, are
+    compiled once for all files, and their matches in a file are returned
+    in order of position. Files may be scanned in a pool of worker processes; the
+    matches still come back in corpus order.
+
+    With ``mmap=True``, the corpus files are memory-mapped when the searcher
+    is made and stay mapped, and shared with the workers, until ``close()``,
+    so a series of queries does not reopen and reread every file.
+    """
 
-    if corpus == 'phi5':
-        lang = 'latin'
-        index = PHI5_INDEX
-        paths = assemble_phi5_author_filepaths()
-    elif corpus == 'tlg':
-        index = TLG_INDEX
-        lang = 'greek'
-        paths = assemble_tlg_author_filepaths()
-
-    if expand_keyword:
-        # Strip off all regex characters from pattern for Word2Vec lookup
-        # First rm escaped chars
-        # TODO: Add '\u', '\U', '\x' to this list
-        escapes_list = [r'\a', r'\b', r'\f', r'\n', r'\r', r'\t', r'\v', r'\\']
-        escapes_str = '|'.join(escapes_list)
-        comp_escapes = regex.compile(escapes_str, flags=regex.VERSION1)
-        pattern = comp_escapes.sub('', pattern)
-        # Second rm remaining punctuation
-        punctuation = set(string.punctuation)
-        pattern = ''.join(ch for ch in pattern if ch not in punctuation)
-        similar_vectors = _keyword_expander(pattern, lang, lemmatized=lemmatized, threshold=threshold)
+    def __init__(self, corpus, processes=1, mmap=False):
+        """
+        :param corpus: 'phi5' or 'tlg'
+        :param processes: Number of worker processes to scan files with;
+            ``None`` for one per CPU.
+        :param mmap: Keep the corpus files memory-mapped between queries.
+        """
+        corpora = ['tlg', 'phi5']
+        assert corpus in corpora, "Available corpora: '{}'.".format(corpora)
+        self.corpus = corpus
+        self.language = CORPUS_LANGUAGES[corpus]
+        self.processes = processes
+
+        if corpus == 'phi5':
+            self.index = PHI5_INDEX
+            self.paths = assemble_phi5_author_filepaths()
+        elif corpus == 'tlg':
+            self.index = TLG_INDEX
+            self.paths = assemble_tlg_author_filepaths()
+
+        self._mapped = []
+        if mmap:
+            self._map_files()
+
+    def _map_files(self):
+        """Memory-map every non-empty corpus file."""
+        for path in self.paths:
+            if path in _MAPPED_FILES or not os.path.getsize(path):
+                continue
+            with open(path, 'rb') as file_open:
+                _MAPPED_FILES[path] = mmap.mmap(file_open.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped.append(path)
+
+    def close(self):
+        """Unmap the files mapped by this searcher."""
+        for path in self._mapped:
+            _MAPPED_FILES.pop(path).close()
+        self._mapped = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def patterns(self, pattern, expand_keyword=False, lemmatized=False, threshold=0.70):
+        """Return the patterns a query searches for: the pattern itself or,
+        with ``expand_keyword``, its word and the similar terms found by
+        Word2Vec.
+        :rtype: list
+        """
+        if not expand_keyword:
+            return [pattern]
+        pattern = _strip_pattern(pattern)
+        similar_vectors = _keyword_expander(pattern, self.language, lemmatized=lemmatized,
+                                            threshold=threshold)
         print("The following similar terms will be added to the '{0}' query: '{1}'.".format(pattern, similar_vectors))
-        pattern = [pattern]
-        if similar_vectors:
-            pattern += similar_vectors
+        return [pattern] + list(similar_vectors or [])
+
+    def search(self, pattern, context, case_insensitive=True, expand_keyword=False,
+               lemmatized=False, threshold=0.70):
+        """Yield (author, match in context) for each match of a query, file
+        by file in corpus order and by position within a file.
+
+        :param pattern: A pattern or a list of patterns any of which may match.
+        :param context: Integer or 'sentence' 'paragraph'
+        :rtype: generator of tuples
+        """
+        if type(context) is str:
+            contexts = ['sentence', 'paragraph']
+            assert context in contexts or type(context) is int, 'Available contexts: {}'.format(contexts)
         else:
-            pattern = pattern
+            context = int(context)
 
-    for path in paths:
-        with open(path) as file_open:
-            text = file_open.read()
-        for one_pattern in pattern:
-            _matches = match_regex(text, one_pattern, language=lang, context=context, case_insensitive=case_insensitive)
-            for _match in _matches:
-                _id = os.path.split(path)[1][:-4]
-                author = index[_id]
+        if isinstance(pattern, str):
+            patterns = self.patterns(pattern, expand_keyword=expand_keyword,
+                                     lemmatized=lemmatized, threshold=threshold)
+        else:
+            patterns = list(pattern)
+        patterns = tuple(patterns)
+        _compile_patterns(patterns, case_insensitive=case_insensitive)  # fail before forking
+
+        jobs = [(path, patterns, self.language, context, case_insensitive) for path in self.paths]
+        for path, matches in self._search_files(jobs):
+            author = self.index[os.path.split(path)[1][:-4]]
+            for _match in matches:
                 yield (author, _match)
 
+    def _search_files(self, jobs):
+        """Yield (path, matches) for each file, in the order of ``jobs``."""
+        if self.processes == 1:
+            for job in jobs:
+                yield _search_file(job)
+        else:
+            with Pool(self.processes) as pool:
+                yield from pool.imap(_search_file, jobs)
+
+
+def search_corpus(pattern, corpus, context, case_insensitive=True, expand_keyword=False, lemmatized=False, threshold=0.70,
+                  processes=1):
+    """Search for pattern in TLG or PHI5.
+
+    For a series of queries, make a ``CorpusSearcher`` and call its
+    ``search()`` instead.
+
+    TODO: Cleanup hyphenation.
+    """
+    searcher = CorpusSearcher(corpus, processes=processes)
+    yield from searcher.search(pattern, context, case_insensitive=case_insensitive,
+                               expand_keyword=expand_keyword, lemmatized=lemmatized,
+                               threshold=threshold)
+
 
 def _keyword_expander(word, language, lemmatized=False, threshold=0.70):
     """Find similar terms in Word2Vec models. Accepts string and returns a
@@ -9,7 +9,9 @@ tasks. See here for more info on sequential backoff tagging in NLTK:
 http://www.nltk.org/_modules/nltk/tag/sequential.html
 """
 
+from functools import lru_cache
 import os
+import pickle
 import re
 
 from typing import List, Dict, Tuple, Set, Any, Generator
@@ -20,6 +22,7 @@ from nltk.tag.api import TaggerI
 from nltk.tag.sequential import SequentialBackoffTagger, ContextTagger, DefaultTagger, NgramTagger, UnigramTagger, RegexpTagger
 
 from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
 
 # Unused for now
@@ -47,8 +50,19 @@ class SequentialBackoffLemmatizer(SequentialBackoffTagger):
     :type _repr: Repr object
     :ivar _repr: An instance of Repr() from reprlib to handle list
         and dict length in subclass __repr__'s
+    :type context_free: bool
+    :cvar context_free: Whether ``choose_tag()`` depends only on the
+        token itself and not on its neighbours or history. If every
+        lemmatizer in a chain is context free, ``tag()`` lemmatizes each
+        distinct token once and reuses the result.
+    :type cache_size: int
+    :cvar cache_size: Maximum number of distinct tokens whose lemmas are
+        remembered by a context-free chain.
     """
 
+    context_free = False
+    cache_size = 2 ** 17
+
     def __init__(self: object, backoff: object, verbose: bool = False):
         """
         Setup for SequentialBackoffLemmatizer
@@ -69,6 +83,7 @@ class SequentialBackoffLemmatizer(SequentialBackoffTagger):
         self.repr = reprlib.Repr()
         self.repr.maxlist = 1
         self.repr.maxdict = 1
+        self._lemma_cache = None
 
     def tag(self: object, tokens: List[str]):
         """ Docs (mostly) inherited from TaggerI; cf.
@@ -84,18 +99,47 @@ class SequentialBackoffLemmatizer(SequentialBackoffTagger):
         :type tokens: list
         :param tokens: List of tokens to tag
         """
-        tags = []
-        taggers = []
-        for i in range(len(tokens)):
-            tag, tagger = self.tag_one(tokens, i, tags)
-            tags.append(tag)
-            taggers.append(str(tagger)) if tag else taggers.append(None)
+        if all(tagger.context_free for tagger in self._taggers):
+            lemma_cache = getattr(self, '_lemma_cache', None)
+            if lemma_cache is None:
+                lemma_cache = self._lemma_cache = lru_cache(maxsize=self.cache_size)(self._tag_type)
+            tagged = [lemma_cache(token) for token in tokens]
+            tags = [tag for tag, _ in tagged]
+            taggers = [tagger for _, tagger in tagged]
+        else:
+            tags = []
+            taggers = []
+            for i in range(len(tokens)):
+                tag, tagger = self.tag_one(tokens, i, tags)
+                tags.append(tag)
+                taggers.append(str(tagger)) if tag else taggers.append(None)
 
         if self.VERBOSE:
             return list(zip(tokens, tags, taggers))
         else:
             return list(zip(tokens, tags))
 
+    def _tag_type(self: object, token: str):
+        """
+        Lemmatize a single token out of context; only valid for chains
+        of context-free lemmatizers. Results are memoized by ``tag()``.
+
+        :rtype: tuple
+        :return: The lemma and the name of the lemmatizer that assigned it
+        """
+        tag, tagger = self.tag_one([token], 0, [])
+        return tag, (str(tagger) if tag else None)
+
+    def clear_cache(self: object):
+        """Forget memoized lemmas, e.g. after changing a lemmatizer's data."""
+        self._lemma_cache = None
+
+    def __getstate__(self: object):
+        """Leave the lemma cache out of pickles; it is rebuilt on use."""
+        state = self.__dict__.copy()
+        state['_lemma_cache'] = None
+        return state
+
     def tag_one(self: object, tokens: List[str], index: int, history: List[str]):
         """
         Determine an appropriate tag for the specified token, and
@@ -139,6 +183,8 @@ class DefaultLemmatizer(SequentialBackoffLemmatizer):
         [('arma', 'UNK'), ('virumque', 'UNK'), ('cano', 'UNK')]
 
     """
+    context_free = True
+
     def __init__(self: object, lemma: str = None, backoff: object = None, verbose: bool = False):
         self.lemma = lemma
         SequentialBackoffLemmatizer.__init__(self, backoff=None, verbose=verbose)
@@ -163,6 +209,8 @@ class IdentityLemmatizer(SequentialBackoffLemmatizer):
         [('arma', 'arma'), ('virumque', 'virumque'), ('cano', 'cano')]
 
     """
+    context_free = True
+
     def __init__(self: object, backoff: object = None, verbose: bool = False):
         SequentialBackoffLemmatizer.__init__(self, backoff=None, verbose=verbose)
 
@@ -178,6 +226,8 @@ class DictLemmatizer(SequentialBackoffLemmatizer):
     defining as its own class, it is clearer that this lemmatizer is
     based on dictionary lookup and does not use training data."""
 
+    context_free = True
+
     def __init__(self: object, lemmas:  List[str], backoff: object = None, source: str = None, verbose: bool = False):
         """
         Setup for DictLemmatizer().
@@ -202,9 +252,7 @@ class DictLemmatizer(SequentialBackoffLemmatizer):
         :type history: list
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
-        keys = self.lemmas.keys()
-        if tokens[index] in keys:
-            return self.lemmas[tokens[index]]
+        return self.lemmas.get(tokens[index])
 
     def __repr__(self: object):
         if self.source:
@@ -219,6 +267,8 @@ class UnigramLemmatizer(SequentialBackoffLemmatizer, UnigramTagger):
     defining as its own class, it is clearer that this lemmatizer is
     based on training data and not on dictionary.
     """
+    context_free = True
+
     def __init__(self: object, train=None, model=None, backoff: object = None, source: str = None, cutoff=0, verbose: bool = False):
         """
         Setup for UnigramLemmatizer()
@@ -237,6 +287,8 @@ class UnigramLemmatizer(SequentialBackoffLemmatizer, UnigramTagger):
 
 class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
     """"""
+    context_free = True
+
     def __init__(self: object, regexps=None, source=None, backoff=None, verbose: bool = False):
         """Setup for RegexpLemmatizer()
         :type regexps: list
@@ -246,6 +298,7 @@ class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
         SequentialBackoffLemmatizer.__init__(self, backoff=None, verbose=verbose)
         RegexpTagger.__init__(self, regexps, backoff)
         self._regexs = regexps
+        self._compiled_regexs = [(re.compile(pattern), replace) for pattern, replace in regexps]
         self.source = source
 
     def choose_tag(self: object, tokens: List[str], index: int, history: List[str]):
@@ -260,12 +313,71 @@ class RegexpLemmatizer(SequentialBackoffLemmatizer, RegexpTagger):
         :type history: list
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
-        for pattern, replace in self._regexs:
-            if re.search(pattern, tokens[index]):
-                return re.sub(pattern, replace, tokens[index])
+        token = tokens[index]
+        for pattern, replace in self._compiled_regexs:
+            if pattern.search(token):
+                return pattern.sub(replace, token)
 
     def __repr__(self: object):
         if self.source:
             return f'<{type(self).__name__}: {self.source}>'
         else:
             return f'<{type(self).__name__}: {self.repr.repr(self._regexs)}>'
+
+
+class PersistentBackoffLemmatizer(object):
+    """
+    Mixin for pre-built backoff chains (e.g. ``BackoffLatinLemmatizer``)
+    that adds ``save()`` and ``load()``. Building a chain means unpickling
+    the training data and retraining a UnigramLemmatizer; saving the
+    assembled chain once lets later processes skip all of that.
+
+    The artifact is a single versioned pickle holding the chain with its
+    dictionaries and compiled regexes, but not the raw training data.
+    Loading goes through the shared model registry, so every ``load()``
+    of the same file in a process returns the same chain; loading before
+    forking workers lets them share it copy-on-write.
+
+        >>> lemmatizer = BackoffLatinLemmatizer()  # doctest: +SKIP
+        >>> lemmatizer.save('latin_lemmatizer.pickle')  # doctest: +SKIP
+        >>> lemmatizer = BackoffLatinLemmatizer.load('latin_lemmatizer.pickle')  # doctest: +SKIP
+    """
+
+    ARTIFACT_VERSION = 1
+    # Training data needed only to build the chain, not to run it
+    _unsaved_attributes = ('train', 'pos_train_sents', 'train_sents')
+
+    def save(self: object, path: str):
+        """
+        Write the assembled backoff chain to ``path``.
+        :type path: str
+        :param path: File path for the artifact
+        """
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in self._unsaved_attributes}
+        artifact = {'artifact_version': self.ARTIFACT_VERSION,
+                    'class': type(self).__name__,
+                    'state': state}
+        with open(path, 'wb') as file_open:
+            pickle.dump(artifact, file_open, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Return a ready-to-use lemmatizer from an artifact written by
+        ``save()``, without retraining.
+        :rtype: object
+        :type path: str
+        :param path: File path to the artifact
+        """
+        artifact = load_model(path, loader=open_pickle)
+        if not isinstance(artifact, dict) or artifact.get('class') != cls.__name__:
+            raise ValueError(f'{path} is not a saved {cls.__name__}.')
+        if artifact.get('artifact_version') != cls.ARTIFACT_VERSION:
+            raise ValueError(f'{path} has artifact version {artifact.get("artifact_version")}; '
+                             f'{cls.__name__} reads version {cls.ARTIFACT_VERSION}. '
+                             f'Rebuild the lemmatizer and save it again.')
+        lemmatizer = cls.__new__(cls)
+        lemmatizer.__dict__.update(dict.fromkeys(cls._unsaved_attributes))
+        lemmatizer.__dict__.update(artifact['state'])
+        return lemmatizer
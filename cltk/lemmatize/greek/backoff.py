@@ -8,14 +8,15 @@ import os
 from typing import List, Dict, Tuple, Set, Any, Generator
 import reprlib
 
-from cltk.lemmatize.backoff import IdentityLemmatizer, DictLemmatizer, RegexpLemmatizer, UnigramLemmatizer
+from cltk.lemmatize.backoff import IdentityLemmatizer, DictLemmatizer, RegexpLemmatizer, UnigramLemmatizer, PersistentBackoffLemmatizer
 from cltk.lemmatize.greek.greek import greek_sub_patterns
 
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
-class BackoffGreekLemmatizer(object):
+class BackoffGreekLemmatizer(PersistentBackoffLemmatizer):
     """Suggested backoff chain; includes at least on of each
-    type of major sequential backoff class from backoff.py
+    type of major sequential backoff class from backoff.py; use ``save()``
+    and ``load()`` to reuse an assembled chain without retraining
     """
 
     models_path = os.path.normpath(get_cltk_data_dir() + '/greek/model/greek_models_cltk/lemmata/backoff')
@@ -26,9 +27,9 @@ class BackoffGreekLemmatizer(object):
         missing_models_message = "BackoffGreekLemmatizer requires the ```greek_models_cltk``` to be in cltk_data. Please load this corpus."
 
         try:
-            self.train =  open_pickle(os.path.join(self.models_path, 'greek_lemmatized_sents.pickle'))
-            self.GREEK_OLD_MODEL =  open_pickle(os.path.join(self.models_path, 'greek_lemmata_cltk.pickle'))
-            self.GREEK_MODEL =  open_pickle(os.path.join(self.models_path, 'greek_model.pickle'))
+            self.train =  load_model(os.path.join(self.models_path, 'greek_lemmatized_sents.pickle'), language='greek')
+            self.GREEK_OLD_MODEL =  load_model(os.path.join(self.models_path, 'greek_lemmata_cltk.pickle'), language='greek')
+            self.GREEK_MODEL =  load_model(os.path.join(self.models_path, 'greek_model.pickle'), language='greek')
         except FileNotFoundError as err:
             raise type(err)(missing_models_message)
 
@@ -39,6 +40,9 @@ class BackoffGreekLemmatizer(object):
 
         def _randomize_data(train: List[list], seed: int):
             import random
+            # Copy before shuffling; the loaded sentences are shared through
+            # the model registry.
+            train = list(train)
             random.seed(seed)
             random.shuffle(train)
             pos_train_sents = train[:4000]
@@ -9,10 +9,10 @@ import re
 from typing import List, Dict, Tuple, Set, Any, Generator
 import reprlib
 
-from cltk.lemmatize.backoff import DefaultLemmatizer, IdentityLemmatizer, DictLemmatizer, RegexpLemmatizer, UnigramLemmatizer
+from cltk.lemmatize.backoff import DefaultLemmatizer, IdentityLemmatizer, DictLemmatizer, RegexpLemmatizer, UnigramLemmatizer, PersistentBackoffLemmatizer
 from cltk.lemmatize.latin.latin import latin_sub_patterns, latin_pps, rn_patterns
 
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
 
 class RomanNumeralLemmatizer(RegexpLemmatizer):
@@ -46,7 +46,7 @@ class RomanNumeralLemmatizer(RegexpLemmatizer):
         :param history: List with tokens that have already been lemmatized; NOT USED
         """
         for pattern, replace in self._regexs:
-            if re.search(pattern, tokens[index]):
+            if pattern.search(tokens[index]):
                 if self.default:
                     return self.default
                 else:
@@ -55,9 +55,10 @@ class RomanNumeralLemmatizer(RegexpLemmatizer):
     def __repr__(self: object):
         return f'<{type(self).__name__}: CLTK Roman Numeral Patterns>'
 
-class BackoffLatinLemmatizer(object):
+class BackoffLatinLemmatizer(PersistentBackoffLemmatizer):
     """Suggested backoff chain; includes at least on of each
-    type of major sequential backoff class from backoff.py
+    type of major sequential backoff class from backoff.py; use ``save()``
+    and ``load()`` to reuse an assembled chain without retraining
 
     ### Putting it all together
     ### BETA Version of the Backoff Lemmatizer AKA BackoffLatinLemmatizer
@@ -73,9 +74,9 @@ class BackoffLatinLemmatizer(object):
         missing_models_message = "BackoffLatinLemmatizer requires the ```latin_models_cltk``` to be in cltk_data. Please load this corpus."
 
         try:
-            self.train =  open_pickle(os.path.join(self.models_path, 'latin_pos_lemmatized_sents.pickle'))
-            self.LATIN_OLD_MODEL =  open_pickle(os.path.join(self.models_path, 'latin_lemmata_cltk.pickle'))
-            self.LATIN_MODEL =  open_pickle(os.path.join(self.models_path, 'latin_model.pickle'))
+            self.train =  load_model(os.path.join(self.models_path, 'latin_pos_lemmatized_sents.pickle'), language='latin')
+            self.LATIN_OLD_MODEL =  load_model(os.path.join(self.models_path, 'latin_lemmata_cltk.pickle'), language='latin')
+            self.LATIN_MODEL =  load_model(os.path.join(self.models_path, 'latin_model.pickle'), language='latin')
         except FileNotFoundError as err:
             raise type(err)(missing_models_message)
 
@@ -86,6 +87,9 @@ class BackoffLatinLemmatizer(object):
 
         def _randomize_data(train: List[list], seed: int):
             import random
+            # Copy before shuffling; the loaded sentences are shared through
+            # the model registry.
+            train = list(train)
             random.seed(seed)
             random.shuffle(train)
             pos_train_sents = train[:4000]
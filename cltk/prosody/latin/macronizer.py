@@ -16,6 +16,7 @@ import importlib.machinery
 
 from cltk.tag.pos import POSTag
 from cltk.utils.cltk_logger import logger
+from cltk.utils.model_registry import load_model
 
 __author__ = ['Tyler Kirby <tyler.kirby9398@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
@@ -24,6 +25,13 @@ __license__ = 'MIT License. See LICENSE.'
 AVAILABLE_TAGGERS = ['tag_ngram_123_backoff', 'tag_tnt', 'tag_crf']
 
 
+def _load_macrons(path):
+    """Import the Morpheus vowel-length table from ``macrons.py``."""
+    loader = importlib.machinery.SourceFileLoader("macrons", path)
+    module = loader.load_module()
+    return module.vowel_len_map
+
+
 class Macronizer:
     """Macronize Latin words.
 
@@ -41,10 +49,7 @@ class Macronizer:
     def _setup_macrons_data(self):
         rel_path = get_cltk_data_dir() + "/latin/model/latin_models_cltk/taggers/macrons/macrons.py"
         path = os.path.expanduser(rel_path)
-        loader = importlib.machinery.SourceFileLoader("macrons", path)
-        module = loader.load_module()
-        macrons = module.vowel_len_map
-        return macrons
+        return load_model(path, language='latin', loader=_load_macrons)
 
     def _retrieve_tag(self, text):
         """Tag text with chosen tagger and clean tags.
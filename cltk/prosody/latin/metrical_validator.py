@@ -6,7 +6,7 @@ import logging
 from typing import List
 
 from cltk.prosody.latin.scansion_constants import ScansionConstants
-from Levenshtein import distance
+from cltk.text_reuse.distance import distances
 
 LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
@@ -212,8 +212,8 @@ class MetricalValidator:
         pattern = pattern.replace(self.constants.FOOT_SEPARATOR, "")
         ending = pattern[-1]
         candidate = pattern[:len(pattern) - 1] + self.constants.OPTIONAL_ENDING
-        cans = [(distance(candidate, x), x) for x in patterns
-                if len(x) == len(candidate)]
+        same_length = [x for x in patterns if len(x) == len(candidate)]
+        cans = list(zip(distances(candidate, same_length), same_length))
         if cans:
             cans = sorted(cans, key=lambda tup: tup[0])
             top = cans[0][0]
@@ -5,7 +5,9 @@ __author__ = ['Patrick J. Burns <patrick@diyclassics.org>']
 __license__ = 'MIT License. See LICENSE.'
 
 from abc import abstractmethod
+from array import array
 from collections import Counter
+from multiprocessing import Pool
 
 from cltk.utils.cltk_logger import logger
 
@@ -30,6 +32,12 @@ class Stoplist():
         except ImportError:
             self.numpy_installed = False
 
+        try:
+            from scipy import sparse
+            self.sparse = sparse
+        except ImportError:
+            self.numpy_installed = False
+
         try:
             from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 #            self.vectorizer = CountVectorizer(input='content') # Set df?
@@ -53,6 +61,17 @@ class Stoplist():
         return texts
 
 
+def _count_chunk(job):
+    """Count the terms of a chunk of preprocessed texts in a worker process.
+    :param job: Tuple of a vectorizer, whose analyzer splits texts into terms,
+        and a list of texts.
+    :rtype: list of (Counter, int) tuples
+    """
+    vectorizer, texts = job
+    analyze = vectorizer.build_analyzer()
+    return [(Counter(analyze(text)), len(text.split())) for text in texts]
+
+
 class BaseCorpusStoplist(Stoplist):
 
     def __init__(self, language=None):
@@ -63,26 +82,106 @@ class BaseCorpusStoplist(Stoplist):
             raise ImportError
         else:
             pass
+        self.reset()
 
 
-    def _make_dtm_vocab(self, texts):
-        dtm = self.vectorizer.fit_transform(texts)
-        dtm = dtm.toarray()
-        vocab = self.vectorizer.get_feature_names()
-        vocab = self.np.array(vocab)
-        return dtm, vocab
+    def reset(self):
+        """Discard the counts accumulated by ``partial_fit()``."""
+        # Document-term counts in CSR layout, with column ids in order of
+        # first appearance; kept in arrays so memory grows with non-zeros.
+        self._vocabulary = {}
+        self._indptr = array('q', [0])
+        self._indices = array('q')
+        self._counts = array('q')
+        self._raw_lengths = array('q')
+
+
+    def _preprocess(self, texts, lower=True, remove_punctuation=True, remove_numbers=True):
+        # Check 'texts' type for string
+        if isinstance(texts, str):
+            texts = [texts]
+
+        if lower:
+            texts = [text.lower() for text in texts]
+
+        if remove_punctuation:
+            texts = self._remove_punctuation(texts, self.punctuation)
+
+        if remove_numbers:
+            translator = str.maketrans({key: " " for key in '0123456789'})
+            texts = [text.translate(translator) for text in texts]
+
+        return texts
+
 
+    def _add_counts(self, counts, raw_length):
+        for term, count in counts.items():
+            self._indices.append(self._vocabulary.setdefault(term, len(self._vocabulary)))
+            self._counts.append(count)
+        self._indptr.append(len(self._indices))
+        self._raw_lengths.append(raw_length)
 
-    def _make_tfidf_vocab(self, texts):
-        tfidf = self.tfidf_vectorizer.fit_transform(texts)
-        tfidf = tfidf.toarray()
-        vocab = self.tfidf_vectorizer.get_feature_names()
+
+    def partial_fit(self, texts, lower=True, remove_punctuation=True,
+                    remove_numbers=True, processes=1, chunksize=256):
+        """
+        Add documents to the collection from which ``build_stoplist()``
+        extracts stopwords. Only term counts are kept, so a corpus can be
+        streamed through in batches; call ``build_stoplist()`` without texts
+        afterwards.
+        :param texts: list of strings (or a string) to add to the collection
+        :param lower: Lowercase texts or no?
+        :param remove_punctuation: Remove punctuation from texts or no?
+        :param remove_numbers: Remove numbers from texts or no?
+        :param processes: Number of worker processes counting terms; None for
+            one per CPU
+        :param chunksize: Number of texts sent to a worker at a time
+        :type texts: list
+        :type lower: bool
+        :type remove_punctuation: bool
+        :type remove_numbers: bool
+        :type processes: int
+        :type chunksize: int
+        :return: self
+        """
+        texts = self._preprocess(texts, lower, remove_punctuation, remove_numbers)
+
+        if processes == 1 or len(texts) <= chunksize:
+            for counts, raw_length in _count_chunk((self.vectorizer, texts)):
+                self._add_counts(counts, raw_length)
+        else:
+            jobs = ((self.vectorizer, texts[i:i + chunksize])
+                    for i in range(0, len(texts), chunksize))
+            with Pool(processes) as pool:
+                for chunk in pool.imap(_count_chunk, jobs):
+                    for counts, raw_length in chunk:
+                        self._add_counts(counts, raw_length)
+        return self
+
+
+    def _make_dtm_vocab(self):
+        # Order the vocabulary alphabetically, as CountVectorizer does
+        vocab = sorted(self._vocabulary)
+        columns = self.np.empty(len(vocab), dtype=self.np.int64)
+        columns[[self._vocabulary[term] for term in vocab]] = self.np.arange(len(vocab))
+        indices = columns[self.np.array(self._indices, dtype=self.np.int64)]
+        dtm = self.sparse.csr_matrix((self.np.array(self._counts, dtype=self.np.int64),
+                                      indices,
+                                      self.np.array(self._indptr, dtype=self.np.int64)),
+                                     shape=(len(self._raw_lengths), len(vocab)))
+        dtm.sort_indices()
         vocab = self.np.array(vocab)
-        return tfidf, vocab
+        return dtm, vocab
 
 
-    def _get_raw_lengths(self, texts):
-        return [len(tokens.split()) for tokens in texts] # Use tokenizer rather than split?
+    def _make_tfidf(self, dtm):
+        # Same weighting as self.tfidf_vectorizer, applied to the counts
+        from sklearn.feature_extraction.text import TfidfTransformer
+        transformer = TfidfTransformer(norm=self.tfidf_vectorizer.norm,
+                                       use_idf=self.tfidf_vectorizer.use_idf,
+                                       smooth_idf=self.tfidf_vectorizer.smooth_idf,
+                                       sublinear_tf=self.tfidf_vectorizer.sublinear_tf)
+        return transformer.fit_transform(dtm)
 
 
     def _get_length_array(self, raw_lengths):
@@ -92,7 +191,8 @@ class BaseCorpusStoplist(Stoplist):
 
 
     def _get_probabilities(self, dtm, length_array):
-        return dtm / length_array
+        with self.np.errstate(divide='ignore'):
+            return self.sparse.csr_matrix(dtm.multiply(1 / length_array))
 
 
     def _get_mean_probabilities(self, P, N):
@@ -102,16 +202,17 @@ class BaseCorpusStoplist(Stoplist):
 
 
     def _get_variance_probabilities(self, bP, P, N):
-        variance = (P-bP) ** 2
+        # Terms absent from a document have P == bP == 0 there, so only the
+        # stored entries contribute
+        variance = (P-bP).power(2)
         variance_sum = self.np.ravel(variance.sum(axis=0))
         return variance_sum / N
 
 
     def _get_entropies(self, P):
-        with self.np.errstate(divide='ignore', invalid='ignore'):
-            logprobs = self.np.where(P != 0, self.np.log10(1/P), 0)
-            ent = P * logprobs
-            return self.np.ravel(ent.sum(axis=0))
+        ent = P.copy()
+        ent.data = P.data * self.np.log10(1/P.data)
+        return self.np.ravel(ent.sum(axis=0))
 
 
     def _combine_vocabulary(self, vocab, measure):
@@ -132,11 +233,12 @@ class BaseCorpusStoplist(Stoplist):
         return sorted(scores.keys(), key=lambda elem: scores[elem], reverse=True)
 
 
-    def build_stoplist(self, texts, basis='zou', size=100, sort_words=True,
+    def build_stoplist(self, texts=None, basis='zou', size=100, sort_words=True,
                         inc_values=False, lower=True, remove_punctuation = True,
-                        remove_numbers=True, include =[], exclude=[]):
+                        remove_numbers=True, include =[], exclude=[], processes=1):
         """
-        :param texts: list of strings used as document collection for extracting stopwords
+        :param texts: list of strings used as document collection for extracting stopwords;
+            if None, the documents previously added with ``partial_fit()`` are used
         :param basis: Define the basis for extracting stopwords from the corpus. Available methods are:
                       - 'frequency', word counts
                       - 'mean', mean probabilities
@@ -158,6 +260,8 @@ class BaseCorpusStoplist(Stoplist):
         :param exclude: List of words in addition to stopwords that are
             extracted from the document collection to be removed from the final
             list
+        :param processes: Number of worker processes counting terms; None for
+            one per CPU
         :type texts: list
         :type basis: str
         :type size: int
@@ -168,34 +272,25 @@ class BaseCorpusStoplist(Stoplist):
         :type remove_numbers: bool
         :type include: list
         :type exclude: list
+        :type processes: int
         :return: a list of stopwords extracted from the corpus
         :rtype: list
         """
 
-        # Check 'texts' type for string
-        if isinstance(texts, str):
-            texts = [texts]
-
-        # Move all of this preprocessing code outside 'build_stoplist'
-        if lower:
-            texts = [text.lower() for text in texts]
-
-        if remove_punctuation:
-            texts = self._remove_punctuation(texts, self.punctuation)
-
-        if remove_numbers:
-            translator = str.maketrans({key: " " for key in '0123456789'})
-            texts = [text.translate(translator) for text in texts]
+        if texts is not None:
+            self.reset()
+            self.partial_fit(texts, lower=lower, remove_punctuation=remove_punctuation,
+                             remove_numbers=remove_numbers, processes=processes)
 
-        # Get DTM and basic descriptive info
-        dtm, vocab = self._make_dtm_vocab(texts)
-        tfidf, _ = self._make_tfidf_vocab(texts)
+        # Get sparse DTM and basic descriptive info
+        dtm, vocab = self._make_dtm_vocab()
+        tfidf = self._make_tfidf(dtm)
 
         M = len(vocab)
-        N = len(texts)
+        N = dtm.shape[0]
 
         # Calculate probabilities
-        raw_lengths = self._get_raw_lengths(texts)
+        raw_lengths = self._raw_lengths
         l = self._get_length_array(raw_lengths)
         P = self._get_probabilities(dtm, l)
 
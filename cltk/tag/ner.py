@@ -1,8 +1,13 @@
 """Named entity recognition (NER)."""
 
+from collections import deque
+from functools import partial
+from typing import Deque, Generator, Iterable, List, Tuple
+
 from cltk.corpus.utils.importer import CorpusImporter
 from nltk.tokenize.punkt import PunktLanguageVars
 from cltk.tokenize.word import WordTokenizer
+from cltk.utils.model_registry import load_model
 import os
 import importlib.machinery
 
@@ -13,11 +18,141 @@ NER_DICT = {'greek': get_cltk_data_dir() + '/greek/model/greek_models_cltk/ner/p
             'latin': get_cltk_data_dir() + '/latin/model/latin_models_cltk/ner/proper_names.txt'}
 
 
+_END = None  # marks the end of a name in NERTagger's trie
+
+
+class NERTagger:
+    """Gazetteer-based named entity tagger. The list of names is loaded once
+    into a token trie, so tagging takes one dict lookup per token plus one per
+    extra token of a multi-word name. The longest matching name wins.
+
+    >>> tagger = NERTagger(names=['Sirius', 'Marcus Tullius Cicero'])
+    >>> tagger.tag('ut Sirius et Marcus Tullius Cicero'.split())
+    [('ut',), ('Sirius', 'Entity'), ('et',), ('Marcus Tullius Cicero', 'Entity')]
+    """
+
+    def __init__(self, lang: str = None, names: Iterable[str] = None):
+        """
+        :param lang: Language whose proper names file in ``cltk_data`` to use.
+        :type lang: str
+        :param names: Names to use instead of a language's file; multi-word
+            names are separated by whitespace.
+        :type names: iterable
+        """
+        if names is None:
+            assert lang in NER_DICT.keys(), \
+                'Invalid language. Choose from: {}'.format(', '.join(NER_DICT.keys()))
+            _check_latest_data(lang)
+            with open(os.path.expanduser(NER_DICT[lang])) as file_open:
+                names = file_open.read().split('\n')
+        self.lang = lang
+        self._trie = {}
+        self._max_len = 1
+        for name in names:
+            tokens = name.split()
+            if not tokens:
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_END] = True
+            self._max_len = max(self._max_len, len(tokens))
+
+    @classmethod
+    def from_file(cls, path: str, lang: str = None):
+        """Build a tagger from a file with one name per line.
+        :param path: Path to the names file.
+        :type path: str
+        :rtype: NERTagger
+        """
+        with open(path) as file_open:
+            return cls(lang=lang, names=file_open.read().split('\n'))
+
+    def _tag_head(self, buffer: Deque[str]) -> Tuple[str, ...]:
+        """Tag the token (or longest name) at the start of ``buffer`` and
+        remove it from the buffer."""
+        node = self._trie
+        match_len = 0
+        for index, token in enumerate(buffer):
+            node = node.get(token)
+            if node is None:
+                break
+            if _END in node:
+                match_len = index + 1
+        if not match_len:
+            return (buffer.popleft(),)
+        name = ' '.join(buffer.popleft() for _ in range(match_len))
+        return (name, 'Entity')
+
+    def tag_iter(self, tokens: Iterable[str]) -> Generator[Tuple[str, ...], None, None]:
+        """Tag a stream of tokens lazily, holding at most as many tokens as
+        the longest name in memory.
+        :param tokens: Iterable of word tokens.
+        :type tokens: iterable
+        :rtype: generator of ``(token,)`` or ``(name, 'Entity')`` tuples
+        """
+        buffer = deque()
+        for token in tokens:
+            buffer.append(token)
+            if len(buffer) >= self._max_len:
+                yield self._tag_head(buffer)
+        while buffer:
+            yield self._tag_head(buffer)
+
+    def tag(self, tokens: List[str]) -> List[Tuple[str, ...]]:
+        """Tag a list of tokens.
+        :param tokens: List of word tokens.
+        :type tokens: list
+        :rtype: list of ``(token,)`` or ``(name, 'Entity')`` tuples
+        """
+        return list(self.tag_iter(tokens))
+
+    def tag_batch(self, texts: Iterable) -> Generator[List[Tuple[str, ...]], None, None]:
+        """Tag many texts, yielding one tagged list per text.
+        :param texts: Untokenized strings or lists of tokens.
+        :type texts: iterable
+        :rtype: generator of lists
+        """
+        for text in texts:
+            if isinstance(text, str):
+                text = _tokenize_ner(text)
+            yield self.tag(text)
+
+
+# One loader per language, so that the model registry keys each gazetteer stably.
+_NER_LOADERS = {lang: partial(NERTagger.from_file, lang=lang) for lang in NER_DICT}
+
+
+def _tokenize_ner(input_text: str) -> List[str]:
+    """Split text into word tokens for NER, detaching final periods."""
+    punkt = PunktLanguageVars()
+    tokens = punkt.word_tokenize(input_text)
+    new_tokens = []
+    for word in tokens:
+        if word.endswith('.'):
+            new_tokens.append(word[:-1])
+            new_tokens.append('.')
+        else:
+            new_tokens.append(word)
+    return new_tokens
+
+
+def _load_french_entities(path: str):
+    """Import the list of French (name, kind) entities."""
+    loader = importlib.machinery.SourceFileLoader('entities', path)
+    module = loader.load_module()
+    return module.entities
+
+
 class NamedEntityReplacer(object):
 
     def __init__(self):
 
         self.entities = self._load_necessary_data()
+        # First kind listed for each name, as found by a linear scan
+        self._entity_kinds = {}
+        for name, kind in reversed(self.entities):
+            self._entity_kinds[name] = kind
 
 
     def _load_necessary_data(self):
@@ -26,34 +161,20 @@ class NamedEntityReplacer(object):
                                 'text', 'french_data_cltk',
                                 'named_entities_fr.py')
         path = os.path.expanduser(rel_path)
-        # logger.info('Loading entries. This may take a minute.')
-        loader = importlib.machinery.SourceFileLoader('entities', path)
-        module = loader.load_module()
-        entities = module.entities
-        return entities
+        return load_model(path, language='french', loader=_load_french_entities)
 
     """tags named entities in a string and outputs a list of tuples in the following format:
     (name, "entity", kind_of_entity)"""
 
     def tag_ner_fr(self, input_text, output_type=list):
 
-        entities = self.entities
-
-        for entity in entities:
-            (name, kind) = entity
-
         word_tokenizer = WordTokenizer('french')
         tokenized_text = word_tokenizer.tokenize(input_text)
         ner_tuple_list = []
 
-        match = False
         for word in tokenized_text:
-            for name, kind in entities:
-                if word == name:
-                    named_things = ([(name, 'entity', kind)])
-                    ner_tuple_list.append(named_things)
-                    match = True
-                    break
+            if word in self._entity_kinds:
+                ner_tuple_list.append([(word, 'entity', self._entity_kinds[word])])
             else:
                 ner_tuple_list.append((word,))
         return ner_tuple_list
@@ -85,34 +206,11 @@ def tag_ner(lang, input_text, output_type=list):
     assert output_type in types, 'Output must be a {}.'.format(', '.join(types))
 
     if type(input_text) == str:
-        punkt = PunktLanguageVars()
-        tokens = punkt.word_tokenize(input_text)
-        new_tokens = []
-        for word in tokens:
-            if word.endswith('.'):
-                new_tokens.append(word[:-1])
-                new_tokens.append('.')
-            else:
-                new_tokens.append(word)
-        input_text = new_tokens
+        input_text = _tokenize_ner(input_text)
 
     ner_file_path = os.path.expanduser(NER_DICT[lang])
-    with open(ner_file_path) as file_open:
-        ner_str = file_open.read()
-    ner_list = ner_str.split('\n')
-
-    ner_tuple_list = []
-    for count, word_token in enumerate(input_text):
-        match = False
-        for ner_word in ner_list:
-            # the replacer slows things down, but is necessary
-            if word_token == ner_word:
-                ner_tuple = (word_token, 'Entity')
-                ner_tuple_list.append(ner_tuple)
-                match = True
-                break
-        if not match:
-            ner_tuple_list.append((word_token,))
+    tagger = load_model(ner_file_path, language=lang, loader=_NER_LOADERS[lang])
+    ner_tuple_list = tagger.tag(input_text)
 
     if output_type is str:
         string = ''
@@ -1,11 +1,15 @@
 """Tag part of speech (POS) using CLTK taggers."""
 
+from itertools import islice
+from multiprocessing import Pool
 import os
+from typing import Generator, Iterable, List, Tuple, Union
 
 from nltk.tag import CRFTagger
 from nltk.tokenize import wordpunct_tokenize
 
 from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
 
 __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>']
@@ -44,6 +48,39 @@ TAGGERS = {'greek':
            }}
 
 
+def _load_crf_tagger(path: str):
+    """Set up a ``CRFTagger`` for the given model file.
+    :param path: File path to the CRF model.
+    :type path: str
+    :rtype : CRFTagger
+    """
+    tagger = CRFTagger()
+    tagger.set_model_file(path)
+    return tagger
+
+
+def _chunk(items: Iterable, size: int) -> Generator[list, None, None]:
+    """Yield successive lists of at most ``size`` items."""
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _tag_chunk(job: Tuple[str, str, str, List[List[str]]]) -> List[List[Tuple[str, str]]]:
+    """Tag a chunk of tokenized sentences in a worker process; the tagger is
+    loaded once per worker through the model registry.
+    :param job: Tuple of language, tagger key, model path and sentences.
+    :rtype : list
+    """
+    language, tagger_key, path, sentences = job
+    loader = _load_crf_tagger if tagger_key == 'crf' else open_pickle
+    tagger = load_model(path, language=language, loader=loader)
+    return [tagger.tag(tokens) for tokens in sentences]
+
+
 class POSTag:
     """Tag words' parts-of-speech."""
 
@@ -72,6 +109,18 @@ class POSTag:
             tagger_paths[tagger_key] = tagger_path
         return tagger_paths
 
+    def _load_tagger(self, tagger_key: str):
+        """Fetch a trained tagger from the shared model registry, so that
+        the pickle is read from disk only once per process.
+        :param tagger_key: Key of the tagger in ``TAGGERS``, e.g. 'tnt'.
+        :type tagger_key: str
+        :rtype : object
+        """
+        loader = _load_crf_tagger if tagger_key == 'crf' else open_pickle
+        return load_model(self.available_taggers[tagger_key],
+                          language=self.language,
+                          loader=loader)
+
     def tag_unigram(self, untagged_string: str):
         """Tag POS with unigram tagger.
         :type untagged_string: str
@@ -79,8 +128,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['unigram']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('unigram')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
 
@@ -91,8 +139,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['bigram']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('bigram')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
 
@@ -103,8 +150,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['trigram']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('trigram')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
 
@@ -115,8 +161,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['ngram_123_backoff']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('ngram_123_backoff')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
     
@@ -127,8 +172,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['ngram_12_backoff']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('ngram_12_backoff')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text     
     
@@ -139,8 +183,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['tnt']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('tnt')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
 
@@ -151,9 +194,7 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['crf']
-        tagger = CRFTagger()
-        tagger.set_model_file(pickle_path)
+        tagger = self._load_tagger('crf')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
 
@@ -164,7 +205,50 @@ class POSTag:
         :rtype tagged_text: str
         """
         untagged_tokens = wordpunct_tokenize(untagged_string)
-        pickle_path = self.available_taggers['perceptron']
-        tagger = open_pickle(pickle_path)
+        tagger = self._load_tagger('perceptron')
         tagged_text = tagger.tag(untagged_tokens)
         return tagged_text
+
+    def tag_batch(self, sentences: Iterable[Union[str, List[str]]], tagger: str = 'tnt',
+                  tokenized: bool = False, processes: int = None, chunksize: int = 256):
+        """Tag many sentences with one tagger, loading the model only once.
+        Results are yielded lazily and in input order.
+
+        >>> tagger = POSTag('latin')  # doctest: +SKIP
+        >>> list(tagger.tag_batch(['Gallia est omnis divisa', 'in partes tres']))  # doctest: +SKIP
+        [[('Gallia', 'N-S---FN-'), ...], [('in', 'R--------'), ...]]
+
+        :param sentences: Untokenized strings, or lists of tokens if
+            ``tokenized`` is True.
+        :type sentences: iterable
+        :param tagger: Key of the tagger to use, e.g. 'tnt', 'crf' or
+            'ngram_123_backoff'.
+        :type tagger: str
+        :param tokenized: Whether ``sentences`` are already lists of tokens;
+            otherwise each is split with ``wordpunct_tokenize()``.
+        :type tokenized: bool
+        :param processes: If greater than 1, tag chunks of sentences in a
+            pool of this many worker processes.
+        :type processes: int
+        :param chunksize: Number of sentences sent to a worker at a time.
+        :type chunksize: int
+        :rtype : generator of lists of (token, tag) tuples
+        """
+        assert tagger in self.available_taggers, \
+            'Tagger {0} not available for {1}.'.format(tagger, self.language)
+        if tokenized:
+            token_lists = sentences
+        else:
+            token_lists = (wordpunct_tokenize(sentence) for sentence in sentences)
+
+        if processes and processes > 1:
+            path = self.available_taggers[tagger]
+            jobs = ((self.language, tagger, path, chunk)
+                    for chunk in _chunk(token_lists, chunksize))
+            with Pool(processes) as pool:
+                for tagged_chunk in pool.imap(_tag_chunk, jobs):
+                    yield from tagged_chunk
+        else:
+            model = self._load_tagger(tagger)
+            for tokens in token_lists:
+                yield model.tag(tokens)
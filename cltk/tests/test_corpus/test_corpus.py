@@ -1,6 +1,8 @@
 """Test cltk.corpus."""
 from unicodedata import normalize
+import json
 import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -29,7 +31,11 @@ from cltk.corpus.greek.tlg.parse_tlg_indices import get_date_of_author
 from cltk.corpus.greek.tlg.parse_tlg_indices import _get_epoch
 from cltk.corpus.greek.tlg.parse_tlg_indices import _check_number
 from cltk.corpus.greek.tlg.parse_tlg_indices import _handle_splits
+from cltk.corpus.greek.tlg_index import TLG_INDEX
 from cltk.corpus.greek.tlgu import TLGU
+from cltk.corpus.greek.tlgu import _convert_files
+from cltk.corpus.greek.tlgu import _run_tlgu
+from cltk.corpus.latin.phi5_index import PHI5_WORKS_INDEX
 from cltk.corpus.middle_english.alphabet import normalize_middle_english
 from cltk.corpus.old_norse import runes
 from cltk.corpus.utils.formatter import assemble_phi5_author_filepaths
@@ -37,11 +43,15 @@ from cltk.corpus.utils.formatter import assemble_phi5_works_filepaths
 from cltk.corpus.utils.formatter import assemble_tlg_author_filepaths
 from cltk.corpus.utils.formatter import assemble_tlg_works_filepaths
 from cltk.corpus.utils.formatter import phi5_plaintext_cleanup
+from cltk.corpus.utils.formatter import phi5_plaintext_cleanup_lines
 from cltk.corpus.utils.formatter import remove_non_ascii
 from cltk.corpus.utils.formatter import remove_non_latin
 from cltk.corpus.utils.formatter import tonos_oxia_converter
 from cltk.corpus.utils.formatter import tlg_plaintext_cleanup
+from cltk.corpus.utils.formatter import tlg_plaintext_cleanup_lines
 from cltk.corpus.utils.formatter import cltk_normalize
+from cltk.corpus.utils.index_file import LazyIndex
+from cltk.corpus.utils.index_file import write_index
 from cltk.corpus.utils.importer import CorpusImporter
 from cltk.corpus.utils.importer import CorpusImportError
 from cltk.corpus.sanskrit.itrans.itrans_transliterator import *
@@ -57,6 +67,9 @@ from cltk.corpus.aramaic.transliterate import square_to_imperial
 from cltk.corpus.utils.formatter import normalize_fr
 from cltk.corpus.swadesh import Swadesh
 from cltk.corpus.readers import assemble_corpus, get_corpus_reader
+from cltk.corpus.readers import FilteredPlaintextCorpusReader, JsonfileCorpusReader
+from cltk.tokenize.sentence import BaseRegexSentenceTokenizer
+from cltk.tokenize.word import WordTokenizer
 from cltk.corpus.latin.latin_library_corpus_types import (
     corpus_texts_by_type,
     corpus_directories_by_type,
@@ -856,6 +869,303 @@ class TestFilteredCorpus(unittest.TestCase):
         self.assertTrue(len(list(self.reader.sizes())) > 0)
 
 
+class TestFilteredCorpusCache(unittest.TestCase):
+    """Test the token cache of the filtered corpus reader"""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.root.name, "aeneid.txt"), "w") as file_open:
+            file_open.write("Arma virumque cano, Troiae qui primus ab oris.\n"
+                            "Italiam fato profugus venit.\n\n"
+                            "The Latin Library\n\n"
+                            "Musa, mihi causas memora! Quo numine laeso?\n")
+        with open(os.path.join(self.root.name, "empty.txt"), "w") as file_open:
+            file_open.write("")
+
+    def tearDown(self):
+        self.root.cleanup()
+        self.cache_dir.cleanup()
+
+    def make_reader(self, **kwargs):
+        return FilteredPlaintextCorpusReader(
+            root=self.root.name,
+            sent_tokenizer=BaseRegexSentenceTokenizer("latin", sent_end_chars=[".", "?", "!"]),
+            word_tokenizer=WordTokenizer("latin"),
+            skip_keywords=["Library"],
+            **kwargs
+        )
+
+    def test_filtered_corpus_reader_cache(self):
+        """Test that cached passes return what tokenizing does"""
+        reader = self.make_reader()
+        target = (list(reader.paras()), list(reader.sents()), list(reader.words()))
+        self.assertEqual(len(target[0]), 2)
+        self.assertEqual(target[1][1], ["Italiam", "fato", "profugus", "venit", "."])
+        cached_reader = self.make_reader(cache_dir=self.cache_dir.name)
+        for _ in range(2):
+            self.assertEqual((list(cached_reader.paras()), list(cached_reader.sents()),
+                              list(cached_reader.words())), target)
+        self.assertTrue(os.path.isfile(os.path.join(self.cache_dir.name, "aeneid.txt.tokens")))
+        reopened_reader = self.make_reader(cache_dir=self.cache_dir.name)
+        self.assertEqual(list(reopened_reader.sents("aeneid.txt")), target[1])
+
+    def test_filtered_corpus_reader_cache_update(self):
+        """Test that a file changed on disk is tokenized again"""
+        reader = self.make_reader(cache_dir=self.cache_dir.name, processes=2)
+        sents = list(reader.sents())
+        path = os.path.join(self.root.name, "aeneid.txt")
+        with open(path, "a") as file_open:
+            file_open.write("\nUrbs antiqua fuit.\n")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+        reader = self.make_reader(cache_dir=self.cache_dir.name)
+        self.assertEqual(list(reader.sents()), sents + [["Urbs", "antiqua", "fuit", "."], []])
+
+    def test_filtered_corpus_reader_shared_cache(self):
+        """Test that readers filling one cache in turn never mix up their vocabularies"""
+        with open(os.path.join(self.root.name, "georgica.txt"), "w") as file_open:
+            file_open.write("Quid faciat laetas segetes?\n")
+        target = list(self.make_reader().sents())
+        first = self.make_reader(cache_dir=self.cache_dir.name)
+        second = self.make_reader(cache_dir=self.cache_dir.name)
+        list(first.sents("empty.txt"))
+        list(second.sents("empty.txt"))
+        list(first.sents("georgica.txt"))
+        list(second.sents("aeneid.txt"))
+        list(first.sents("aeneid.txt"))
+        list(second.sents("georgica.txt"))
+        for reader in (first, second, self.make_reader(cache_dir=self.cache_dir.name)):
+            self.assertEqual(list(reader.sents()), target)
+
+
+class TestJsonfileCorpusReader(unittest.TestCase):
+    """Test the parsing modes and parsed cache of the JSON corpus reader"""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.root.name, "aeneid_latin.json")
+        self.write_doc({"2": "Musa, mihi causas memora! Quo numine laeso?",
+                        "1": {"2": "Italiam fato profugus venit.",
+                              "1": "Arma virumque cano, Troiae qui primus ab oris."},
+                        "3": "The Latin Library"})
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def write_doc(self, text):
+        with open(self.path, "w") as file_open:
+            json.dump({"author": "Vergil", "meta": {"book": "}"}, "text": text}, file_open)
+
+    def make_reader(self, **kwargs):
+        return JsonfileCorpusReader(
+            root=self.root.name,
+            sent_tokenizer=BaseRegexSentenceTokenizer("latin", sent_end_chars=[".", "?", "!"]),
+            word_tokenizer=WordTokenizer("latin"),
+            skip_keywords=["Library"],
+            target_language="latin",
+            **kwargs
+        )
+
+    def test_json_corpus_reader_modes(self):
+        """Test that streaming and parallel reading return what parsing each file does"""
+        reader = self.make_reader()
+        paras = list(reader.paras())
+        self.assertEqual(paras, ["Arma virumque cano, Troiae qui primus ab oris.",
+                                 "Italiam fato profugus venit.",
+                                 "Musa, mihi causas memora! Quo numine laeso?"])
+        self.assertEqual(list(self.make_reader(streaming=True).paras()),
+                         [paras[2], paras[1], paras[0]])
+        parallel_reader = self.make_reader(processes=2)
+        self.assertEqual(list(parallel_reader.sents()), list(reader.sents()))
+        self.assertEqual(list(parallel_reader.words()), list(reader.words()))
+
+    def test_json_corpus_reader_cache_update(self):
+        """Test that a file changed on disk is parsed again"""
+        reader = self.make_reader()
+        self.assertEqual(len(list(reader.paras())), 3)
+        self.write_doc({"1": "Urbs antiqua fuit."})
+        stat = os.stat(self.path)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 1))
+        self.assertEqual(list(reader.paras()), ["Urbs antiqua fuit."])
+
+
+class TestLazyIndex(unittest.TestCase):
+    """Test the on-disk corpus indices."""
+
+    def test_round_trip(self):
+        """Test that a written index reads back identically and in order."""
+        mapping = {'b': 'βῆτα', 'a': {'works': ['001', '002'], 'name': 'A'}, 'c': 3}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'test.idx')
+            write_index(mapping, path)
+            index = LazyIndex(path)
+            self.assertEqual(list(index), ['b', 'a', 'c'])
+            self.assertEqual(index['a'], mapping['a'])
+            self.assertEqual(index, mapping)
+            self.assertNotIn('d', index)
+            with self.assertRaises(KeyError):
+                index['d']  # pylint: disable=pointless-statement
+
+    def test_shipped_indices(self):
+        """Test lookups in the shipped TLG and PHI5 indices."""
+        self.assertEqual(TLG_INDEX['TLG0012'], 'Homerus Epic., Homer')
+        self.assertEqual(len(TLG_INDEX), 1823)
+        self.assertEqual(PHI5_WORKS_INDEX['LAT0528'], {'works': ['001'], 'name': 'Granius Flaccus'})
+
+
+def _fake_tlgu(tlgu_call):
+    """Stand-in for the tlgu executable: copy the input, upper-cased, to the
+    output, or to one file per line with ``-W``."""
+    input_path, output_path = tlgu_call[-2:]
+    with open(input_path) as file_open:
+        lines = file_open.read().upper().splitlines()
+    if '-W' in tlgu_call:
+        outputs = {'{0}-{1:03d}.txt'.format(output_path, i): line for i, line in enumerate(lines, 1)}
+    else:
+        outputs = {output_path: '\n'.join(lines)}
+    for path, text in outputs.items():
+        with open(path, 'w') as file_open:
+            file_open.write(text)
+    return 0
+
+
+class TestBetaCode(unittest.TestCase):
+    """Test the single-pass Beta Code converter."""
+
+    def test_beta_code_same_as_sequential(self):
+        """Test that the single-pass conversion gives the same output as
+        applying the substitutions one after the other."""
+        replacer = Replacer()
+        self.assertIsNotNone(replacer.transducer)
+        texts = [r"""O(/PWS OU)=N MH\ TAU)TO\ PA/QWMEN E)KEI/NOIS, E)PI\ TH\N DIA/GNWSIN""",
+                 r"""me/xri me\n w)/n tou/tou a(rpaga/s mou/nas ei)=nai par' a)llh/lwn: """,
+                 r"""*XALDAI+KH\N *(/ELLHNAS *)=W *A)/|DHS S1 S2 S3 *S3 LO/GOS_ TOU/S""",
+                 'LO/GOS\n', 'LO/GOS\nLO/GOS', 'ME-TA/\n\n']
+        for text in texts:
+            self.assertEqual(replacer.beta_code(text),
+                             replacer._beta_code_sequential(replacer._prepare(text)))
+
+    def test_beta_code_lines(self):
+        """Test converting line by line and file to file."""
+        replacer = Replacer()
+        text = 'MH=NIN A)/EIDE QEA\\ \nPHLHI+A/DEW *)AXILH=OS\n'
+        target = 'μῆνιν ἄειδε θεὰ \nπηληϊάδεω Ἀχιλῆος\n'
+        self.assertEqual(''.join(replacer.beta_code_lines(text.splitlines(keepends=True))), target)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, 'beta.txt')
+            output_path = os.path.join(tmp_dir, 'unicode.txt')
+            with open(input_path, 'w') as file_open:
+                file_open.write(text)
+            replacer.beta_code_file(input_path, output_path)
+            with open(output_path, encoding='utf-8') as file_open:
+                self.assertEqual(file_open.read(), target)
+
+    def test_beta_code_not_literal(self):
+        """Test that tables with other than literal patterns still work."""
+        replacer = Replacer(pattern3=[(r'\d+', '')])
+        self.assertIsNone(replacer.transducer)
+        self.assertEqual(replacer.beta_code('LO/GOS 123'), 'λόγος ')
+
+
+class TestTLGUConversion(unittest.TestCase):
+    """Test the incremental, parallel conversion of corpus files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.orig_dir = os.path.join(self.tmp_dir.name, 'orig')
+        self.target_dir = os.path.join(self.tmp_dir.name, 'target')
+        os.makedirs(self.orig_dir)
+        os.makedirs(self.target_dir)
+        self.manifest = os.path.join(self.target_dir, '.tlgu_manifest.json')
+        self.jobs = []
+        for name, text in [('TLG0001.TXT', 'arma\nuirum'), ('TLG0002.TXT', 'cano')]:
+            with open(os.path.join(self.orig_dir, name), 'w') as file_open:
+                file_open.write(text)
+            self.jobs.append((os.path.join(self.orig_dir, name),
+                              os.path.join(self.target_dir, name), ['W']))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch('cltk.corpus.greek.tlgu.subprocess.call', side_effect=_fake_tlgu)
+    def test_convert_files(self, tlgu_call):
+        """Test that files are converted once, and again only when changed."""
+        results = _convert_files(self.jobs, self.manifest, processes=2)
+        self.assertEqual(sorted(results['converted']), [job[0] for job in self.jobs])
+        self.assertEqual(sorted(os.listdir(self.target_dir)),
+                         ['.tlgu_manifest.json', 'TLG0001.TXT-001.txt',
+                          'TLG0001.TXT-002.txt', 'TLG0002.TXT-001.txt'])
+        with open(os.path.join(self.target_dir, 'TLG0001.TXT-002.txt')) as file_open:
+            self.assertEqual(file_open.read(), 'UIRUM')
+
+        results = _convert_files(self.jobs, self.manifest, processes=2)
+        self.assertEqual(results['skipped'], [job[0] for job in self.jobs])
+        self.assertEqual(tlgu_call.call_count, 2)
+
+        with open(self.jobs[1][0], 'w') as file_open:
+            file_open.write('cano\nTroiae')
+        os.remove(os.path.join(self.target_dir, 'TLG0001.TXT-001.txt'))
+        results = _convert_files(self.jobs, self.manifest)
+        self.assertEqual(sorted(results['converted']), [job[0] for job in self.jobs])
+        self.assertTrue(os.path.isfile(os.path.join(self.target_dir, 'TLG0002.TXT-002.txt')))
+
+        results = _convert_files(self.jobs, self.manifest, force=True)
+        self.assertEqual(len(results['converted']), 2)
+
+    @patch('cltk.corpus.greek.tlgu.subprocess.call', side_effect=_fake_tlgu)
+    def test_run_tlgu_relative_output(self, tlgu_call):
+        """Test that a bare output name is converted in a scratch directory
+        of the working directory, so the output is moved on one filesystem."""
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.target_dir)
+        p_out, outputs = _run_tlgu(self.jobs[1][0], 'TLG0002.TXT', [])
+        self.assertEqual((p_out, outputs), (0, ['TLG0002.TXT']))
+        scratch_dir = os.path.dirname(tlgu_call.call_args[0][0][-1])
+        self.assertEqual(os.path.dirname(scratch_dir), os.curdir)
+        self.assertEqual(os.listdir(self.target_dir), ['TLG0002.TXT'])
+
+    @patch('cltk.corpus.greek.tlgu.subprocess.call', return_value=1)
+    def test_convert_files_failed(self, tlgu_call):  # pylint: disable=unused-argument
+        """Test that a failed conversion writes nothing and is retried."""
+        results = _convert_files(self.jobs[:1], self.manifest)
+        self.assertEqual(results['failed'], [self.jobs[0][0]])
+        self.assertEqual(os.listdir(self.target_dir), ['.tlgu_manifest.json'])
+        results = _convert_files(self.jobs[:1], self.manifest)
+        self.assertEqual(results['failed'], [self.jobs[0][0]])
+
+
+class TestPlaintextCleanup(unittest.TestCase):
+    """Test the streaming TLG and PHI5 cleanup functions."""
+
+    def test_phi5_plaintext_cleanup_lines(self):
+        """Test that cleaning line by line equals cleaning the whole text."""
+        dirty = """        {ODYSSIA}
+        {Liber I}
+Virum áge 999 mihi, Camena, (insece) versu-
+tum.
+
+Pater noster, Saturni filie . . .
+Mea puera, quid verbi ex tuo ore supera fugit? """
+        for rm_punctuation, rm_periods in [(False, False), (True, False), (True, True)]:
+            whole = phi5_plaintext_cleanup(dirty, rm_punctuation, rm_periods)
+            lines = phi5_plaintext_cleanup_lines(dirty.splitlines(keepends=True),
+                                                 rm_punctuation, rm_periods)
+            self.assertEqual(''.join(lines), whole)
+
+    def test_tlg_plaintext_cleanup_lines(self):
+        """Test that cleaning line by line equals cleaning the whole text."""
+        dirty = """{ΑΘΗΝΑΙΟΥ ΝΑΥΚΡΑΤΙΤΟΥ}
+  LATIN Ἀθήναιος (μὲν) ὁ τῆς 999 βί-
+βλου πατήρ:\n ποιεῖται δὲ τὸν λόγον πρὸς Τιμοκράτην."""
+        for rm_punctuation, rm_periods in [(False, False), (True, False), (True, True)]:
+            whole = tlg_plaintext_cleanup(dirty, rm_punctuation, rm_periods)
+            lines = tlg_plaintext_cleanup_lines(dirty.splitlines(keepends=True),
+                                                rm_punctuation, rm_periods)
+            self.assertEqual(''.join(lines), whole)
+        self.assertIn('βίβλου', whole)
+
+
 class TestUnicode(unittest.TestCase):
     "Test py23char"
 
@@ -3,17 +3,24 @@
 TODO: Test Greek version of some of these.
 TODO: Figure out how to test functions relying on word2vec/gensim.
 TODO: Update tests for keyword exapansion additions to ir.py module.
-
-TODO: Figure out a way to test boolean module (which relies on local corpora).
 """
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
+from cltk.ir.boolean import CLTKIndex
+from cltk.ir.boolean import hits_to_html
+from cltk.ir.boolean import hits_to_json
+from cltk.ir.positional import PositionalIndex
+from cltk.ir.query import CorpusSearcher
 from cltk.ir.query import _window_match
 from cltk.ir.query import _regex_span
 from cltk.ir.query import _paragraph_context
 from cltk.ir.query import _sentence_context
 from cltk.ir.query import match_regex
+from cltk.ir.query import search_corpus
 
 __license__ = 'MIT License. See LICENSE.'
 
@@ -122,6 +129,191 @@ Et si volueris attendere, maxima pars vitae elabitur male agentibus, magna nihil
         sent_target = 't serva. Persuade tibi hoc sic esse, ut *scribo*: quaedam tempora eripiuntur nobis, quae'  # pylint: disable=line-too-long
         self.assertEqual(sent, sent_target)
 
+    def test_match_regex_many(self):
+        """Test match_regex() with matches in several paragraphs and sentences."""
+        text = 'Arma virumque cano. Troiae qui primus ab oris\nItaliam fato profugus!\n\nLaviniaque venit litora.'
+        self.assertEqual(list(match_regex(text, r'a\b', language='latin', context='paragraph')),
+                         ['Arm*a* virumque cano. Troiae qui primus ab oris',
+                          'Laviniaque venit litor*a*'])
+        self.assertEqual(list(match_regex(text, r'a\b', language='latin', context='sentence')),
+                         ['Arm*a* virumque cano.',
+                          '\nLaviniaque venit litor*a*.'])
+
+    def test_regex_span_patterns(self):
+        """Test _regex_span() with several patterns."""
+        text = 'arma virumque cano, Troiae qui primus ab oris'
+        _matches = _regex_span([r'(a)r\1?m', r'tro(i)ae', r'cano'], text)
+        self.assertEqual([match.group() for match in _matches], ['arm', 'cano', 'Troiae'])
+
+
+class TestCorpusSearch(unittest.TestCase):
+    """Test searching a corpus with CorpusSearcher."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = [self.write('LAT0474.TXT', 'O tempora, o mores! Senatus haec intellegit.'),
+                      self.write('LAT0690.TXT', 'Arma virumque cano. Tempora mutantur.\r\n')]
+        patcher = patch('cltk.ir.query.assemble_phi5_author_filepaths', return_value=self.paths)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', newline='') as file_open:
+            file_open.write(text)
+        return path
+
+    def test_search_corpus(self):
+        """Test search_corpus()."""
+        results = list(search_corpus('tempora', 'phi5', context='sentence'))
+        self.assertEqual(results, [('Marcus Tullius Cicero, Cicero, Tully', 'O *tempora*, o mores!'),
+                                   ('Publius Vergilius Maro, Virgil, Vergil', '*Tempora* mutantur.')])
+
+    def test_search_patterns(self):
+        """Test that matches of several patterns come back in text order."""
+        searcher = CorpusSearcher('phi5')
+        results = list(searcher.search(['mores', r'\bo\b'], context=2))
+        self.assertEqual([match for _, match in results], ['*O* t', ', *o* m', 'o *mores*! '])
+
+    def test_search_processes_mmap(self):
+        """Test that a pool and memory-mapped files give the same matches."""
+        expected = list(CorpusSearcher('phi5').search('a', context=5))
+        with CorpusSearcher('phi5', processes=2, mmap=True) as searcher:
+            self.assertEqual(list(searcher.search('a', context=5)), expected)
+            self.assertEqual(list(searcher.search('a', context=5)), expected)
+
+
+class TestPositionalIndex(unittest.TestCase):
+    """Test the positional index of cltk.ir.positional."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = [self.write('aeneid.txt', 'Arma virumque cano, Troiae qui primus ab oris.'),
+                      self.write('laelius.txt', 'Arma amicitiae; arma, virum. Amicus certus in re incerta cernitur.\n\nAmicitia fides.')]
+        lemmas = {'amicitiae': 'amicitia', 'amicus': 'amicus'}
+        self.index = PositionalIndex.build(os.path.join(self.tmp.name, 'index'), self.paths, 'latin',
+                                           lemmatizer=lambda terms: [lemmas.get(term, term) for term in terms])
+        self.addCleanup(self.index.close)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as file_open:
+            file_open.write(text)
+        return path
+
+    def test_find(self):
+        """Test single word, phrase, wildcard and lemma queries."""
+        self.assertEqual(self.index.find('arma'), [(0, 0, 4), (1, 0, 4), (1, 16, 20)])
+        self.assertEqual(self.index.find('"arma virum"'), [(0, 0, 10), (1, 16, 27)])
+        self.assertEqual(self.index.find('"virum cano"'), [])
+        self.assertEqual(self.index.find('amic*'), [(1, 5, 14), (1, 29, 35), (1, 68, 76)])
+        self.assertEqual(self.index.find('lemma:amicitia'), [(1, 5, 14), (1, 68, 76)])
+        self.assertEqual(self.index.find('que'), [(0, 10, 13)])
+
+    def test_find_split_words(self):
+        """Test that query words are split as the indexed texts were."""
+        self.assertEqual(self.index.find('virumque'), [(0, 5, 13)])
+        self.assertEqual(self.index.find('Virumque'), [(0, 5, 13)])
+        self.assertEqual(self.index.find('"arma virumque cano"'), [(0, 0, 18)])
+        self.assertEqual(self.index.find('virumque NEAR/2 troiae'), [(0, 5, 26)])
+        self.assertEqual(self.index.find(','), [])
+
+    def test_find_near(self):
+        """Test NEAR/n queries."""
+        self.assertEqual(self.index.find('cano NEAR/3 arma'), [(0, 0, 18)])
+        self.assertEqual(self.index.find('cano NEAR/2 arma'), [])
+        self.assertEqual(self.index.find('"arma virum" NEAR/1 amicus'), [(1, 16, 35)])
+        with self.assertRaises(ValueError):
+            self.index.find('arma NEAR cano')
+
+    def test_search(self):
+        """Test that matches come in the contexts of match_regex()."""
+        self.assertEqual(list(self.index.search('"arma virum*"', 'sentence')),
+                         [('aeneid.txt', '*Arma virum*que cano, Troiae qui primus ab oris.'),
+                          ('laelius.txt', 'Arma amicitiae; *arma, virum*.')])
+        with open(self.paths[1]) as file_open:
+            text = file_open.read()
+        self.assertEqual([match for _, match in self.index.search('amicus', 'paragraph')],
+                         list(match_regex(text, r'\bamicus\b', 'latin', 'paragraph')))
+
+    def test_build_processes(self):
+        """Test that indexing with several processes gives the same index."""
+        with PositionalIndex.build(os.path.join(self.tmp.name, 'index2'), self.paths, 'latin',
+                                   processes=2) as index:
+            self.assertEqual(index.find('amic* NEAR/3 arma'), self.index.find('amic* NEAR/3 arma'))
+            self.assertEqual(index.postings('arma'), {0: [0], 1: [0, 2]})
+
+
+class TestIndex(unittest.TestCase):
+    """Test making and updating a Whoosh index of a small, made-up corpus."""
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.corpus_dir = os.path.join(self.data_dir.name, 'latin', 'text', 'phi5', 'plaintext')
+        os.makedirs(self.corpus_dir)
+        self.write('LAT0474.TXT', 'O tempora, o mores!')
+        self.write('LAT0690.TXT', 'Arma virumque cano')
+        patcher = patch('builtins.get_cltk_data_dir', return_value=self.data_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.data_dir.cleanup)
+
+    def write(self, name, text):
+        """Write a file of the corpus."""
+        with open(os.path.join(self.corpus_dir, name), 'w') as file_open:
+            file_open.write(text)
+
+    def test_index_corpus_incremental(self):
+        """Test that re-indexing only touches changed documents."""
+        cltk_index = CLTKIndex('latin', 'phi5')
+        counts = cltk_index.index_corpus(processes=2)
+        self.assertEqual(counts['added'], 2)
+        counts = cltk_index.index_corpus()
+        self.assertEqual(counts['unchanged'], 2)
+
+        self.write('LAT0690.TXT', 'Arma virumque cano, Troiae qui primus ab oris')
+        self.write('LAT0448.TXT', 'Gallia est omnis divisa in partes tres')
+        os.remove(os.path.join(self.corpus_dir, 'LAT0474.TXT'))
+        counts = cltk_index.index_corpus()
+        self.assertEqual([counts[key] for key in ['added', 'updated', 'deleted', 'unchanged']],
+                         [1, 1, 1, 0])
+        results = cltk_index.corpus_query('Troiae')
+        self.assertIn('Vergilius', results)
+        self.assertNotIn('Cicero', cltk_index.corpus_query('tempora'))
+
+    def test_index_corpus_analyzer(self):
+        """Test that a new analyzer rebuilds the index."""
+        from whoosh.analysis import RegexTokenizer
+        cltk_index = CLTKIndex('latin', 'phi5')
+        cltk_index.index_corpus()
+        counts = cltk_index.index_corpus(analyzer=RegexTokenizer())
+        self.assertEqual(counts['added'], 2)
+        # Without a lowercase filter, case now matters.
+        self.assertNotIn('Vergilius', cltk_index.corpus_query('arma'))
+
+    def test_search(self):
+        """Test structured, paginated hits highlighted from the index."""
+        self.write('LAT0448.TXT', 'Arma & arma.\nGallia est omnis divisa')
+        cltk_index = CLTKIndex('latin', 'phi5')
+        cltk_index.index_corpus()
+        os.remove(os.path.join(self.corpus_dir, 'LAT0448.TXT'))  # not read again
+        hits = list(cltk_index.search('arma'))
+        self.assertEqual(len(hits), 2)
+        hit = [hit for hit in hits if hit['path'].endswith('LAT0448.TXT')][0]
+        self.assertEqual(hit['fragments'], [{'text': 'Arma & arma.\nGallia est omnis divisa',
+                                             'matches': [(0, 4), (7, 11)]}])
+        self.assertEqual(len(list(cltk_index.search('arma', page=2, pagelen=1))), 1)
+
+        html = hits_to_html([hit])
+        self.assertEqual(html, 'Docs containing hits: 1.</br></br>'
+                               'Gaius Iulius Caesar, Caesar</br>' + hit['path'] + '</br>'
+                               'Approximate hits: 2.</br>'
+                               '<b class="match term0">Arma</b> &amp; <b class="match term0">arma</b>.'
+                               '</br>Gallia est omnis divisa</br></br>')
+        self.assertIn('"matches": [[0, 4], [7, 11]]', hits_to_json([hit]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 """Test cltk.lemmatize."""
 import os
+import pickle
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -103,6 +105,22 @@ class TestSequenceFunctions(unittest.TestCase):
         lemmas = lemmatizer.lemmatize(tokens)
         self.assertEqual(lemmas, target)
 
+    def test_backoff_chain_repeated_tokens(self):
+        """Test that a context-free chain lemmatizes repeated tokens once
+        and returns the same output as walking the chain per token."""
+        identity = IdentityLemmatizer(verbose=True)
+        regexp = RegexpLemmatizer([('(.)ab(o|is|it|imus|itis|unt)$', r'\1o')], source='Test Patterns', backoff=identity, verbose=True)
+        lemmatizer = DictLemmatizer(lemmas={'uirum': 'uir'}, backoff=regexp, source='Test Lemmas', verbose=True)
+        tokens = 'uirum amabimus cano uirum amabimus'.split()
+        target = [('uirum', 'uir', '<DictLemmatizer: Test Lemmas>'),
+                  ('amabimus', 'amo', '<RegexpLemmatizer: Test Patterns>'),
+                  ('cano', 'cano', '<IdentityLemmatizer>')]
+        lemmas = lemmatizer.lemmatize(tokens)
+        self.assertEqual(lemmas, target + target[:2])
+        self.assertEqual(lemmatizer._lemma_cache.cache_info().misses, 3)
+        lemmatizer.clear_cache()
+        self.assertEqual(lemmatizer.lemmatize(tokens), lemmas)
+
     def test_roman_numeral_lemmatizer(self):
         """Test roman_numeral_lemmatizer()"""
         lemmatizer = RomanNumeralLemmatizer()
@@ -197,5 +215,42 @@ class TestSequenceFunctions(unittest.TestCase):
         target = [('li', 'li'), ('rois', 'rois'), ('pense', 'pense'), ('que', 'que'), ('par', 'par'), ('folie', 'folie'), (',', ['PUNK']), ('sire', 'sire'), ('tristran', 'None'), (',', ['PUNK']), ('vos', 'vos'), ('aie', ['avoir']), ('amé', 'amer'), (';', ['PUNK']), ('mais', 'mais'), ('dé', 'dé'), ('plevis', 'plevir'), ('ma', 'ma'), ('loiauté', 'loiauté'), (',', ['PUNK']), ('qui', 'qui'), ('sor', 'sor'), ('mon', 'mon'), ('cors', 'cors'), ('mete', 'mete'), ('flaele', 'flaele'), (',', ['PUNK']), ("s'", "s'"), ('onques', 'onques'), ('fors', 'fors'), ('cil', 'cil'), ('qui', 'qui'), ("m'", "m'"), ('ot', 'ot'), ('pucele', 'pucele'), ('out', ['avoir']), ("m'", "m'"), ('amistié', 'amistié'), ('encor', 'encor'), ('nul', 'nul'), ('jor', 'jor'), ('!', ['PUNK'])]
         self.assertEqual(lemmas, target)
 
+class TestBackoffPersistence(unittest.TestCase):
+    """Test saving and loading assembled backoff lemmatizers."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        train = [[('arma', 'arma', 'n'), ('uirumque', 'uir', 'n')],
+                 [('cano', 'cano', 'v'), ('.', 'punc', 'u')]]
+        models = {'latin_pos_lemmatized_sents.pickle': train,
+                  'latin_lemmata_cltk.pickle': {'troiae': 'troia'},
+                  'latin_model.pickle': {'qui': 'qui'}}
+        for name, model in models.items():
+            with open(os.path.join(self.tmp_dir.name, name), 'wb') as file_open:
+                pickle.dump(model, file_open)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_load_latin(self):
+        """Test that a loaded chain lemmatizes like the one that was saved."""
+        tokens = 'arma uirumque cano troiae qui nobilitatis primus'.split()
+        with patch.object(BackoffLatinLemmatizer, 'models_path', self.tmp_dir.name):
+            lemmatizer = BackoffLatinLemmatizer(seed=3)
+        target = lemmatizer.lemmatize(tokens)
+        path = os.path.join(self.tmp_dir.name, 'lemmatizer.pickle')
+        lemmatizer.save(path)
+        loaded = BackoffLatinLemmatizer.load(path)
+        self.assertEqual(loaded.lemmatize(tokens), target)
+        self.assertIsNone(loaded.train_sents)
+        self.assertIs(BackoffLatinLemmatizer.load(path).lemmatizer, loaded.lemmatizer)
+
+    def test_load_wrong_artifact(self):
+        """Test that loading an unrelated pickle fails clearly."""
+        path = os.path.join(self.tmp_dir.name, 'latin_model.pickle')
+        with self.assertRaises(ValueError):
+            BackoffLatinLemmatizer.load(path)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -225,6 +225,26 @@ class TestStop_General(unittest.TestCase):
                     basis='zou', inc_values=False)
         self.assertEqual(stoplist, target_list)
 
+    def test_corpus_stop_list_partial_fit(self):
+        """Test that a stoplist built from streamed batches matches one built
+        from the whole corpus"""
+        S = LatinCorpusStoplist()
+        target_list = S.build_stoplist(self.test_corpus, size=10, basis='zou', inc_values=True)
+        S = LatinCorpusStoplist()
+        for text in self.test_corpus:
+            S.partial_fit([text])
+        stoplist = S.build_stoplist(size=10, basis='zou', inc_values=True)
+        self.assertEqual(stoplist, target_list)
+
+    def test_corpus_stop_list_processes(self):
+        """Test counting a corpus with worker processes"""
+        target_list = ['ac', 'ad', 'atque', 'cum', 'et', 'in', 'mihi', 'neque', 'qui', 'vel']
+        S = LatinCorpusStoplist()
+        S.partial_fit(self.test_corpus * 3, processes=2, chunksize=2)
+        stoplist = S.build_stoplist(size=10, basis='frequency')
+        self.assertEqual(stoplist, target_list)
+        self.assertEqual(S._make_dtm_vocab()[0].shape[0], 6)
+
 
 class TestStop_LanguageSpecific(unittest.TestCase):
     """
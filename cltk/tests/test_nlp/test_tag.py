@@ -2,13 +2,17 @@
 
 import os
 import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from cltk.corpus.utils.importer import CorpusImporter
 from cltk.stem.latin.j_v import JVReplacer
 from cltk.tag import ner
 from cltk.tag.ner import NamedEntityReplacer
+from cltk.tag.ner import NERTagger
 from cltk.tag.pos import POSTag
+from cltk.utils.model_registry import ModelRegistry
 
 __license__ = 'MIT License. See LICENSE.'
 
@@ -122,6 +126,24 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         tagged = tagger.tag_tnt('Gallia est omnis divisa in partes tres')
         self.assertTrue(tagged)
 
+    def test_pos_tagger_shared_across_calls(self):
+        """Test that the tagger pickle is loaded once and then reused."""
+        tagger = POSTag('latin')
+        first = tagger._load_tagger('tnt')
+        second = POSTag('latin')._load_tagger('tnt')
+        self.assertIs(first, second)
+
+    def test_pos_tag_batch_latin(self):
+        """Test batch tagging matches tagging one sentence at a time."""
+        tagger = POSTag('latin')
+        sentences = ['Gallia est omnis divisa in partes tres',
+                     'quarum unam incolunt Belgae']
+        expected = [tagger.tag_tnt(sentence) for sentence in sentences]
+        self.assertEqual(list(tagger.tag_batch(sentences, tagger='tnt')), expected)
+        tokenized = [sentence.split() for sentence in sentences]
+        tagged = tagger.tag_batch(tokenized, tagger='tnt', tokenized=True, processes=2)
+        self.assertEqual(list(tagged), expected)
+
     def test_pos_crf_tagger_latin(self):
         """Test tagging Latin POS with CRF tagger."""
         tagger = POSTag('latin')
@@ -267,5 +289,47 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         tagged = tagger.tag_perceptron('Hwæt! We Gardena in geardagum, þeodcyninga, þrym gefrunon, hu ða æþelingas ellen fremedon.')
         self.assertTrue(tagged)
 
+class TestNERTagger(unittest.TestCase):
+    """Test the gazetteer-based NERTagger."""
+
+    def setUp(self):
+        self.tagger = NERTagger(names=['Uenus', 'Sirius', 'Marcus Tullius', 'Marcus Tullius Cicero', ''])
+
+    def test_tag(self):
+        """Test single- and multi-word names, preferring the longest."""
+        tokens = 'ut Uenus Marcus Tullius Cicero et Marcus Tullius Tiro Marcus'.split()
+        target = [('ut',), ('Uenus', 'Entity'), ('Marcus Tullius Cicero', 'Entity'), ('et',),
+                  ('Marcus Tullius', 'Entity'), ('Tiro',), ('Marcus',)]
+        self.assertEqual(self.tagger.tag(tokens), target)
+
+    def test_tag_iter(self):
+        """Test that streaming tagging matches list tagging."""
+        tokens = 'Sirius Marcus Tullius Cicero Sirius'.split()
+        self.assertEqual(list(self.tagger.tag_iter(iter(tokens))), self.tagger.tag(tokens))
+
+    def test_tag_batch(self):
+        """Test tagging strings and token lists in a batch."""
+        tagged = list(self.tagger.tag_batch(['ut Sirius.', ['Uenus']]))
+        self.assertEqual(tagged, [[('ut',), ('Sirius', 'Entity'), ('.',)], [('Uenus', 'Entity')]])
+
+    def test_tag_ner_cached(self):
+        """Test that tag_ner builds the tagger of a language once."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'proper_names.txt')
+            with open(path, 'w') as file_open:
+                file_open.write('Sirius\nMarcus Tullius Cicero')
+            registry = ModelRegistry()
+            with patch.dict(ner.NER_DICT, {'latin': path}), \
+                    patch('cltk.utils.model_registry.registry', registry):
+                first = ner.tag_ner('latin', input_text=['ut', 'Sirius'])
+                second = ner.tag_ner('latin', input_text=['Marcus', 'Tullius', 'Cicero'])
+                tagger = registry.load(path, language='latin', loader=ner._NER_LOADERS['latin'])
+                self.assertEqual(len(registry), 1)
+                self.assertIs(registry.load(path, language='latin',
+                                            loader=ner._NER_LOADERS['latin']), tagger)
+        self.assertEqual(first, [('ut',), ('Sirius', 'Entity')])
+        self.assertEqual(second, [('Marcus Tullius Cicero', 'Entity')])
+
+
 if __name__ == '__main__':
     unittest.main()
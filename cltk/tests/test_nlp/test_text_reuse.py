@@ -3,6 +3,8 @@
 __author__ = ['Luke Hollis <lukehollis@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
+import os
+import tempfile
 import unittest
 from cltk.text_reuse.levenshtein import Levenshtein
 from cltk.text_reuse.text_reuse import TextReuse
@@ -10,6 +12,9 @@ from cltk.text_reuse.comparison import long_substring
 from cltk.text_reuse.comparison import minhash
 from cltk.text_reuse.comparison import Needleman_Wunsch
 from cltk.text_reuse.comparison import Default_Matrix
+from cltk.text_reuse.lsh import MinHashLSH
+from cltk.text_reuse import distance
+from cltk.text_reuse.automata import SpellIndex
 
 
 demo_verg = """
@@ -62,7 +67,7 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         """Test for Damerau-Levenshtein Distance between two words"""
         l = Levenshtein()
         dist = l.Damerau_Levenshtein_Distance("all haile whose solempne glorious concepcioun","fresche floure in quhom the hevinlie dewe doun fell")
-        self.assertEqual(dist,35)
+        self.assertEqual(dist, 42)
 
 #    Test causing lemmatizer Travis build to fail—figure out what is wrong and restore.
 #    def test_distance_sentences(self):
@@ -71,6 +76,69 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
 #        comparisons = t.compare_sentences(demo_verg, demo_prop, 'latin')
 #        self.assertEqual(comparisons[1][0].ratio, 0.40)
 
+    def test_damerau_levenshtein_distance_insertions(self):
+        """Test that insertions are counted when no transposition applies."""
+        l = Levenshtein()
+        self.assertEqual(l.Damerau_Levenshtein_Distance('bbdc', 'cceebcdda'), 7)
+        self.assertEqual(l.Damerau_Levenshtein_Distance('ca', 'abc'), 2)
+
+    def test_bit_parallel_distance(self):
+        """Test the pure-Python bit-parallel kernel against the DP values."""
+        l = Levenshtein()
+        lines = demo_verg.split('\n') + demo_prop.split('\n')
+        for str_a in lines:
+            for str_b in lines[:5]:
+                expected = l.Levenshtein_Distance(str_a, str_b)
+                self.assertEqual(distance._myers_distance(str_a, str_b), expected)
+                capped = distance._myers_distance(str_a, str_b, max_distance=3)
+                self.assertEqual(capped, min(expected, 4))
+
+    def test_distance_max_distance(self):
+        """Test early termination of the distance functions."""
+        self.assertEqual(distance.levenshtein_distance('nox', 'nochem', max_distance=2), 3)
+        self.assertEqual(distance.levenshtein_distance('nox', 'noctem', max_distance=4), 4)
+        self.assertEqual(distance.damerau_levenshtein_distance('orbis', 'robis', max_distance=0), 1)
+
+    def test_distance_matrix(self):
+        """Test that batched distances match pairwise distances."""
+        words_a = ['arma', 'uirumque', 'cano', '', 'Troiae']
+        words_b = ['armis', 'uirum', 'canis', 'troia', 'a']
+        matrix = distance.distance_matrix(words_a, words_b)
+        encoded = distance._EncodedStrings(words_b)
+        for row, word_a in enumerate(words_a):
+            expected = [distance.levenshtein_distance(word_a, word_b) for word_b in words_b]
+            self.assertEqual(list(matrix[row]), expected)
+            self.assertEqual(list(encoded.distances(word_a)), expected)
+            self.assertEqual(list(encoded.distances(word_a, max_distance=1)),
+                             [min(dist, 2) for dist in expected])
+        self.assertEqual(distance.closest('arna', ['arma', 'arua', 'uirum']), ['arma', 'arua'])
+
+    def test_spell_index_lookup(self):
+        """Test that SpellIndex finds exactly the words within depth."""
+        lexicon = demo_verg.replace(',', ' ').replace(';', ' ').split()
+        index = SpellIndex(lexicon)
+        self.assertEqual(len(index), len(set(lexicon)))
+        self.assertIn('tellus', index)
+        self.assertNotIn('tellu', index)
+        for word in ['telus', 'cultr', 'nemorun', 'pinguiae', 'xyz']:
+            for depth in range(3):
+                expected = sorted(w for w in set(lexicon)
+                                  if distance.levenshtein_distance(word, w) <= depth)
+                self.assertEqual(index.lookup(word, depth), expected)
+
+    def test_spell_index_suggest_and_save(self):
+        """Test batch suggestions and a save/load round trip of SpellIndex."""
+        index = SpellIndex(['pes', 'pesse', 'pease', 'peis', 'peisse', 'pise', 'peose', 'poese', 'poisen'])
+        suggestions = index.suggest(['pece', 'pesa', 'pece'], depth=2)
+        self.assertEqual(list(suggestions), ['pece', 'pesa'])
+        self.assertEqual(suggestions['pece'], ['pease', 'peis', 'peose', 'pes', 'pesse', 'pise', 'poese'])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'spell.index')
+            index.save(path)
+            loaded = SpellIndex.load(path)
+        self.assertEqual(loaded.lookup('pece', 3), index.lookup('pece', 3))
+        self.assertEqual(len(loaded), 9)
+
     def test_distance_sliding_window(self):
         """Test comparing two passages with the sliding window strategy"""
         t = TextReuse()
@@ -87,6 +155,39 @@ class TestSequenceFunctions(unittest.TestCase):  # pylint: disable=R0904
         score = minhash(demo_verg, demo_prop)
         self.assertEqual(score, 0.17163120567375886)
    
+    def test_minhash_lsh_candidates(self):
+        """Test that LSH proposes near-duplicate lines only."""
+        index = MinHashLSH()
+        for line_n, line in enumerate(demo_prop.split('\n')):
+            index.add(line_n, line)
+        query = 'dique deaeque omnes, studium quibus arua tueri,'
+        candidates = index.query(query)
+        self.assertIn(3, candidates)
+        self.assertLess(len(candidates), 3)
+
+    def test_minhash_lsh_signature(self):
+        """Test that signatures are deterministic and approximate Jaccard."""
+        index_1 = MinHashLSH(num_perm=256, bands=64)
+        index_2 = MinHashLSH(num_perm=256, bands=64)
+        str_a = 'dique deaeque omnes, studium quibus arua tueri,'
+        str_b = 'dique deaeque omnes, quibus est tutela per agros,'
+        self.assertEqual(index_1.signature(str_a), index_2.signature(str_a))
+        index_1.add('a', str_a)
+        index_1.add('b', str_b)
+        self.assertAlmostEqual(index_1.jaccard('a', 'b'), minhash(str_a, str_b), delta=0.1)
+        with self.assertRaises(ValueError):
+            MinHashLSH(num_perm=100, bands=32)
+
+    def test_find_reuse(self):
+        """Test that find_reuse returns the same pairs as the full matrix."""
+        lines_a = [line for line in demo_verg.split('\n') if line]
+        lines_b = [line for line in demo_prop.split('\n') if line]
+        text_reuse = TextReuse()
+        matches = text_reuse.find_reuse(lines_a, lines_b, threshold=0.5)
+        self.assertEqual([(match.index_a, match.index_b) for match in matches], [(9, 2)])
+        self.assertEqual(matches[0].ratio, 0.71)
+        self.assertEqual(matches[0].str_b, 'dique deaeque omnes, quibus est tutela per agros,')
+
     def test_Needleman_Wunsch(self):
         """Test for finding the optimal alignment by the Needleman-Wunsch algorithm"""
         w1, w2 = "michtis","myht"
@@ -13,6 +13,7 @@ from cltk.tokenize.greek.sentence import GreekPunktSentenceTokenizer, GreekRegex
 from cltk.tokenize.greek.sentence import SentenceTokenizer as GreekSentenceTokenizer
 from cltk.tokenize.sanskrit.word import WordTokenizer as SanskritWordTokenizer
 from cltk.tokenize.utils import BaseSentenceTokenizerTrainer
+from cltk.tokenize.utils import span_tokens
 from cltk.tokenize.latin.utils import LatinSentenceTokenizerTrainer
 from cltk.tokenize.akkadian.word import tokenize_akkadian_words, tokenize_akkadian_signs
 from cltk.tokenize.arabic.word import WordTokenizer as ArabicWordTokenizer
@@ -23,7 +24,9 @@ from cltk.tokenize.middle_high_german.word import WordTokenizer as MiddleHighGer
 from cltk.tokenize.old_french.word import WordTokenizer as OldFrenchWordTokenizer
 from cltk.tokenize.old_norse.word import WordTokenizer as OldNorseWordTokenizer
 from cltk.tokenize.sanskrit.word import WordTokenizer as SanskritWordTokenizer
+from cltk.tokenize.sentence import BaseSentenceTokenizer
 from cltk.tokenize.sentence import TokenizeSentence
+from cltk.tokenize.latin.params import LatinLanguageVars
 from cltk.tokenize.word import WordTokenizer
 from cltk.tokenize.line import LineTokenizer
 
@@ -99,6 +102,13 @@ class TestSentenceTokenize(unittest.TestCase):  # pylint: disable=R0904
         tokenized_sentences = tokenizer.tokenize(self.greek_text)
         self.assertEqual(tokenized_sentences, target)
 
+    def test_sentence_tokenizer_greek_regex_spans(self):
+        """Test that the spans of Greek sentences are those of tokenize()."""
+        tokenizer = GreekRegexSentenceTokenizer()
+        spans = tokenizer.tokenize_spans(self.greek_text)
+        self.assertEqual(list(span_tokens(self.greek_text, spans)),
+                         tokenizer.tokenize(self.greek_text))
+
     def test_sentence_tokenizer_greek_punkt(self):
         """Test tokenizing Greek sentences with punkt."""
         target = [
@@ -303,6 +313,47 @@ class TestWordTokenize(unittest.TestCase):  # pylint: disable=R0904
                   "ducentorum", "rescindit"]
         self.assertEqual(tokens, target)
 
+    def test_tokenize_latin_words_many(self):
+        """Test tokenize_many() against tokenize()."""
+        word_tokenizer = LatinWordTokenizer()
+        tests = ['Arma virumque cano, Troiae qui primus ab oris.',
+                 'Quid opust verbis? lingua nullast qua negem quidquid roges.',
+                 '',
+                 'Dic SODES mihi, bellan videtur specie mulier?']
+        self.assertEqual(list(word_tokenizer.tokenize_many(tests)),
+                         [word_tokenizer.tokenize(test) for test in tests])
+        self.assertEqual(list(word_tokenizer.tokenize_many(tests[:1], enclitics=['ue'])),
+                         [['Arma', 'virumq', '-ue', 'cano', ',', 'Troiae', 'qui', 'primus', 'ab',
+                           'oris', '.']])
+
+    def test_tokenize_latin_words_replacements(self):
+        """Test that replacements keep the case of the text and may be
+        patterns other than whole words."""
+        word_tokenizer = LatinWordTokenizer()
+        self.assertEqual(word_tokenizer.tokenize('MECUM Tecum nobiscum Sultis'),
+                         ['CUM', 'ME', 'Cum', 'te', 'cum', 'nobis', 'Si', 'vultis'])
+        replacements = [(r'\bsecum\b', 'cum se'), (r'\bse\b', 'sese'), (r'(q)uocum', 'cum quo')]
+        self.assertEqual(word_tokenizer.tokenize('secum quocum', replacements=replacements),
+                         ['cum', 'sese', 'cum', 'quo'])
+
+    def test_tokenize_latin_words_spans(self):
+        """Test the offsets of Latin tokens, including those split off or
+        made by replacements."""
+        word_tokenizer = LatinWordTokenizer()
+        text = 'Mecum bellane, nullast?'
+        spans = word_tokenizer.tokenize_spans(text)
+        self.assertEqual(len(spans) // 2, len(word_tokenizer.tokenize(text)))
+        self.assertEqual(list(span_tokens(text, spans)),
+                         ['Mecum', 'Mecum', 'bella', 'ne', ',', 'nulla', 'st', '?'])
+
+    def test_tokenize_words_spans(self):
+        """Test that regex word tokenizers report the offsets of their tokens."""
+        word_tokenizer = WordTokenizer('old_norse')
+        text = 'Gylfi konungr réð þar löndum, er nú heitir Svíþjóð.'
+        spans = word_tokenizer.tokenize_spans(text)
+        self.assertEqual(list(spans[8:12]), [22, 28, 28, 29])
+        self.assertEqual(list(span_tokens(text, spans)), word_tokenizer.tokenize(text))
+
     def test_tokenize_arabic_words_base(self):
         word_tokenizer = WordTokenizer('arabic')
         tests = ['اللُّغَةُ الْعَرَبِيَّةُ جَمِيلَةٌ.',
@@ -571,6 +622,14 @@ class TestLineTokenize(unittest.TestCase):  # pylint: disable=R0904
         tokenized_lines = tokenizer.tokenize(text, include_blanks=True)
         self.assertTrue(tokenized_lines == target)
 
+    def test_line_tokenizer_spans(self):
+        """Test LineTokenizer offsets"""
+        text = 'arma\n\nvirum\r\ncano'
+        tokenizer = LineTokenizer('latin')
+        self.assertEqual(list(tokenizer.tokenize_spans(text)), [0, 4, 6, 11, 13, 17])
+        self.assertEqual(list(tokenizer.tokenize_spans(text, include_blanks=True)),
+                         [0, 4, 5, 5, 6, 11, 13, 17])
+
 
 class TestSentenceTokenizeUtils(unittest.TestCase):  # pylint: disable=R0904
     """Class for unittest"""
@@ -618,6 +677,33 @@ class TestSentenceTokenizeUtils(unittest.TestCase):  # pylint: disable=R0904
         self.assertIsInstance(trainer.train_sentence_tokenizer(self.latin_text),
                               PunktSentenceTokenizer)
 
+    def test_sentence_tokenizer_shared_parameters(self):
+        """Test that sentence tokenizers share the parameters of a model
+        without changing the model"""
+        model = BaseSentenceTokenizerTrainer('latin').train_sentence_tokenizer(self.latin_text)
+        ortho_context = dict(model._params.ortho_context)
+        lang_vars = model._lang_vars
+        tokenizers = [BaseSentenceTokenizer('latin') for _ in range(2)]
+        for tokenizer in tokenizers:
+            tokenizer.model = model
+            tokenizer.lang_vars = LatinLanguageVars()
+        sentences = tokenizers[0].tokenize(self.latin_text)
+        self.assertEqual(tokenizers[1].tokenize(self.latin_text), sentences)
+        self.assertIs(tokenizers[0]._punkt_tokenizer()._params,
+                      tokenizers[1]._punkt_tokenizer()._params)
+        self.assertIs(model._lang_vars, lang_vars)
+        self.assertEqual(dict(model._params.ortho_context), ortho_context)
+
+    def test_sentence_tokenizer_batch(self):
+        """Test tokenize_sentences_batch() against tokenize()"""
+        tokenizer = BaseSentenceTokenizer('latin')
+        tokenizer.model = BaseSentenceTokenizerTrainer('latin').train_sentence_tokenizer(self.latin_text)
+        tokenizer.lang_vars = LatinLanguageVars()
+        texts = [self.latin_text, '', 'Quid agis? Nihil.']
+        target = [tokenizer.tokenize(text) for text in texts]
+        self.assertEqual(list(tokenizer.tokenize_sentences_batch(texts)), target)
+        self.assertEqual(list(tokenizer.tokenize_sentences_batch(texts, processes=2)), target)
+
 
 if __name__ == '__main__':
     unittest.main()
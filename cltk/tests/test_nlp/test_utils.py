@@ -4,8 +4,13 @@ from collections import Counter
 from collections import defaultdict
 from importlib import reload
 import os
+import pickle
 from pickle import UnpicklingError
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from cltk.corpus.utils.importer import CorpusImporter
 from cltk.utils.cltk_logger import logger
@@ -16,6 +21,7 @@ from cltk.utils.contributors import get_authors
 from cltk.utils.file_operations import make_cltk_path
 from cltk.utils.file_operations import open_pickle
 from cltk.utils.frequency import Frequency
+from cltk.utils.model_registry import ModelRegistry
 from cltk.utils import philology
 
 
@@ -175,5 +181,211 @@ class TestPathCreation(unittest.TestCase):
         reload(cltk)
 
 
+class TestModelRegistry(unittest.TestCase):
+    """Class for the shared model registry."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ('a', 'b', 'c'):
+            path = os.path.join(self.tmp_dir.name, name + '.pickle')
+            with open(path, 'wb') as file_open:
+                pickle.dump({name: list(range(100))}, file_open)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_once(self):
+        """Test that a model is deserialized once and then shared."""
+        registry = ModelRegistry()
+        first = registry.load(self.paths[0], language='latin')
+        second = registry.load(self.paths[0], language='latin')
+        self.assertIs(first, second)
+        self.assertEqual(len(registry), 1)
+        self.assertIn(self.paths[0], registry)
+
+    def test_reload_on_mtime_change(self):
+        """Test that a rewritten model file is loaded again."""
+        registry = ModelRegistry()
+        first = registry.load(self.paths[0])
+        with open(self.paths[0], 'wb') as file_open:
+            pickle.dump({'new': 1}, file_open)
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], (stat.st_atime, stat.st_mtime + 10))
+        second = registry.load(self.paths[0])
+        self.assertIsNot(first, second)
+        self.assertEqual(second, {'new': 1})
+        self.assertEqual(len(registry), 1)
+
+    def test_loader_in_key(self):
+        """Test that a file read by two loaders is cached once per loader."""
+        def read_bytes(path):
+            with open(path, 'rb') as file_open:
+                return file_open.read()
+
+        registry = ModelRegistry()
+        pickled = registry.load(self.paths[0])
+        raw = registry.load(self.paths[0], loader=read_bytes)
+        self.assertEqual(pickled, {'a': list(range(100))})
+        self.assertIsInstance(raw, bytes)
+        self.assertIs(registry.load(self.paths[0]), pickled)
+        self.assertEqual(len(registry), 2)
+
+    def test_lru_eviction(self):
+        """Test that least recently used models are evicted over budget."""
+        size = os.path.getsize(self.paths[0])
+        registry = ModelRegistry(max_bytes=2 * size)
+        registry.preload(self.paths[:2])
+        registry.load(self.paths[0])
+        registry.load(self.paths[2])
+        self.assertIn(self.paths[0], registry)
+        self.assertNotIn(self.paths[1], registry)
+        self.assertIn(self.paths[2], registry)
+
+    def test_evict(self):
+        """Test explicit eviction by path and by language."""
+        registry = ModelRegistry()
+        registry.load(self.paths[0], language='latin')
+        registry.load(self.paths[1], language='greek')
+        registry.load(self.paths[2], language='greek')
+        self.assertEqual(registry.evict(path=self.paths[0]), 1)
+        self.assertEqual(registry.evict(language='greek'), 2)
+        self.assertEqual(len(registry), 0)
+
+    def test_load_missing(self):
+        """Test that a missing model raises FileNotFoundError."""
+        registry = ModelRegistry()
+        with self.assertRaises(FileNotFoundError):
+            registry.load(os.path.join(self.tmp_dir.name, 'missing.pickle'))
+
+
+class TestCorpusFrequency(unittest.TestCase):
+    """Test counting word frequencies over corpus files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filepaths = [os.path.join(self.tmp_dir.name, name) for name in ('LAT0474.TXT', 'LAT0690.TXT')]
+        self._write(0, 'Quo usque tandem abutere, Catilina, patientia nostra?')
+        self._write(1, 'Arma virumque cano, Troiae qui primus ab oris; arma.')
+        patcher = patch('cltk.utils.frequency.assemble_phi5_author_filepaths', lambda: list(self.filepaths))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write(self, index, text):
+        with open(self.filepaths[index], 'w') as file_open:
+            file_open.write(text)
+
+    def test_counter_from_corpus(self):
+        """Test that per-file counts add up to the counts of the whole text."""
+        frequencies = Frequency()
+        count = frequencies.counter_from_corpus('phi5')
+        self.assertEqual(count['arma'], 2)
+        self.assertEqual(count['catilina'], 1)
+        self.assertEqual(sum(count.values()), 16)
+        self.assertEqual(frequencies.counter_from_corpus('phi5', processes=2), count)
+        by_author = frequencies.counter_from_corpus('phi5', by_author=True)
+        self.assertEqual(sorted(by_author), ['LAT0474', 'LAT0690'])
+        self.assertEqual(by_author['LAT0690']['arma'], 2)
+
+    def test_counter_from_corpus_ngrams(self):
+        """Test counting bigrams."""
+        count = Frequency().counter_from_corpus('phi5', ngrams=2)
+        self.assertEqual(count[('quo', 'usque')], 1)
+        self.assertEqual(sum(count.values()), 14)
+
+    def test_counter_from_corpus_cache(self):
+        """Test that cached counts follow changes to the corpus files."""
+        frequencies = Frequency()
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+        count = frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        self.assertEqual(count, frequencies.counter_from_corpus('phi5'))
+        self._write(1, 'Arma virumque cano.')
+        os.utime(self.filepaths[1], (0, 0))
+        count = frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        self.assertEqual(count, frequencies.counter_from_corpus('phi5'))
+        self.assertEqual(count['arma'], 1)
+        self.assertNotIn('troiae', count)
+        self.filepaths.pop()
+        count = frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        self.assertEqual(count, frequencies.counter_from_corpus('phi5'))
+
+    def test_counter_from_corpus_cache_interrupted(self):
+        """Test that a run interrupted before saving its manifest leaves a
+        cache that later runs bring up to date correctly."""
+        frequencies = Frequency()
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+        frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        self._write(0, 'Quo usque tandem?')
+        os.utime(self.filepaths[0], (0, 0))
+        self.filepaths.pop()
+        dump = Frequency._dump
+
+        def interrupted_dump(obj, path):
+            if path.endswith('manifest.pickle'):
+                raise KeyboardInterrupt
+            dump(obj, path)
+
+        with patch.object(Frequency, '_dump', staticmethod(interrupted_dump)):
+            with self.assertRaises(KeyboardInterrupt):
+                frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        count = frequencies.counter_from_corpus('phi5', cache_dir=cache_dir)
+        self.assertEqual(count, frequencies.counter_from_corpus('phi5'))
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'phi5_1gram'))), 2)
+
+
+class TestImportTime(unittest.TestCase):
+    """Benchmark ``import cltk`` with ``python -X importtime`` and fail if it
+    regresses past the budget."""
+
+    # Cumulative microseconds allowed for ``import cltk`` itself.
+    IMPORT_BUDGET_US = 50000
+
+    @staticmethod
+    def _run(statement, *options):
+        """Run ``statement`` in a fresh interpreter; return the process."""
+        return subprocess.run([sys.executable, *options, '-c', statement],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, check=True)
+
+    def _import_times(self, statement):
+        """Parse ``-X importtime`` output into {module: cumulative us}."""
+        times = {}
+        for line in self._run(statement, '-X', 'importtime').stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            _, cumulative, module = line[len('import time:'):].split('|')
+            times[module.strip()] = int(cumulative)
+        return times
+
+    def _new_modules(self, statement):
+        """Names of the modules first imported by ``statement``."""
+        script = ('import sys; before = set(sys.modules); ' + statement +
+                  '; print("\\n".join(set(sys.modules) - before))')
+        return set(self._run(script).stdout.split())
+
+    def test_import_cltk_budget(self):
+        """Test that ``import cltk`` stays within its time budget."""
+        times = self._import_times('import cltk')
+        self.assertLess(times['cltk'], self.IMPORT_BUDGET_US)
+
+    def test_import_cltk_skips_pkg_resources(self):
+        """Test that ``import cltk`` does not scan installed distributions."""
+        self.assertNotIn('pkg_resources', self._new_modules('import cltk'))
+
+    def test_tokenize_skips_heavy_subpackages(self):
+        """Test that the word tokenizers load no tagger, vector or search code."""
+        modules = self._new_modules('import cltk.tokenize.word')
+        for heavy in ('cltk.tag', 'cltk.vector', 'cltk.ir', 'cltk.stop', 'gensim', 'whoosh'):
+            self.assertNotIn(heavy, modules)
+
+    def test_lazy_attributes(self):
+        """Test that version and heavy subpackages resolve on access."""
+        import cltk
+        self.assertTrue(cltk.__version__)
+        self.assertEqual(cltk.tag.__name__, 'cltk.tag')
+
+
 if __name__ == '__main__':
     unittest.main()
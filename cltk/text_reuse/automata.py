@@ -24,8 +24,14 @@ with the subject matter.
 __author__ = ['Eleftheria Chatziargyriou <ele.hatzy@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
+from array import array
+from itertools import islice
 import logging
+from multiprocessing import Pool
+import pickle
+import threading
 from cltk.exceptions import InputError
+from cltk.utils.model_registry import load_model
 
 LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
@@ -627,13 +633,322 @@ def walk_trie(dicts, w, q, A):
         if key == '__end__':
             continue
 
-        if A.transition_function(q, key) is None:
-            return
+        qj = A.transition_function(q, key)
+        if qj is None:
+            continue
+
+        yield from walk_trie(dicts[key], w + key, qj, A)
 
+
+class UniversalLevenshteinAutomaton:
+    """
+    Universal Levenshtein automaton for a given depth (maximal distance).
+
+    Unlike LevenshteinAutomaton, it does not depend on the query word, so one
+    instance serves every query of the same depth. A state is the window of
+    2 * depth + 1 cells of the Levenshtein matrix around the diagonal (values
+    capped at depth + 1); the input is the characteristic vector of the next
+    character, i.e. the bit mask of the positions in that window of the query
+    word at which it occurs. States and transitions are built lazily on first
+    use and cached, so after a warm-up a transition is a single dict lookup.
+
+    Use universal_automaton(depth) to get the shared instance for a depth.
+
+    >>> U = universal_automaton(1)
+    >>> q = U.start
+    >>> for i, char in enumerate('cans'):
+    ...     q = U.transition(q, U.vector(U.bit_masks('canis'), char, i))
+    >>> U.distance(q, len('canis'), len('cans'))
+    1
+    """
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.width = 2 * depth + 1
+        self.window = (1 << self.width) - 1
+        self.states = []
+        self.state_ids = {}
+        self.delta = {}
+        self._lock = threading.Lock()
+        # Row 0 of the matrix: D[0][j] = j, cells left of the matrix are dead
+        self.start = self._state_id(tuple(depth + 1 if j < 0 else min(j, depth + 1)
+                                          for j in range(-depth, depth + 1)))
+
+    def _state_id(self, state):
         try:
-            yield from walk_trie(dicts[key], w + key, A.transition_function(q, key), A)
-        except:
+            return self.state_ids[state]
+        except KeyError:
+            with self._lock:
+                if state not in self.state_ids:
+                    self.states.append(state)
+                    self.state_ids[state] = len(self.states) - 1
+                return self.state_ids[state]
+
+    def bit_masks(self, word):
+        """
+        :param word: str: the query word
+        :return: dict: character -> bit mask of its positions in word, shifted
+            by depth so that vector() never needs a negative shift
+        """
+        masks = {}
+        for i, char in enumerate(word):
+            masks[char] = masks.get(char, 0) | (1 << (i + self.depth))
+        return masks
+
+    def vector(self, masks, char, i):
+        """
+        :param masks: dict: bit masks of the query word, from bit_masks()
+        :param char: str: the character read
+        :param i: int: the number of characters read before char
+        :return: int: characteristic vector of char in the current window
+        """
+        return (masks.get(char, 0) >> i) & self.window
+
+    def transition(self, q, vector):
+        """
+        :param q: int: current state
+        :param vector: int: characteristic vector from vector()
+        :return: int: next state, or -1 once no cell is within depth
+        """
+        try:
+            return self.delta[q, vector]
+        except KeyError:
+            pass
+
+        row = self.states[q]
+        dead = self.depth + 1
+        new_row = []
+        left = dead
+        for t in range(self.width):
+            up = row[t + 1] if t + 1 < self.width else dead
+            cell = min(row[t] + (0 if vector >> t & 1 else 1), up + 1, left + 1, dead)
+            new_row.append(cell)
+            left = cell
+
+        qj = -1 if min(new_row) == dead else self._state_id(tuple(new_row))
+        self.delta[q, vector] = qj
+        return qj
+
+    def distance(self, q, word_length, i):
+        """
+        :param q: int: current state
+        :param word_length: int: length of the query word
+        :param i: int: the number of characters read
+        :return: int: distance between the query word and the characters read,
+            or depth + 1 if it exceeds depth
+        """
+        t = word_length - i + self.depth
+        if 0 <= t < self.width:
+            return self.states[q][t]
+        return self.depth + 1
+
+
+_UNIVERSAL_AUTOMATA = {}
+
+
+def universal_automaton(depth):
+    """
+    Return the shared UniversalLevenshteinAutomaton for the given depth.
+    """
+    try:
+        return _UNIVERSAL_AUTOMATA[depth]
+    except KeyError:
+        return _UNIVERSAL_AUTOMATA.setdefault(depth, UniversalLevenshteinAutomaton(depth))
+
+
+def _chunk(items, size):
+    """Yield successive lists of at most size items."""
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
             return
+        yield chunk
+
+
+_WORKER_INDEX = None
+
+
+def _init_worker(index):
+    global _WORKER_INDEX  # pylint: disable=global-statement
+    _WORKER_INDEX = index
+
+
+def _lookup_chunk(job):
+    words, depth = job
+    return [_WORKER_INDEX.lookup(word, depth) for word in words]
+
+
+class SpellIndex:
+    """
+    Spellcheck index over a lexicon, built once and reused for any number of
+    queries.
+
+    The lexicon is stored as a minimal acyclic automaton (DAWG): common
+    prefixes and suffixes are shared, and the graph is kept in flat arrays
+    rather than nested dictionaries. Queries walk it together with the
+    universal Levenshtein automaton of the requested depth, abandoning a
+    branch as soon as no completion can stay within the depth.
+
+    >>> index = SpellIndex(['pes', 'pesse', 'pease', 'peis', 'peisse', 'pise', 'peose', 'poese', 'poisen'])
+    >>> index.lookup('pece', depth = 2)
+    ['pease', 'peis', 'peose', 'pes', 'pesse', 'pise', 'poese']
+
+    >>> index.suggest(['pesa', 'pise', 'pesa'], depth = 1)
+    {'pesa': ['pes'], 'pise': ['pise']}
+
+    The index can be saved to disk and loaded again; loaded indices are
+    cached in the model registry.
+
+    >>> index.save('/tmp/spell.index')  # doctest: +SKIP
+    >>> index = SpellIndex.load('/tmp/spell.index')  # doctest: +SKIP
+    """
+
+    ARTIFACT_VERSION = 1
+
+    def __init__(self, wordlist = ()):
+        """
+        :param wordlist: iterable of str: the lexicon
+        """
+        # Edges of node n are edge_label[k], edge_target[k] for
+        # edge_start[n] <= k < edge_start[n + 1]; the root is node 0.
+        self.edge_start = array('I', [0])
+        self.edge_target = array('I')
+        self.edge_label = ''
+        self.final = bytearray()
+        self.size = 0
+        self._build(wordlist)
+
+    def _build(self, wordlist):
+        trie = {}
+        for w in wordlist:
+            curr = trie
+            for l in w:
+                curr = curr.setdefault(l, {})
+            if None not in curr:
+                curr[None] = True
+                self.size += 1
+
+        # Merge equivalent subtries bottom-up; registry maps a node signature
+        # (final, ((label, child), ...)) to its id.
+        registry = {}
+        nodes = []
+
+        def register(node):
+            edges = tuple(sorted((l, register(child)) for l, child in node.items() if l is not None))
+            signature = (None in node, edges)
+            if signature not in registry:
+                registry[signature] = len(nodes)
+                nodes.append(signature)
+            return registry[signature]
+
+        root = register(trie)
+        # Renumber so that the root is node 0
+        order = [root] + [n for n in range(len(nodes)) if n != root]
+        new_id = {old: new for new, old in enumerate(order)}
+        labels = []
+        for old in order:
+            is_final, edges = nodes[old]
+            self.final.append(is_final)
+            for l, child in edges:
+                labels.append(l)
+                self.edge_target.append(new_id[child])
+            self.edge_start.append(len(self.edge_target))
+        self.edge_label = ''.join(labels)
+
+    def lookup(self, word, depth = 2):
+        """
+        Return all words w' in the lexicon with LevenshteinDistance(word, w') <= depth
+
+        :param word: str
+        :param depth: int
+        :return: sorted list of str
+        """
+        U = universal_automaton(depth)
+        masks = U.bit_masks(word)
+        n = len(word)
+        edge_start, edge_target, edge_label, final = self.edge_start, self.edge_target, self.edge_label, self.final
+        found = []
+        stack = [(0, '', U.start)]
+        while stack:
+            node, w, q = stack.pop()
+            i = len(w)
+            if final[node] and U.distance(q, n, i) <= depth:
+                found.append(w)
+            for k in range(edge_start[node], edge_start[node + 1]):
+                l = edge_label[k]
+                qj = U.transition(q, (masks.get(l, 0) >> i) & U.window)
+                if qj >= 0:
+                    stack.append((edge_target[k], w + l, qj))
+        return sorted(found)
+
+    def suggest(self, words, depth = 2, processes = 1, chunksize = 1024):
+        """
+        Look up many words at once, e.g. all unknown tokens of an OCRed text.
+        Each distinct word is looked up only once.
+
+        :param words: iterable of str
+        :param depth: int
+        :param processes: int: number of worker processes; None for one per CPU
+        :param chunksize: int: number of words sent to a worker at a time
+        :return: dict: word -> sorted list of suggestions
+        """
+        unique = list(dict.fromkeys(words))
+        if processes == 1 or len(unique) <= chunksize:
+            return {w: self.lookup(w, depth) for w in unique}
+
+        results = {}
+        with Pool(processes, initializer = _init_worker, initargs = (self,)) as pool:
+            jobs = ((chunk, depth) for chunk in _chunk(unique, chunksize))
+            for chunk, suggestions in zip(_chunk(unique, chunksize), pool.imap(_lookup_chunk, jobs)):
+                results.update(zip(chunk, suggestions))
+        return results
+
+    def __contains__(self, word):
+        node = 0
+        for l in word:
+            for k in range(self.edge_start[node], self.edge_start[node + 1]):
+                if self.edge_label[k] == l:
+                    node = self.edge_target[k]
+                    break
+            else:
+                return False
+        return bool(self.final[node])
+
+    def __len__(self):
+        return self.size
+
+    def save(self, path):
+        """
+        Write the index to path.
+
+        :param path: str
+        """
+        artifact = {'artifact_version': self.ARTIFACT_VERSION,
+                    'class': type(self).__name__,
+                    'state': self.__dict__}
+        with open(path, 'wb') as file_open:
+            pickle.dump(artifact, file_open, protocol = pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index written by save(), through the model registry.
+
+        :param path: str
+        :return: SpellIndex
+        """
+        artifact = load_model(path, loader = cls._load_artifact)
+        if artifact.get('artifact_version') != cls.ARTIFACT_VERSION or artifact.get('class') != cls.__name__:
+            raise ValueError('{} is not a {} (version {}) artifact.'.format(path, cls.__name__, cls.ARTIFACT_VERSION))
+        index = cls.__new__(cls)
+        index.__dict__.update(artifact['state'])
+        return index
+
+    @staticmethod
+    def _load_artifact(path):
+        with open(path, 'rb') as file_open:
+            return pickle.load(file_open)
 
 
 def spellcheck(word, wordlist, depth = 2):
@@ -641,6 +956,9 @@ def spellcheck(word, wordlist, depth = 2):
     Given a word list and a depth parameter, return all words w' in the wordlist
     with LevenshteinDistance(word, w') <= depth
 
+    To check many words against the same word list, build a SpellIndex once
+    and use its suggest() method instead.
+
     :param word:
     :param wordlist:
 
@@ -651,8 +969,4 @@ def spellcheck(word, wordlist, depth = 2):
     >>> spellcheck('pece', Dic, depth = 3)
     ['pease', 'peis', 'peisse', 'peose', 'pes', 'pesse', 'pise', 'poese']
     """
-    Aut = LevenshteinAutomaton(word, depth = depth).convert_to_deterministic()
-    W = make_worlist_trie(wordlist)
-
-    return sorted(list(walk_trie(W, '', Aut.s, Aut)))
-
+    return SpellIndex(wordlist).lookup(word, depth)
@@ -48,6 +48,11 @@ class Comparison:
         self.language_a = None
         self.language_b = None
 
+        # Positions of the compared strings in their input lists, set by
+        # sparse comparisons such as TextReuse.find_reuse()
+        self.index_a = None
+        self.index_b = None
+
         return
 
     def set_ref_a(self, text_ref):
@@ -120,6 +125,15 @@ def long_substring(str_a, str_b):
                     substr = data[0][i:i+j]
     return substr.strip()
 
+def shingles(text, size=3):
+    """Return the set of overlapping character n-grams ("shingles") of text.
+    :param text: str
+    :param size: int
+    :rtype: set
+    """
+    return set(text[i:i + size] for i in range(len(text) - size + 1))
+
+
 def minhash(str_a, str_b):
         """
         :param str_a: str
@@ -135,7 +149,6 @@ def minhash(str_a, str_b):
         score = 0.0
         tok_sent_1 = str_a
         tok_sent_2 = str_b
-        shingles = lambda s: set(s[i:i+3] for i in range(len(s)-2))
         try:
             jaccard_distance = lambda seta, setb: len(seta & setb)/float(len(seta | setb))
             score = jaccard_distance(shingles(tok_sent_1), shingles(tok_sent_2))
@@ -0,0 +1,327 @@
+"""Fast edit-distance kernels for text reuse, scansion and spellchecking.
+
+* ``levenshtein_distance()`` uses Myers' bit-parallel algorithm (as
+  formulated by Hyyrö), which processes a whole column of the dynamic
+  programming matrix per character with a handful of integer operations;
+* ``damerau_levenshtein_distance()`` computes the unrestricted
+  (Lowrance-Wagner) Damerau-Levenshtein distance, in which a transposition
+  of characters counts as one edit;
+* ``distances()`` and ``distance_matrix()`` compare one string against many,
+  or many against many, running the bit-parallel recurrence over all
+  candidates at once with NumPy.
+
+Every function takes an optional ``max_distance``: once a distance is known to
+exceed it, computation stops and ``max_distance + 1`` is returned instead.
+
+When ``rapidfuzz`` (or, for plain Levenshtein distance, ``python-Levenshtein``)
+is installed it is used as a native backend; ``BACKEND`` names the backend in
+use. Results are identical with and without it.
+
+>>> levenshtein_distance('noctis', 'noctem')
+2
+>>> damerau_levenshtein_distance('orbis', 'robis')
+1
+>>> [int(d) for d in distances('arma', ['armis', 'arma', 'uirum'], max_distance=2)]
+[2, 0, 3]
+"""
+
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from rapidfuzz.distance import DamerauLevenshtein as _rf_damerau
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+    from rapidfuzz.process import cdist as _rf_cdist
+except ImportError:  # pragma: no cover
+    _rf_damerau = _rf_levenshtein = _rf_cdist = None
+
+try:
+    from Levenshtein import distance as _pl_distance
+except ImportError:  # pragma: no cover
+    _pl_distance = None
+
+if _rf_levenshtein is not None:
+    BACKEND = 'rapidfuzz'
+elif _pl_distance is not None:  # pragma: no cover
+    BACKEND = 'python-Levenshtein'
+else:  # pragma: no cover
+    BACKEND = 'python'
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+# Longest query handled by the NumPy batch kernel (one uint64 bit-vector);
+# longer queries are compared pair by pair with Python's big integers.
+_WORD_BITS = 64
+
+
+def _cap(distance: int, max_distance: int = None) -> int:
+    """Clip a distance to ``max_distance + 1``."""
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def _myers_distance(str_a: str, str_b: str, max_distance: int = None) -> int:
+    """Pure-Python bit-parallel Levenshtein distance. Python integers are
+    unbounded, so this works for strings of any length; it is fastest when
+    ``str_a`` is the shorter string.
+    """
+    len_a, len_b = len(str_a), len(str_b)
+    if max_distance is not None and abs(len_a - len_b) > max_distance:
+        return max_distance + 1
+    if not len_a:
+        return _cap(len_b, max_distance)
+
+    peq = {}
+    for i, char in enumerate(str_a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << len_a) - 1
+    last = 1 << (len_a - 1)
+    vp, vn = mask, 0
+    score = len_a
+    for j, char in enumerate(str_b):
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        # Each remaining column can lower the score by at most one.
+        if max_distance is not None and score - (len_b - j - 1) > max_distance:
+            return max_distance + 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv
+    return _cap(score, max_distance)
+
+
+def _damerau_levenshtein(str_a: str, str_b: str) -> int:
+    """Pure-Python unrestricted Damerau-Levenshtein distance (Lowrance and
+    Wagner's recurrence), keeping the last row seen for each character in a
+    dict.
+    """
+    len_a, len_b = len(str_a), len(str_b)
+    inf = len_a + len_b
+    # rows[i + 1][j + 1] holds the distance between str_a[:i] and str_b[:j].
+    rows = [[inf] * (len_b + 2), [inf] + list(range(len_b + 1))]
+    last_row = {}
+    for i in range(1, len_a + 1):
+        char_a = str_a[i - 1]
+        prev = rows[i]
+        row = [inf, i] + [0] * len_b
+        last_col = 0
+        for j in range(1, len_b + 1):
+            char_b = str_b[j - 1]
+            k = last_row.get(char_b, 0)
+            l = last_col
+            if char_a == char_b:
+                cost = 0
+                last_col = j
+            else:
+                cost = 1
+            row[j + 1] = min(prev[j] + cost, row[j] + 1, prev[j + 1] + 1,
+                             rows[k][l] + (i - k - 1) + 1 + (j - l - 1))
+        rows.append(row)
+        last_row[char_a] = i
+    return rows[-1][-1]
+
+
+def levenshtein_distance(str_a: str, str_b: str, max_distance: int = None) -> int:
+    """Return the Levenshtein distance between two strings.
+
+    :param str_a: First string.
+    :type str_a: str
+    :param str_b: Second string.
+    :type str_b: str
+    :param max_distance: Stop once the distance is known to exceed this
+        value and return ``max_distance + 1``.
+    :type max_distance: int
+    :rtype: int
+
+    >>> levenshtein_distance('nox', 'nochem')
+    4
+    >>> levenshtein_distance('nox', 'nochem', max_distance=2)
+    3
+    """
+    if _rf_levenshtein is not None:
+        return _rf_levenshtein.distance(str_a, str_b, score_cutoff=max_distance)
+    if _pl_distance is not None:
+        return _cap(_pl_distance(str_a, str_b), max_distance)
+    if len(str_a) > len(str_b):
+        str_a, str_b = str_b, str_a
+    return _myers_distance(str_a, str_b, max_distance)
+
+
+def damerau_levenshtein_distance(str_a: str, str_b: str, max_distance: int = None) -> int:
+    """Return the (unrestricted) Damerau-Levenshtein distance between two
+    strings, which also counts a transposition of characters as one edit.
+
+    :param str_a: First string.
+    :type str_a: str
+    :param str_b: Second string.
+    :type str_b: str
+    :param max_distance: Stop once the distance is known to exceed this
+        value and return ``max_distance + 1``.
+    :type max_distance: int
+    :rtype: int
+
+    >>> damerau_levenshtein_distance('ca', 'abc')
+    2
+    """
+    if _rf_damerau is not None:
+        return _rf_damerau.distance(str_a, str_b, score_cutoff=max_distance)
+    if max_distance is not None:
+        if abs(len(str_a) - len(str_b)) > max_distance:
+            return max_distance + 1
+        # A transposition costs two Levenshtein edits, so the Levenshtein
+        # distance is at most twice the Damerau-Levenshtein distance.
+        if levenshtein_distance(str_a, str_b, 2 * max_distance) > 2 * max_distance:
+            return max_distance + 1
+    return _cap(_damerau_levenshtein(str_a, str_b), max_distance)
+
+
+class _EncodedStrings:
+    """Candidates encoded once as a padded matrix of alphabet codes, so that
+    each query only has to build a small lookup table.
+    """
+
+    def __init__(self, strings: Sequence[str]):
+        self.strings = list(strings)
+        self.alphabet = {}
+        for string in self.strings:
+            for char in string:
+                self.alphabet.setdefault(char, len(self.alphabet))
+        self.lengths = np.array([len(string) for string in self.strings], dtype=np.int64)
+        width = int(self.lengths.max()) if self.strings else 0
+        # Padding uses the extra code len(alphabet), which never matches.
+        self.codes = np.full((len(self.strings), width), len(self.alphabet), dtype=np.int32)
+        for row, string in enumerate(self.strings):
+            self.codes[row, :len(string)] = [self.alphabet[char] for char in string]
+
+    def distances(self, query: str, max_distance: int = None):
+        """Levenshtein distances from ``query`` to every encoded string."""
+        len_q = len(query)
+        if len_q > _WORD_BITS:
+            result = [_myers_distance(string, query, max_distance) if len(string) < len_q
+                      else _myers_distance(query, string, max_distance)
+                      for string in self.strings]
+            return np.array(result, dtype=np.int64)
+        if not len_q:
+            result = self.lengths.copy()
+        else:
+            table = np.zeros(len(self.alphabet) + 1, dtype=np.uint64)
+            for i, char in enumerate(query):
+                code = self.alphabet.get(char)
+                if code is not None:
+                    table[code] |= np.uint64(1 << i)
+            result = self._myers(table[self.codes], len_q)
+        if max_distance is not None:
+            result = np.minimum(result, max_distance + 1)
+        return result
+
+    def _myers(self, peq, len_q: int):
+        """Bit-parallel recurrence run over all candidates, one column per
+        step; rows whose string has ended keep their score.
+        """
+        count, width = peq.shape
+        one = np.uint64(1)
+        mask = np.uint64((1 << len_q) - 1)
+        last = np.uint64(1 << (len_q - 1))
+        vp = np.full(count, mask, dtype=np.uint64)
+        vn = np.zeros(count, dtype=np.uint64)
+        score = np.full(count, len_q, dtype=np.int64)
+        for j in range(width):
+            eq = peq[:, j]
+            active = self.lengths > j
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+            score += ((hp & last) != 0) & active
+            score -= ((hn & last) != 0) & active
+            hp = (hp << one) | one
+            hn = hn << one
+            vp = (hn | ~(xv | hp)) & mask
+            vn = hp & xv
+        return score
+
+
+def distances(query: str, candidates: Sequence[str], max_distance: int = None):
+    """Return the Levenshtein distances from ``query`` to each candidate.
+
+    :param query: String to compare.
+    :type query: str
+    :param candidates: Strings to compare against.
+    :type candidates: list
+    :param max_distance: Distances above this value are returned as
+        ``max_distance + 1``.
+    :type max_distance: int
+    :return: One distance per candidate, as a NumPy array (a list when NumPy
+        is not installed).
+    """
+    if _rf_cdist is not None and np is not None:
+        return distance_matrix([query], candidates, max_distance)[0]
+    if np is None:
+        return [levenshtein_distance(query, candidate, max_distance) for candidate in candidates]
+    if not candidates:
+        return np.zeros(0, dtype=np.int64)
+    return _EncodedStrings(candidates).distances(query, max_distance)
+
+
+def distance_matrix(strings_a: Sequence[str], strings_b: Sequence[str], max_distance: int = None):
+    """Return the matrix of Levenshtein distances between every string of
+    ``strings_a`` (rows) and every string of ``strings_b`` (columns).
+
+    :param strings_a: list
+    :param strings_b: list
+    :param max_distance: Distances above this value are returned as
+        ``max_distance + 1``.
+    :type max_distance: int
+    :return: NumPy array of shape ``(len(strings_a), len(strings_b))`` (a
+        list of lists when NumPy is not installed).
+
+    >>> distance_matrix(['arma', 'arua'], ['armis', 'aruis']).tolist()
+    [[2, 3], [3, 2]]
+    """
+    if np is None:
+        return [[levenshtein_distance(str_a, str_b, max_distance) for str_b in strings_b]
+                for str_a in strings_a]
+    if _rf_cdist is not None:
+        return _rf_cdist(strings_a, strings_b, scorer=_rf_levenshtein.distance,
+                         score_cutoff=max_distance, dtype=np.int64)
+    result = np.zeros((len(strings_a), len(strings_b)), dtype=np.int64)
+    if len(strings_a) and len(strings_b):
+        encoded = _EncodedStrings(strings_b)
+        for row, str_a in enumerate(strings_a):
+            result[row] = encoded.distances(str_a, max_distance)
+    return result
+
+
+def closest(query: str, candidates: Sequence[str], max_distance: int = None) -> List[str]:
+    """Return the candidates nearest to ``query``, in their original order;
+    empty if none is within ``max_distance``.
+
+    :param query: str
+    :param candidates: list
+    :param max_distance: int
+    :rtype: list
+
+    >>> closest('arna', ['arma', 'arua', 'uirum'])
+    ['arma', 'arua']
+    """
+    if not candidates:
+        return []
+    scores = list(distances(query, candidates, max_distance))
+    best = min(scores)
+    if max_distance is not None and best > max_distance:
+        return []
+    return [candidate for candidate, score in zip(candidates, scores) if score == best]
@@ -1,6 +1,9 @@
 """Tools for working with Levenshtein distance algorithm and distance ratio between strings.
 """
 
+from cltk.text_reuse.distance import damerau_levenshtein_distance
+from cltk.text_reuse.distance import levenshtein_distance
+
 __author__ = ['Luke Hollis <lukehollis@gmail.com>', 'Eleftheria Chatziargyriou <ele.hatzy@gmail.com>']
 __license__ = 'MIT License. See LICENSE.'
 
@@ -33,24 +36,7 @@ class Levenshtein:
             >>> Levenshtein.Levenshtein_Distance('orbis', 'robis')
             2
         """
-        m, n = len(w1), len(w2)
-        v1 = [i for i in range(n + 1)]
-        v2 = [0 for i in range(n + 1)]
-
-        for i in range(m):
-            v2[0] = i + 1
-
-            for j in range(n):
-                delCost = v1[j + 1] + 1
-                insCost = v2[j] + 1
-
-                subCost = v1[j]
-                if w1[i] != w2[j]: subCost += 1
-
-                v2[j + 1] = min(delCost, insCost, subCost)
-            v1, v2 = v2, v1
-
-        return v1[-1]
+        return levenshtein_distance(w1, w2)
 
     @staticmethod
     def Damerau_Levenshtein_Distance(w1, w2):
@@ -77,48 +63,11 @@ class Levenshtein:
             >>> Levenshtein.Damerau_Levenshtein_Distance('orbis', 'robis')
             1
 
-        """
-        # Define alphabet
-        alph = sorted(list(set(w1 + w2)))
-        # Calculate alphabet size
-        alph_s = len(alph)
-        dam_ar = [0 for _ in range(alph_s)]
-        mat = [[0 for _ in range(len(w2) + 2)] for _ in range(len(w1) + 2)]
-
-        max_dist = len(w1) + len(w2)
-        mat[0][0] = max_dist
-
-        # Initialize matrix margin to the maximum possible distance (essentially inf) for ease of calculations (avoiding try blocks)
+            See ``cltk.text_reuse.distance`` for variants with an early
+            cut-off and for batched comparisons.
 
-        for i in range(1, len(w1) + 2):
-            mat[i][0] = max_dist
-            mat[i][1] = i - 1
-
-        for i in range(1, len(w2) + 2):
-            mat[0][i] = max_dist
-            mat[1][i] = i - 1
-
-        for i in range(2, len(w1) + 2):
-            tem = 0
-
-            for j in range(2, len(w2) + 2):
-
-                k = dam_ar[alph.index(w2[j - 2])]
-                l = tem
-
-                if w1[i - 2] == w2[j - 2]:
-                    cost = 0
-                    tem = j
-                else:
-                    cost = 1
-
-                # The reccurence relation of DL is identical to that of Levenshtein with the addition of transposition
-                mat[i][j] = min(mat[i - 1][j - 1] + cost, mat[i][j - 1] + 1, mat[i - 1][j] + 1,
-                                mat[k - 1][l - 1] + i + j - k - l - 1)
-
-            dam_ar[alph.index(w1[i - 2])] = i
-
-        return mat[-1][-1]
+        """
+        return damerau_levenshtein_distance(w1, w2)
 
     @staticmethod
     def ratio(string_a, string_b):
@@ -0,0 +1,145 @@
+"""
+MinHash signatures and locality-sensitive hashing (LSH) for finding
+candidate pairs of similar passages without comparing every pair.
+
+Each passage is reduced to its set of character shingles (as in
+``comparison.minhash()``) and summarized by a fixed-length MinHash
+signature, whose agreement estimates the Jaccard similarity of two shingle
+sets. Signatures are cut into bands; passages sharing any band are
+candidates. With ``b`` bands of ``r`` rows, pairs with Jaccard similarity
+above roughly ``(1/b) ** (1/r)`` are very likely to become candidates.
+"""
+
+from collections import defaultdict
+import random
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+import zlib
+
+from cltk.text_reuse.comparison import shingles
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) % p; small
+# enough that a * x fits in 64 bits for 32-bit shingle hashes.
+_PRIME = (1 << 31) - 1
+
+
+class MinHashLSH:
+    """An LSH index of MinHash signatures.
+
+    >>> index = MinHashLSH()
+    >>> index.add('georg', 'dique deaeque omnes, studium quibus arua tueri,')
+    >>> index.add('prop', 'dique deaeque omnes, quibus est tutela per agros,')
+    >>> index.add('aen', 'arma uirumque cano, Troiae qui primus ab oris')
+    >>> sorted(index.query('dique deaeque omnes, studium quibus arua tueri'))
+    ['georg', 'prop']
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 3, seed: int = 1):
+        """
+        :param num_perm: Length of the MinHash signatures.
+        :param bands: Number of LSH bands; must divide ``num_perm``. More
+            bands lower the similarity at which pairs become candidates.
+        :param shingle_size: Length of the character shingles.
+        :param seed: Seed for the hash functions; indices must share it to
+            be comparable.
+        """
+        if num_perm % bands:
+            raise ValueError('num_perm ({}) must be a multiple of bands ({}).'.format(num_perm, bands))
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_array = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_array = np.array(self._b, dtype=np.uint64)[:, None]
+        self._buckets = defaultdict(list)  # (band, band values) -> keys
+        self._signatures = {}  # type: Dict[Hashable, Tuple[int, ...]]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """Return the MinHash signature of ``text``. Texts shorter than a
+        shingle are treated as a single shingle.
+        :param text: str
+        :return: tuple of ``num_perm`` ints
+        """
+        grams = shingles(text, self.shingle_size) or {text}
+        hashes = [zlib.crc32(gram.encode('utf-8')) % _PRIME for gram in grams]
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            mins = ((self._a_array * values + self._b_array) % _PRIME).min(axis=1)
+            return tuple(mins.tolist())
+        return tuple(min((a * value + b) % _PRIME for value in hashes)
+                     for a, b in zip(self._a, self._b))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: Hashable, text: str):
+        """Index ``text`` under ``key``.
+        :param key: Any hashable identifier, e.g. a sentence number.
+        :param text: str
+        """
+        signature = self.signature(text)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def query(self, text: str) -> Set[Hashable]:
+        """Return the keys of indexed texts that share a band with ``text``.
+        :param text: str
+        :return: set
+        """
+        candidates = set()
+        for band_key in self._band_keys(self.signature(text)):
+            candidates.update(self._buckets.get(band_key, ()))
+        return candidates
+
+    def jaccard(self, key_a: Hashable, key_b: Hashable) -> float:
+        """Estimate the Jaccard similarity of two indexed texts from their
+        signatures.
+        :return: float
+        """
+        sig_a, sig_b = self._signatures[key_a], self._signatures[key_b]
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / self.num_perm
+
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """Return all pairs of indexed keys sharing at least one band.
+        :return: set of (key, key) tuples
+        """
+        pairs = set()
+        for keys in self._buckets.values():
+            for i, key_a in enumerate(keys):
+                for key_b in keys[i + 1:]:
+                    if key_a != key_b:
+                        pairs.add((key_a, key_b))
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def candidate_pairs(texts_a: List[str], texts_b: List[str], num_perm: int = 128, bands: int = 32,
+                    shingle_size: int = 3) -> List[Tuple[int, int]]:
+    """Return sorted ``(i, j)`` index pairs such that ``texts_a[i]`` and
+    ``texts_b[j]`` are likely similar, without comparing all pairs.
+
+    >>> candidate_pairs(['arma uirumque cano', 'dique deaeque omnes'], ['dique deaeque omnes,'])
+    [(1, 0)]
+    """
+    index = MinHashLSH(num_perm=num_perm, bands=bands, shingle_size=shingle_size)
+    for j, text in enumerate(texts_b):
+        index.add(j, text)
+    pairs = []
+    for i, text in enumerate(texts_a):
+        pairs.extend((i, j) for j in sorted(index.query(text)))
+    return pairs
@@ -8,6 +8,7 @@ from cltk.tokenize.sentence import TokenizeSentence
 from cltk.utils.cltk_logger import logger
 from cltk.text_reuse.levenshtein import Levenshtein
 from cltk.text_reuse.comparison import Comparison
+from cltk.text_reuse.lsh import MinHashLSH
 from cltk.stem.latin.stem import Stemmer
 
 
@@ -39,6 +40,8 @@ class TextReuse:
         self.text_ref_b = text_ref_b
         self.stem_words = stem_words
         self.sanitize_input = sanitize_input
+        # Sentence tokenizers made by compare_sentences(), by language
+        self._sent_tokenizers = {}
 
         return
 
@@ -55,21 +58,18 @@ class TextReuse:
         sents_b = []
         ratios = []
 
-        # Make the latin tokenizer
-        if language == "latin":
-            sent_tokenizer = TokenizeSentence('latin')
-
-        # Make the greek tokenizer
-        elif language == "greek":
-            sent_tokenizer = TokenizeSentence('greek')
-
-        # Otherwise, if language, is unsupported, throw error stating accepted Language
+        # If language, is unsupported, throw error stating accepted Language
         # values that may be used to tokenize sentences
-        else:
+        if language not in ("latin", "greek"):
             print("Language for sentence tokenization not recognized. "
                   "Accepted values are 'latin' and 'greek'.")
             return
 
+        # Make the tokenizer on the first comparison in this language
+        sent_tokenizer = self._sent_tokenizers.get(language)
+        if sent_tokenizer is None:
+            sent_tokenizer = self._sent_tokenizers[language] = TokenizeSentence(language)
+
         # If class instance is set to stem words, do so
         if self.stem_words:
             stemmer = Stemmer()
@@ -112,6 +112,57 @@ class TextReuse:
 
         return comparisons
 
+    def find_reuse(self, list_a, list_b, threshold=0.6, num_perm=128, bands=32, shingle_size=3):
+        """
+        Find similar pairs between two lists of passages (e.g. sentences or
+        lines) without scoring every pair. MinHash/LSH proposes candidate
+        pairs, which are then scored with the Levenshtein ratio; only pairs
+        scoring at least threshold are returned.
+
+        The defaults (32 bands of 4 rows) make pairs whose shingle sets have a
+        Jaccard similarity above ~0.4 very likely candidates; raise bands to
+        trade speed for recall.
+        :param list_a: list [str]
+        :param list_b: list [str]
+        :param threshold: float
+        :param num_perm: int
+        :param bands: int
+        :param shingle_size: int
+        :return: list [Comparison], sorted by (index_a, index_b)
+        """
+
+        if self.stem_words:
+            stemmer = Stemmer()
+            list_a = [stemmer.stem(text) for text in list_a]
+            list_b = [stemmer.stem(text) for text in list_b]
+
+        sents_a = self._process_sentences(list_a)
+        sents_b = self._process_sentences(list_b)
+        key = 'sanitized' if self.sanitize_input else 'text'
+
+        index = MinHashLSH(num_perm=num_perm, bands=bands, shingle_size=shingle_size)
+        for j, sent_b in enumerate(sents_b):
+            index.add(j, sent_b[key])
+
+        comparisons = []
+        l = Levenshtein()
+        for i, sent_a in enumerate(sents_a):
+            for j in sorted(index.query(sent_a[key])):
+                sent_b = sents_b[j]
+                ratio = l.ratio(sent_a[key], sent_b[key])
+                if ratio < threshold:
+                    continue
+                new_comparison = Comparison(sent_a['text'], sent_b['text'], ratio)
+                new_comparison.index_a = i
+                new_comparison.index_b = j
+                if self.text_ref_a:
+                    new_comparison.set_ref_a(self.text_ref_a)
+                if self.text_ref_b:
+                    new_comparison.set_ref_b(self.text_ref_b)
+                comparisons.append(new_comparison)
+
+        return comparisons
+
     def _calculate_ratios(self, list_a, list_b):
         """
         Calulate a matrix of string comparisons given two input lists
@@ -174,7 +225,7 @@ class TextReuse:
                             }
             # If the class is set to santize input before comparison, do so
             if self.sanitize_input:
-                processed_sent['sanitized'] = self._sanitize(sent),
+                processed_sent['sanitized'] = self._sanitize(sent)
 
             processed_sents.append(processed_sent)
 
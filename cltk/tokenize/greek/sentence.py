@@ -9,7 +9,7 @@ import re
 
 from cltk.tokenize.sentence import BaseSentenceTokenizer, BaseRegexSentenceTokenizer, BasePunktSentenceTokenizer
 from cltk.tokenize.greek.params import GreekLanguageVars
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
 from nltk.tokenize.punkt import PunktLanguageVars
 
@@ -35,7 +35,7 @@ class GreekPunktSentenceTokenizer(BasePunktSentenceTokenizer):
         self.models_path = GreekPunktSentenceTokenizer.models_path
 
         try:
-            self.model =  open_pickle(os.path.join(os.path.expanduser(self.models_path), 'greek_punkt.pickle'))
+            self.model =  load_model(os.path.join(os.path.expanduser(self.models_path), 'greek_punkt.pickle'), language='greek')
         except FileNotFoundError as err:
             raise type(err)(GreekPunktSentenceTokenizer.missing_models_message)
 
@@ -9,7 +9,7 @@ import nltk
 from nltk.tokenize.punkt import PunktLanguageVars
 from cltk.tokenize.sentence import BaseSentenceTokenizer, BasePunktSentenceTokenizer
 from cltk.tokenize.latin.params import LatinLanguageVars, PUNCTUATION, STRICT_PUNCTUATION
-from cltk.utils.file_operations import open_pickle
+from cltk.utils.model_registry import load_model
 
 def SentenceTokenizer(tokenizer:str = 'punkt', strict:bool = False):
     if tokenizer=='punkt':
@@ -35,7 +35,7 @@ class LatinPunktSentenceTokenizer(BasePunktSentenceTokenizer):
         self.models_path = LatinPunktSentenceTokenizer.models_path
 
         try:
-            self.model =  open_pickle(os.path.join(self.models_path, 'latin_punkt.pickle'))
+            self.model =  load_model(os.path.join(self.models_path, 'latin_punkt.pickle'), language='latin')
         except FileNotFoundError as err:
             raise type(err)(LatinPunktSentenceTokenizer.missing_models_message)
 
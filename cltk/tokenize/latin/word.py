@@ -5,7 +5,9 @@ __author__ = ['Patrick J. Burns <patrick@diyclassics.org>',
 __license__ = 'MIT License.'
 
 import re
-from typing import List, Tuple
+from array import array
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Pattern, Tuple
 
 from nltk.tokenize.punkt import PunktSentenceTokenizer, PunktParameters
 
@@ -14,6 +16,93 @@ from cltk.tokenize.latin.params import latin_exceptions
 from cltk.tokenize.latin.params import latin_replacements as REPLACEMENTS
 from cltk.tokenize.latin.sentence import SentenceTokenizer
 from cltk.tokenize.latin.params import LatinLanguageVars
+from cltk.tokenize.utils import OffsetMap
+
+
+def _match_case(word: str, matched: str) -> str:
+    """Give a replacement the case of the text it replaces (after the Python
+    Cookbook)."""
+    if matched.isupper():
+        return word.upper()
+    elif matched.islower():
+        return word.lower()
+    elif matched[0].isupper():
+        return word.capitalize()
+    return word
+
+
+WHOLE_WORD = re.compile(r'\\b(\w+)\\b')
+
+
+@lru_cache(maxsize=32)
+def _compile_replacements(replacements: Tuple[Tuple[str, str], ...]
+                          ) -> Tuple[Tuple[Pattern, Callable], ...]:
+    """Return the substitutions, as pairs of a compiled pattern and a
+    replacement function, which applied in turn to a text replace a list of
+    replacements as successive case-insensitive ``re.sub()`` calls would.
+
+    When each pattern is a whole word, like the default
+    ``r'\bmecum\b'``, and no replacement contains one of them, they are
+    made into a single regex which only tries the words at the letters they
+    start with, and which looks the replacement up by the word found.
+    Otherwise there is a substitution for each compiled pattern.
+    """
+    compiled = [re.compile(pattern, flags=re.IGNORECASE) for pattern, _ in replacements]
+    whole_words = [WHOLE_WORD.fullmatch(pattern) for pattern, _ in replacements]
+    cascading = any(comp.search(word) for comp in compiled for _, word in replacements)
+
+    if not replacements or cascading or not all(whole_words):
+        return tuple((comp, lambda matching, word=word: _match_case(word, matching.group()))
+                     for comp, (_, word) in zip(compiled, replacements))
+
+    words = [whole_word.group(1) for whole_word in whole_words]
+    by_word = {}  # type: Dict[str, str]
+    for word, (_, replacement) in zip(words, replacements):
+        by_word.setdefault(word.lower(), replacement)
+    initials = ''.join(sorted({re.escape(word[0]) for word in words}))
+    combined = re.compile(r'\b(?=[{0}])(?:{1})\b'.format(initials, '|'.join(words)),
+                          flags=re.IGNORECASE)
+
+    def replace(matching):
+        found = matching.group()
+        replacement = by_word.get(found.lower())
+        if replacement is None:  # a case-insensitive match str.lower() does not fold
+            replacement = next(word for comp, (_, word) in zip(compiled, replacements)
+                               if comp.fullmatch(found))
+        return _match_case(replacement, found)
+
+    return ((combined, replace),)
+
+
+def _enclitic_trie(enclitics: Iterable[str]) -> Dict:
+    """Build a trie of the enclitics read backwards, each ending in a node
+    holding its index in ``enclitics`` under the key None."""
+    trie = {}  # type: Dict
+    for i, enclitic in enumerate(enclitics):
+        node = trie
+        for char in reversed(enclitic):
+            node = node.setdefault(char, {})
+        node.setdefault(None, i)
+    return trie
+
+
+def _find_enclitic(token: str, trie: Dict, enclitics: List[str]):
+    """Return the first of ``enclitics`` that ``token`` ends with, or None.
+
+    Walks the trie back from the end of the token, so the cost depends on
+    the length of the enclitics rather than their number.
+    """
+    found = trie.get(None)
+    node = trie
+    for char in reversed(token):
+        node = node.get(char)
+        if node is None:
+            break
+        if None in node and (found is None or node[None] < found):
+            found = node[None]
+    if found is None:
+        return None
+    return enclitics[found]
 
 
 class WordTokenizer:
@@ -29,6 +118,14 @@ class WordTokenizer:
         self.punkt_param.abbrev_types = set(ABBREVIATIONS)
         self.sent_tokenizer = PunktSentenceTokenizer(self.punkt_param)
         self.word_tokenizer = LatinLanguageVars()
+        self._lookups = {}  # type: Dict
+
+    def __getstate__(self):
+        """Leave out the lookup tables, which hold functions that cannot be pickled, e.g. to
+        send the tokenizer to worker processes; they are built again on first use."""
+        state = self.__dict__.copy()
+        state['_lookups'] = {}
+        return state
 
     def tokenize(self, text: str,
                  replacements: List[Tuple[str, str]] = REPLACEMENTS,
@@ -78,64 +175,164 @@ class WordTokenizer:
 
         """
 
-        def matchcase(word):
-            """helper function From Python Cookbook"""
+        lookup = self._lookup(replacements, enclitics_exceptions, enclitics)
+        return list(self._tokens(text, *lookup, enclitics))
 
-            def replace(matching):
-                text = matching.group()
-                if text.isupper():
-                    return word.upper()
-                elif text.islower():
-                    return word.lower()
-                elif text[0].isupper():
-                    return word.capitalize()
-                return word
+    def tokenize_many(self, texts: Iterable[str],
+                      replacements: List[Tuple[str, str]] = REPLACEMENTS,
+                      enclitics_exceptions: List[str] = EXCEPTIONS,
+                      enclitics: List[str] = ENCLITICS
+                      ) -> Iterator[List[str]]:
+        """
+        Tokenize several texts, e.g. the lines of a file, as ``tokenize()``
+        would each of them, reusing the sentence tokenizer and the lookup
+        tables built for the replacements, exceptions and enclitics.
 
-            return replace
+        :param texts: Iterable of strings to tokenize
+        :returns: A generator of lists of tokens, one for each text
 
-        for replacement in replacements:
-            text = re.sub(replacement[0], matchcase(replacement[1]), text, flags=re.IGNORECASE)
+        >>> toker = WordTokenizer()
+        >>> list(toker.tokenize_many(['arma virumque cano', 'Tecum?']))
+        [['arma', 'virum', '-que', 'cano'], ['Cum', 'te', '?']]
+        """
+        lookup = self._lookup(replacements, enclitics_exceptions, enclitics)
+        for text in texts:
+            yield list(self._tokens(text, *lookup, enclitics))
+
+    def tokenize_spans(self, text: str,
+                       replacements: List[Tuple[str, str]] = REPLACEMENTS,
+                       enclitics_exceptions: List[str] = EXCEPTIONS,
+                       enclitics: List[str] = ENCLITICS
+                       ) -> array:
+        """
+        Find where each token ``tokenize()`` returns is in the text.
 
-        sents = self.sent_tokenizer.tokenize(text)
-        tokens = []  # type: List[str]
+        A token split off a word, like '-que', spans the letters it was
+        split from; the tokens a replacement makes, like 'cum' and 'me' for
+        'mecum', all span the text it replaced.
 
-        for sent in sents:
+        :param text: This accepts the string value that needs to be tokenized
+        :returns: An array('I') of the start and end offsets of each token,
+            alternating
+
+        >>> toker = WordTokenizer()
+        >>> spans = toker.tokenize_spans('arma virumque cano')
+        >>> [tuple(spans[i:i + 2]) for i in range(0, len(spans), 2)]
+        [(0, 4), (5, 10), (10, 13), (14, 18)]
+        """
+        substitutions, exceptions, trie = self._lookup(replacements, enclitics_exceptions,
+                                                       enclitics)
+        offsets = OffsetMap(text)
+        for pattern, replace in substitutions:
+            offsets.sub(pattern, replace)
+        spans = array('I')
+        for _, start, end in self._token_spans(offsets.text, exceptions, trie, enclitics):
+            spans.extend(offsets.span(start, end))
+        return spans
+
+    def _lookup(self, replacements, enclitics_exceptions, enclitics):
+        """Return the substitutions, the set of exceptions and the
+        enclitic trie for these arguments, built once for each set of
+        arguments."""
+        arguments = (tuple(tuple(replacement) for replacement in replacements),
+                     tuple(enclitics_exceptions),
+                     tuple(enclitics))
+        lookup = self._lookups.get(arguments)
+        if lookup is None:
+            if len(self._lookups) >= 8:
+                self._lookups.clear()
+            lookup = self._lookups[arguments] = (_compile_replacements(arguments[0]),
+                                                 frozenset(enclitics_exceptions),
+                                                 _enclitic_trie(enclitics))
+        return lookup
+
+    def _tokens(self, text: str,
+                substitutions: Tuple[Tuple[Pattern, Callable], ...],
+                exceptions: FrozenSet[str],
+                trie: Dict,
+                enclitics: List[str]
+                ) -> Iterator[str]:
+        """Yield the tokens of a text; see ``tokenize()``."""
+        for pattern, replace in substitutions:
+            text = pattern.sub(replace, text)
+
+        for sent in self.sent_tokenizer.tokenize(text):
             temp_tokens = self.word_tokenizer.word_tokenize(sent)
             # Need to check that tokens exist before handling them;
             # needed to make stream.readlines work in PlaintextCorpusReader
-            if temp_tokens:
-                if temp_tokens[0].endswith('ne'):
-                    if temp_tokens[0].lower() not in enclitics_exceptions:
-                        temp = [temp_tokens[0][:-2], '-ne']
-                        temp_tokens = temp + temp_tokens[1:]
-                if temp_tokens[-1].endswith('.'):
-                    final_word = temp_tokens[-1][:-1]
-                    del temp_tokens[-1]
-                    temp_tokens += [final_word, '.']
-
-                for token in temp_tokens:
-                    tokens.append(token)
-
-        # Break enclitic handling into own function?
-        specific_tokens = [] # type: List[str]
-
-        for token in tokens:
-            is_enclitic = False
-            if token.lower() not in enclitics_exceptions:
-                for enclitic in enclitics:
-                    if token.endswith(enclitic):
-                        if enclitic == 'n':
-                            specific_tokens += [token[:-len(enclitic)]] + ['-ne']
-                        elif enclitic == 'st':
-                            if token.endswith('ust'):
-                                specific_tokens += [token[:-len(enclitic) + 1]] + ['est']
-                            else:
-                                specific_tokens += [token[:-len(enclitic)]] + ['est']
-                        else:
-                            specific_tokens += [token[:-len(enclitic)]] + ['-' + enclitic]
-                        is_enclitic = True
-                        break
-            if not is_enclitic:
-                specific_tokens.append(token)
-
-        return specific_tokens
+            if not temp_tokens:
+                continue
+            if temp_tokens[0].endswith('ne'):
+                if temp_tokens[0].lower() not in exceptions:
+                    temp_tokens[0:1] = [temp_tokens[0][:-2], '-ne']
+            if temp_tokens[-1].endswith('.'):
+                temp_tokens[-1:] = [temp_tokens[-1][:-1], '.']
+
+            # Break enclitic handling into own function?
+            for token in temp_tokens:
+                enclitic = None
+                if token.lower() not in exceptions:
+                    enclitic = _find_enclitic(token, trie, enclitics)
+                if enclitic is None:
+                    yield token
+                elif enclitic == 'n':
+                    yield token[:-len(enclitic)]
+                    yield '-ne'
+                elif enclitic == 'st':
+                    if token.endswith('ust'):
+                        yield token[:-len(enclitic) + 1]
+                    else:
+                        yield token[:-len(enclitic)]
+                    yield 'est'
+                else:
+                    yield token[:-len(enclitic)]
+                    yield '-' + enclitic
+
+    def _token_spans(self, text: str,
+                     exceptions: FrozenSet[str],
+                     trie: Dict,
+                     enclitics: List[str]
+                     ) -> Iterator[Tuple[str, int, int]]:
+        """Yield each token of a text the replacements have been made in,
+        with the start and end of the text it comes from, splitting it as
+        ``_tokens()`` does; kept apart so that ``tokenize()`` does not pay
+        for the offsets."""
+        word_tokenizer_re = self.word_tokenizer._word_tokenizer_re()
+
+        for sent_start, sent_end in self.sent_tokenizer.span_tokenize(text):
+            temp_tokens = [(matching.group(1), matching.start(1), matching.end(1))
+                           for matching in word_tokenizer_re.finditer(text, sent_start, sent_end)]
+            # Need to check that tokens exist before handling them;
+            # needed to make stream.readlines work in PlaintextCorpusReader
+            if not temp_tokens:
+                continue
+            token, start, end = temp_tokens[0]
+            if token.endswith('ne'):
+                if token.lower() not in exceptions:
+                    temp_tokens[0:1] = [(token[:-2], start, end - 2), ('-ne', end - 2, end)]
+            token, start, end = temp_tokens[-1]
+            if token.endswith('.'):
+                temp_tokens[-1:] = [(token[:-1], start, end - 1), ('.', end - 1, end)]
+
+            # Break enclitic handling into own function?
+            for token, start, end in temp_tokens:
+                enclitic = None
+                if token.lower() not in exceptions:
+                    enclitic = _find_enclitic(token, trie, enclitics)
+                if enclitic is None:
+                    yield token, start, end
+                    continue
+                split = max(start, end - len(enclitic))
+                if enclitic == 'n':
+                    yield token[:-len(enclitic)], start, split
+                    yield '-ne', split, end
+                elif enclitic == 'st':
+                    if token.endswith('ust'):
+                        yield token[:-len(enclitic) + 1], start, split + 1
+                        yield 'est', split + 1, end
+                    else:
+                        yield token[:-len(enclitic)], start, split
+                        yield 'est', split, end
+                else:
+                    yield token[:-len(enclitic)], start, split
+                    yield '-' + enclitic, split, end
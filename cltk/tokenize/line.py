@@ -4,6 +4,8 @@ __author__ = ['Patrick J. Burns <patrick@diyclassics.org>',
               'Andrew Deloucas <adeloucas@g.harvard.edu>']
 __license__ = 'MIT License. See LICENSE.'
 
+from array import array
+
 
 class LineTokenizer():
     """Tokenize text by line; designed for study of poetry."""
@@ -32,3 +34,22 @@ class LineTokenizer():
         else:
             tokenized_lines = [line for line in untokenized_string.splitlines() if line != '']
         return tokenized_lines
+
+    def tokenize_spans(self: object, untokenized_string: str, include_blanks=False):
+        """Return the start and end offset of each line ``tokenize()``
+        returns, alternating in an array('I').
+        :type untokenized_string: str
+        :param untokenized_string: A string containing one of more sentences.
+        :param include_blanks: Boolean; If True, blank lines are given empty spans; Default is False.
+        :rtype : array
+        """
+        assert isinstance(untokenized_string, str), 'Incoming argument must be a string.'
+
+        spans = array('I')
+        start = 0
+        for line in untokenized_string.splitlines(True):
+            end = start + len(line.splitlines()[0])
+            if include_blanks or end > start:
+                spans.extend((start, end))
+            start += len(line)
+        return spans
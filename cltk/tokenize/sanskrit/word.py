@@ -9,6 +9,7 @@ import string
 import re
 
 from cltk.tokenize.word import BaseRegexWordTokenizer
+from cltk.tokenize.word import BaseWordTokenizer
 
 def WordTokenizer():
     return SanskritRegexSentenceTokenizer()
@@ -35,3 +36,11 @@ class SanskritRegexSentenceTokenizer(BaseRegexWordTokenizer):
         indian_punctuation_pattern = re.compile('([' + modified_punctuations + '\u0964\u0965' + ']|\|+)')
         tok_str = indian_punctuation_pattern.sub(r' \1 ', text.replace('\t', ' '))
         return re.sub(r'[ ]+', u' ', tok_str).strip(' ').split(' ')
+
+    def tokenize_spans(self, text: str):
+        """
+        :rtype: array
+        :param text: text to be tokenized into words
+        :type text: str
+        """
+        return BaseWordTokenizer.tokenize_spans(self, text)
@@ -7,19 +7,74 @@ __license__ = 'MIT License. See LICENSE.'
 import os
 import re
 import string
-from typing import List, Dict, Tuple, Set, Any, Generator
+import weakref
+from array import array
+from itertools import chain
+from itertools import islice
+from multiprocessing import Pool
+from typing import List, Dict, Tuple, Set, Any, Generator, Iterable, Iterator
 
 from nltk.tokenize.punkt import PunktLanguageVars
+from nltk.tokenize.punkt import PunktParameters
 from nltk.tokenize.punkt import PunktSentenceTokenizer
 
 from cltk.tokenize.latin.params import LatinLanguageVars
 from cltk.tokenize.greek.params import GreekLanguageVars
 from cltk.tokenize.sanskrit.params import SanskritLanguageVars
 
-from cltk.utils.file_operations import open_pickle
+from cltk.tokenize.utils import split_spans
+from cltk.utils.model_registry import load_model
 
 INDIAN_LANGUAGES = ['bengali', 'hindi', 'marathi', 'sanskrit', 'telugu']
 
+# Number of documents ``tokenize_sentences_batch()`` reads ahead of the
+# worker processes.
+BATCH_WINDOW = 64
+
+# Parameters of the loaded Punkt models, shared by all the tokenizers of a model.
+_SHARED_PARAMETERS = weakref.WeakKeyDictionary()
+
+# Sentence tokenizer of a worker process of ``tokenize_sentences_batch()``.
+_BATCH_TOKENIZER = None
+
+
+class _OrthoContext(dict):
+    """Orthographic context of shared Punkt parameters; unlike the
+    defaultdict of ``PunktParameters`` it does not grow when tokenizing looks
+    up a word it has not seen."""
+
+    def __missing__(self, key):
+        return 0
+
+
+def _punkt_parameters(model: PunktSentenceTokenizer) -> PunktParameters:
+    """Return the parameters of a Punkt model, copied once per model (and so
+    once per language, the model registry loading each model once) into a
+    ``PunktParameters`` which tokenizing does not change and which every
+    tokenizer of the model shares."""
+    params = _SHARED_PARAMETERS.get(model)
+    if params is None:
+        params = PunktParameters()
+        params.abbrev_types = frozenset(model._params.abbrev_types)
+        params.collocations = frozenset(model._params.collocations)
+        params.sent_starters = frozenset(model._params.sent_starters)
+        params.ortho_context = _OrthoContext(model._params.ortho_context)
+        _SHARED_PARAMETERS[model] = params
+    return params
+
+
+def _init_batch_worker(tokenizer):
+    """Keep the sentence tokenizer of a worker process."""
+    global _BATCH_TOKENIZER  # pylint: disable=global-statement
+    _BATCH_TOKENIZER = tokenizer
+
+
+def _tokenize_in_worker(text):
+    """Tokenize one document; run in worker processes by
+    ``tokenize_sentences_batch()``."""
+    return _BATCH_TOKENIZER.tokenize(text)
+
+
 class BaseSentenceTokenizer:
     """ Base class for sentence tokenization"""
 
@@ -42,13 +97,58 @@ class BaseSentenceTokenizer:
         :param model: tokenizer object to used # Should be in init?
         :type model: object
         """
-        if not self.model:
-            model = self.model
+        return self._punkt_tokenizer().tokenize(text)
+
+    def tokenize_spans(self, text: str):
+        """
+        Return the start and end offset of each sentence ``tokenize()``
+        returns, alternating in an array('I').
+
+        :rtype: array
+        :param text: text to be tokenized into sentences
+        :type text: str
+        """
+        return array('I', chain.from_iterable(self._punkt_tokenizer().span_tokenize(text)))
+
+    def tokenize_sentences_batch(self, texts: Iterable[str],
+                                 processes: int = 1) -> Iterator[List[str]]:
+        """
+        Tokenize many documents as ``tokenize()`` would each of them,
+        optionally in a pool of worker processes, each given a copy of this
+        tokenizer once.
+
+        :rtype: iterator of lists of sentences, one for each text, in order
+        :param texts: texts to be tokenized into sentences, read
+            ``BATCH_WINDOW`` at a time
+        :type texts: iterable
+        :param processes: number of worker processes; 1 to tokenize in this
+            process, None for one per CPU
+        :type processes: int
+        """
+        if processes == 1:
+            for text in texts:
+                yield self.tokenize(text)
+            return
+        texts = iter(texts)
+        with Pool(processes, initializer=_init_batch_worker, initargs=(self,)) as pool:
+            window = list(islice(texts, BATCH_WINDOW))
+            while window:
+                pending = pool.map_async(_tokenize_in_worker, window)
+                window = list(islice(texts, BATCH_WINDOW))
+                yield from pending.get()
 
-        tokenizer = self.model
-        if self.lang_vars:
-            tokenizer._lang_vars = self.lang_vars
-        return tokenizer.tokenize(text)
+    def _punkt_tokenizer(self) -> PunktSentenceTokenizer:
+        """Return a Punkt tokenizer for ``self.model`` with this tokenizer's
+        language variables, made on first use from the model's shared
+        parameters, so that the model itself is never changed."""
+        lang_vars = getattr(self, 'lang_vars', None) or self.model._lang_vars
+        punkt = self.__dict__.get('_punkt')
+        if punkt is None or punkt[0] is not self.model or punkt[1] is not lang_vars:
+            tokenizer = PunktSentenceTokenizer(_punkt_parameters(self.model),
+                                               lang_vars=lang_vars,
+                                               token_cls=self.model._Token)
+            punkt = self._punkt = (self.model, lang_vars, tokenizer)
+        return punkt[2]
 
     def _get_models_path(self, language):  # pragma: no cover
         return get_cltk_data_dir() + f'/{language}/model/{language}_models_cltk/tokenizers/sentence'
@@ -70,8 +170,9 @@ class BasePunktSentenceTokenizer(BaseSentenceTokenizer):
         if self.language:
             self.models_path = self._get_models_path(self.language)
             try:
-                self.model = open_pickle(os.path.join(os.path.expanduser(self.models_path),
-                                                      f'{self.language}_punkt.pickle'))
+                self.model = load_model(os.path.join(os.path.expanduser(self.models_path),
+                                                     f'{self.language}_punkt.pickle'),
+                                        language=self.language)
             except FileNotFoundError as err:
                 raise type(err)(BasePunktSentenceTokenizer.missing_models_message)
 
@@ -105,6 +206,16 @@ class BaseRegexSentenceTokenizer(BaseSentenceTokenizer):
         sentences = re.split(self.pattern, text)
         return sentences
 
+    def tokenize_spans(self, text: str):
+        """
+        Method for finding sentences with regular expressions.
+
+        :rtype: array
+        :param text: text to be tokenized into sentences
+        :type text: str
+        """
+        return split_spans(self.pattern, text)
+
 
 class TokenizeSentence(BasePunktSentenceTokenizer):  # pylint: disable=R0903
     """Tokenize sentences for the language given as argument, e.g.,
@@ -147,7 +258,7 @@ class TokenizeSentence(BasePunktSentenceTokenizer):  # pylint: disable=R0903
             self.pattern = rf'(?<=[{self.sent_end_chars_regex}])\s'
         else:
             # Warn that NLTK Punkt is being used by default???
-            tokenizer = PunktSentenceTokenizer()
+            tokenizer = self._default_punkt_tokenizer()
 
         # mk list of tokenized sentences
         if self.language == 'greek' or self.language in INDIAN_LANGUAGES:
@@ -164,3 +275,38 @@ class TokenizeSentence(BasePunktSentenceTokenizer):  # pylint: disable=R0903
         :param untokenized_string: A string containing one of more sentences.
         """
         return self.tokenize_sentences(untokenized_string)
+
+    def tokenize_spans(self, untokenized_string: str):
+        """Return the start and end offset of each sentence
+        ``tokenize_sentences()`` returns, alternating in an array('I').
+
+        :type untokenized_string: str
+        :param untokenized_string: A string containing one of more sentences.
+        :rtype : array
+        """
+        assert isinstance(untokenized_string, str), \
+            'Incoming argument must be a string.'
+
+        if self.language == 'latin':
+            return super().tokenize_spans(untokenized_string)
+        if self.language == 'greek':
+            return split_spans(self._sent_end_pattern(GreekLanguageVars), untokenized_string)
+        if self.language in INDIAN_LANGUAGES:
+            return split_spans(self._sent_end_pattern(SanskritLanguageVars), untokenized_string)
+        spans = self._default_punkt_tokenizer().span_tokenize(untokenized_string)
+        return array('I', chain.from_iterable(spans))
+
+    def _default_punkt_tokenizer(self) -> PunktSentenceTokenizer:
+        """Return the untrained ``PunktSentenceTokenizer()`` used for
+        languages without a model of their own, made on first use."""
+        tokenizer = self.__dict__.get('_default_punkt')
+        if tokenizer is None:
+            tokenizer = self._default_punkt = PunktSentenceTokenizer()
+        return tokenizer
+
+    @staticmethod
+    def _sent_end_pattern(lang_vars):
+        """Return the pattern ``tokenize_sentences()`` splits the sentences
+        of a language at."""
+        sent_end_chars_regex = '|'.join(lang_vars.sent_end_chars)
+        return rf'(?<=[{sent_end_chars_regex}])\s'
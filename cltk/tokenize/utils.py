@@ -5,13 +5,194 @@ __author__ = ['Patrick J. Burns <patrick@diyclassics.org>']
 __license__ = 'MIT License.'
 
 import pickle
+import re
 from abc import abstractmethod
-from typing import List, Dict, Tuple, Set, Any, Generator
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Tuple, Set, Any, Generator, Iterable, Iterator
 import inspect
 
 from nltk.tokenize.punkt import PunktSentenceTokenizer, PunktTrainer
 from nltk.tokenize.punkt import PunktLanguageVars
 
+# How far past the previous token to look for the text of a token.
+ALIGN_WINDOW = 100
+
+WORD_CHAR = re.compile(r'\w')
+WORD = re.compile(r'\w+')
+
+
+def span_tokens(text: str, spans: array) -> Iterator[str]:
+    """Yield the text of each span returned by a ``tokenize_spans()`` method,
+    so that token strings are only made when they are used.
+
+    :param text: Text the spans were taken from
+    :param spans: Flat array of start and end offsets, alternating
+    :rtype: iterator of str
+    """
+    for i in range(0, len(spans), 2):
+        yield text[spans[i]:spans[i + 1]]
+
+
+def align_spans(text: str, tokens: Iterable[str]) -> array:
+    """Find the span of text each token came from, for tokenizers which do
+    not keep track of offsets themselves.
+
+    Tokenizers may rewrite tokens, e.g. the Latin one splits 'mecum' into
+    'cum' and 'me', and 'factumst' into 'factum' and 'est'. A token which is
+    not found right after the previous one is given the rest of the word the
+    previous one ended in, else the next occurrence of its text, else the
+    span of the previous token.
+
+    :param text: Text that was tokenized
+    :param tokens: Tokens of the text, in order
+    :rtype: array('I') of start and end offsets, alternating
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = text
+    spans = array('I')
+    cursor = 0
+    span = (0, 0)
+    for token in tokens:
+        word = token.lower()
+        if len(word) > 1 and word.startswith('-'):
+            word = word[1:]
+        start = lowered.find(word, cursor, cursor + ALIGN_WINDOW + len(word))
+        in_word = cursor and WORD_CHAR.match(text, cursor - 1) and WORD.match(text, cursor)
+        if start != -1 and not WORD_CHAR.search(text, cursor, start):
+            span = (start, start + len(word))
+        elif in_word:
+            span = in_word.span()
+        elif start != -1:
+            span = (start, start + len(word))
+        cursor = max(cursor, span[1])
+        spans.extend(span)
+    return spans
+
+
+def split_spans(pattern, text: str) -> array:
+    """Return the spans of the pieces ``re.split(pattern, text)`` would
+    return, for a pattern without groups.
+
+    :rtype: array('I') of start and end offsets, alternating
+    """
+    spans = array('I', [0])
+    for match in re.finditer(pattern, text):
+        spans.extend(match.span())
+    spans.append(len(text))
+    return spans
+
+
+class OffsetMap:
+    """Rewrite a text with regex substitutions, keeping track of where each
+    character of the result came from, so that spans found in the rewritten
+    text can be mapped back to the original.
+
+    A replacement which only adds or removes whitespace, such as padding
+    punctuation with spaces, maps each remaining character to itself; any
+    other replacement maps to the whole text it replaced.
+
+    >>> offsets = OffsetMap('arma, virum')
+    >>> offsets.sub(r'(,)', r' \\1 ')
+    'arma ,  virum'
+    >>> offsets.span(5, 6)
+    (4, 5)
+    """
+
+    def __init__(self, text: str):
+        """
+        :param text: Original text
+        :type text: str
+        """
+        self.text = text
+        self._passes = []  # type: List[Tuple[List[int], List[Tuple]]]
+
+    def sub(self, pattern, repl) -> str:
+        """Substitute as ``re.sub()`` would in the current text, and return
+        the result, which becomes the current text.
+
+        :param pattern: Pattern, compiled or not
+        :param repl: Replacement template or function of the match
+        :rtype: str
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        text = self.text
+        pieces = []
+        starts = []
+        edits = []
+        last = 0
+        length = 0
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            replacement = repl(match) if callable(repl) else match.expand(repl)
+            found = match.group()
+            if replacement == found:
+                continue
+            pieces.append(text[last:start])
+            length += start - last
+            starts.append(length)
+            edits.append((length, length + len(replacement), start, end,
+                          self._char_spans(found, replacement, start)))
+            pieces.append(replacement)
+            length += len(replacement)
+            last = end
+        if edits:
+            pieces.append(text[last:])
+            self.text = ''.join(pieces)
+            self._passes.append((starts, edits))
+        return self.text
+
+    @staticmethod
+    def _char_spans(found, replacement, start):
+        """Map each character of a replacement to the character of the
+        replaced text it stands for, if it only differs from it in
+        whitespace; else return None."""
+        if ''.join(found.split()) != ''.join(replacement.split()):
+            return None
+        spans = []
+        position = start
+        for char in replacement:
+            if char.isspace():
+                spans.append((position, position))
+                continue
+            while found[position - start].isspace():
+                position += 1
+            spans.append((position, position + 1))
+            position += 1
+        return spans
+
+    @staticmethod
+    def _char(substitution, position):
+        """Return the span of text before a substitution that the character
+        at ``position`` after it came from."""
+        starts, edits = substitution
+        i = bisect_right(starts, position) - 1
+        if i < 0:
+            return position, position + 1
+        new_start, new_end, old_start, old_end, chars = edits[i]
+        if position >= new_end:
+            position += old_end - new_end
+            return position, position + 1
+        if chars is None:
+            return old_start, old_end
+        return chars[position - new_start]
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """Return the span of the original text that a span of the current
+        text came from.
+
+        :rtype: tuple of int
+        """
+        for substitution in reversed(self._passes):
+            if start < end:
+                start, end = self._char(substitution, start)[0], self._char(substitution, end - 1)[1]
+            else:
+                start = end = self._char(substitution, start)[0]
+        return start, end
+
+
 class BaseSentenceTokenizerTrainer():
     """ Train sentence tokenizer
     """
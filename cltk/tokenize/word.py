@@ -14,6 +14,8 @@ __license__ = 'MIT License. See LICENSE.'
 import logging
 import re
 from abc import abstractmethod
+from array import array
+from itertools import chain
 from typing import List
 
 from nltk.tokenize.punkt import PunktParameters
@@ -28,6 +30,8 @@ from cltk.tokenize.middle_english.params import MiddleEnglishTokenizerPatterns
 from cltk.tokenize.middle_high_german.params import MiddleHighGermanTokenizerPatterns
 from cltk.tokenize.old_norse.params import OldNorseTokenizerPatterns
 from cltk.tokenize.old_french.params import OldFrenchTokenizerPatterns
+from cltk.tokenize.utils import OffsetMap
+from cltk.tokenize.utils import align_spans
 
 LOG = logging.getLogger(__name__)
 LOG.addHandler(logging.NullHandler())
@@ -98,6 +102,16 @@ class WordTokenizer:  # pylint: disable=too-few-public-methods
             return tokenize_akkadian_words(text)
         return self.toker.tokenize(text)
 
+    def tokenize_spans(self, text):
+        """Return the start and end offset of each token ``tokenize()``
+        returns, alternating in an array('I'); ``text[start:end]`` is the
+        text a token came from."""
+        if self.language == 'akkadian':
+            return align_spans(text, [word for word, _ in tokenize_akkadian_words(text)])
+        if isinstance(self.toker, TreebankWordTokenizer):
+            return _treebank_spans(self.toker, text)
+        return self.toker.tokenize_spans(text)
+
     def tokenize_sign(self, word):
         """This is for tokenizing cuneiform signs."""
         if self.language == 'akkadian':
@@ -107,6 +121,19 @@ class WordTokenizer:  # pylint: disable=too-few-public-methods
         return sign_tokens
 
 
+def _treebank_spans(tokenizer, text, offset=0):
+    """Return the spans of the tokens of NLTK's ``TreebankWordTokenizer``,
+    shifted by ``offset``; tokens it rewrites beyond its own alignment, like
+    quotes, are aligned by ``align_spans()``."""
+    try:
+        spans = array('I', chain.from_iterable(tokenizer.span_tokenize(text)))
+    except ValueError:
+        spans = align_spans(text, tokenizer.tokenize(text))
+    if offset:
+        spans = array('I', [position + offset for position in spans])
+    return spans
+
+
 class BaseWordTokenizer:
     """ Base class for word tokenization"""
 
@@ -126,6 +153,18 @@ class BaseWordTokenizer:
         """
         pass
 
+    def tokenize_spans(self, text: str):
+        """
+        Return where each token of ``tokenize()`` is in the text, as a flat
+        array('I') of start and end offsets; subclasses which know them
+        should override this, else they are found by ``align_spans()``.
+
+        :rtype: array
+        :param text: text to be tokenized into words
+        :type text: str
+        """
+        return align_spans(text, self.tokenize(text))
+
 
 class BasePunktWordTokenizer(BaseWordTokenizer):
     """Base class for punkt word tokenization"""
@@ -153,6 +192,20 @@ class BasePunktWordTokenizer(BaseWordTokenizer):
         tokenizer = TreebankWordTokenizer()
         return [item for sublist in tokenizer.tokenize_sents(sents) for item in sublist]
 
+    def tokenize_spans(self, text: str):
+        """
+        :rtype: array
+        :param text: text to be tokenized into words
+        :type text: str
+        """
+        sent_spans = self.sent_tokenizer.tokenize_spans(text)
+        tokenizer = TreebankWordTokenizer()
+        spans = array('I')
+        for i in range(0, len(sent_spans), 2):
+            start = sent_spans[i]
+            spans.extend(_treebank_spans(tokenizer, text[start:sent_spans[i + 1]], start))
+        return spans
+
 
 class BaseRegexWordTokenizer(BaseWordTokenizer):
     """Base class for regex word tokenization"""
@@ -180,6 +233,20 @@ class BaseRegexWordTokenizer(BaseWordTokenizer):
             text = re.sub(pattern[0], pattern[1], text)
         return text.split()
 
+    def tokenize_spans(self, text: str):
+        """
+        :rtype: array
+        :param text: text to be tokenized into words
+        :type text: str
+        """
+        offsets = OffsetMap(text)
+        for pattern in self.patterns:
+            offsets.sub(pattern[0], pattern[1])
+        spans = array('I')
+        for token in re.finditer(r'\S+', offsets.text):
+            spans.extend(offsets.span(*token.span()))
+        return spans
+
 
 class BaseArabyWordTokenizer(BaseWordTokenizer):
     """
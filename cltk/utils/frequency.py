@@ -5,15 +5,51 @@ __author__ = ['Kyle P. Johnson <kyle@kyle-p-johnson.com>']
 __license__ = 'MIT License. See LICENSE.'
 
 
+import os
+import pickle
+from collections import Counter
+from multiprocessing import Pool
+
 from cltk.corpus.utils.formatter import assemble_tlg_author_filepaths
 from cltk.corpus.utils.formatter import assemble_phi5_author_filepaths
 from cltk.corpus.utils.formatter import tlg_plaintext_cleanup
 from cltk.corpus.utils.formatter import phi5_plaintext_cleanup
 from cltk.utils.cltk_logger import logger
-from collections import Counter
 from nltk.tokenize.punkt import PunktLanguageVars
 
 
+CORPUS_CLEANERS = {'phi5': phi5_plaintext_cleanup,
+                   'tlg': tlg_plaintext_cleanup}
+
+# Version of the layout of the counts kept by ``counter_from_corpus()``;
+# a cache of another version is counted again from scratch.
+FREQUENCY_CACHE_VERSION = 2
+
+
+def _count_file(job):
+    """Count the words (or n-grams) of one corpus file; run in worker
+    processes by ``Frequency.counter_from_corpus()``.
+    :param job: Tuple of file path, corpus name and n-gram size.
+    :rtype: tuple of file path and Counter
+    """
+    filepath, corpus, ngrams = job
+    with open(filepath) as file_open:
+        file_read = file_open.read().lower()
+    file_clean = CORPUS_CLEANERS[corpus](file_read)
+    return filepath, Frequency().counter_from_str(file_clean, ngrams=ngrams)
+
+
+def _file_stamp(filepath):
+    """Return what identifies a version of a file: its mtime and size."""
+    stat = os.stat(filepath)
+    return stat.st_mtime, stat.st_size
+
+
+def _author_id(filepath):
+    """'/.../TLG0012.TXT' -> 'TLG0012'"""
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+
 class Frequency:
     """Methods for making word frequency lists."""
 
@@ -22,37 +58,143 @@ class Frequency:
         ``cltk_data/user_data``."""
         self.punkt = PunktLanguageVars()
         self.punctuation = [',', '.', ';', ':', '"', "'", '?', '-', '!', '*', '[', ']', '{', '}']
+        self._punctuation_table = str.maketrans('', '', ''.join(self.punctuation))
 
-    def counter_from_str(self, string):
-        """Build word frequency list from incoming string."""
-        string_list = [chars for chars in string if chars not in self.punctuation]
-        string_joined = ''.join(string_list)
-        tokens = self.punkt.word_tokenize(string_joined)
-        return Counter(tokens)
+    def counter_from_str(self, string, ngrams=1):
+        """Build word frequency list from incoming string.
+        :param string: Text to count.
+        :param ngrams: Count sequences of this many words, as tuples, instead
+            of single words.
+        :rtype: Counter
+        """
+        tokens = self.punkt.word_tokenize(string.translate(self._punctuation_table))
+        if ngrams == 1:
+            return Counter(tokens)
+        return Counter(zip(*(tokens[i:] for i in range(ngrams))))
 
-    def counter_from_corpus(self, corpus):
+    def counter_from_corpus(self, corpus, ngrams=1, by_author=False, processes=None,
+                            cache_dir=None):
         """Build word frequency list from one of several available corpora.
-        TODO: Make this count iteratively, not all at once
+
+        Files are read and counted one at a time, optionally in a pool of
+        worker processes, and their counts merged, so memory use is bounded
+        by the size of the vocabulary rather than of the corpus.
+
+        With ``cache_dir``, the counts of each file are saved there and only
+        files that are new or changed since the previous run are counted
+        again; the totals are updated accordingly.
+
+        :param corpus: 'phi5' or 'tlg'
+        :param ngrams: Count sequences of this many words instead of words.
+        :param by_author: Return a dict of author id (e.g. 'TLG0012') to
+            Counter instead of a single Counter.
+        :param processes: If greater than 1, count files in a pool of this
+            many worker processes.
+        :param cache_dir: Directory in which to keep counts between runs.
+        :rtype: Counter or dict
         """
         assert corpus in ['phi5', 'tlg'], \
             "Corpus '{0}' not available. Choose from 'phi5' or 'tlg'.".format(corpus)
 
-        all_strings = self._assemble_corpus_string(corpus=corpus)
-        return self.counter_from_str(all_strings)
-
-    def _assemble_corpus_string(self, corpus):
-        """Takes a list of filepaths, returns a string containing contents of
-        all files."""
-
         if corpus == 'phi5':
             filepaths = assemble_phi5_author_filepaths()
-            file_cleaner = phi5_plaintext_cleanup
         elif corpus == 'tlg':
             filepaths = assemble_tlg_author_filepaths()
-            file_cleaner = tlg_plaintext_cleanup
 
-        for filepath in filepaths:
-            with open(filepath) as file_open:
-                file_read = file_open.read().lower()
-            file_clean = file_cleaner(file_read)
-            yield file_clean
+        if cache_dir:
+            return self._counter_from_cache(corpus, filepaths, ngrams, by_author, processes,
+                                            cache_dir)
+
+        if by_author:
+            return {_author_id(filepath): counter for filepath, counter
+                    in self._count_files(corpus, filepaths, ngrams, processes)}
+
+        total = Counter()
+        for _, counter in self._count_files(corpus, filepaths, ngrams, processes):
+            total.update(counter)
+        return total
+
+    def _count_files(self, corpus, filepaths, ngrams, processes):
+        """Yield (file path, Counter) for each file, in no particular order
+        when counting in parallel."""
+        jobs = [(filepath, corpus, ngrams) for filepath in filepaths]
+        if processes and processes > 1:
+            with Pool(processes) as pool:
+                yield from pool.imap_unordered(_count_file, jobs)
+        else:
+            for job in jobs:
+                yield _count_file(job)
+
+    def _counter_from_cache(self, corpus, filepaths, ngrams, by_author, processes, cache_dir):
+        """Bring the counts saved in ``cache_dir`` up to date and return them.
+
+        The directory holds one pickled Counter per file plus a manifest
+        with the totals and, for every file counted, its mtime and size and
+        the name of its Counter. New Counters are written under the number
+        of the run, so those the manifest on disk refers to are only removed
+        once the new manifest has replaced it; a run interrupted before then
+        leaves the previous cache intact.
+        """
+        cache_dir = os.path.join(os.path.expanduser(cache_dir),
+                                 '{0}_{1}gram'.format(corpus, ngrams))
+        os.makedirs(cache_dir, exist_ok=True)
+        manifest_path = os.path.join(cache_dir, 'manifest.pickle')
+        manifest = None
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, 'rb') as file_open:
+                manifest = pickle.load(file_open)
+        if not manifest or manifest.get('version') != FREQUENCY_CACHE_VERSION:
+            manifest = {'version': FREQUENCY_CACHE_VERSION, 'generation': 0,
+                        'files': {}, 'total': Counter()}
+        manifest['generation'] += 1
+
+        def load_counter(filepath):
+            _, name = manifest['files'][filepath]
+            with open(os.path.join(cache_dir, name), 'rb') as file_open:
+                return pickle.load(file_open)
+
+        def forget(filepath):
+            manifest['total'].subtract(load_counter(filepath))
+            del manifest['files'][filepath]
+
+        current = set(filepaths)
+        removed = [filepath for filepath in manifest['files'] if filepath not in current]
+        for filepath in removed:
+            forget(filepath)
+
+        stamps = {filepath: _file_stamp(filepath) for filepath in filepaths}
+        stale = [filepath for filepath in filepaths
+                 if filepath not in manifest['files']
+                 or manifest['files'][filepath][0] != stamps[filepath]]
+        for filepath in stale:
+            if filepath in manifest['files']:
+                forget(filepath)
+        logger.info("Counting %s of %s files of corpus '%s'.", len(stale), len(filepaths), corpus)
+
+        for filepath, counter in self._count_files(corpus, stale, ngrams, processes):
+            name = '{0}.{1}.pickle'.format(_author_id(filepath), manifest['generation'])
+            self._dump(counter, os.path.join(cache_dir, name))
+            manifest['total'].update(counter)
+            manifest['files'][filepath] = (stamps[filepath], name)
+
+        if stale or removed:
+            manifest['total'] = +manifest['total']  # drop zero counts left by subtract()
+            self._dump(manifest, manifest_path)
+
+        # Counters replaced by this run, or left behind by an interrupted one.
+        referenced = {name for _, name in manifest['files'].values()}
+        for name in os.listdir(cache_dir):
+            if name != 'manifest.pickle' and name not in referenced:
+                os.remove(os.path.join(cache_dir, name))
+
+        if by_author:
+            return {_author_id(filepath): load_counter(filepath) for filepath in filepaths}
+        return manifest['total']
+
+    @staticmethod
+    def _dump(obj, path):
+        """Pickle ``obj`` to ``path`` without leaving a partial file behind."""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as file_open:
+            pickle.dump(obj, file_open, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
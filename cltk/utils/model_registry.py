@@ -0,0 +1,171 @@
+"""Process-wide registry for trained models loaded from ``cltk_data``.
+
+Taggers, lemmatizers, sentence tokenizers and the macronizer all read large
+pickles from disk. Loading them through the shared ``registry`` means each
+file is deserialized once per process and then reused by every caller until
+the file changes on disk or the entry is evicted.
+
+Entries are keyed by ``(language, path, mtime, loader)``, so a retrained model
+dropped into ``cltk_data`` is picked up on the next lookup, and a file read by
+two different loaders is cached once per loader. The registry evicts least
+recently used entries once the approximate footprint of the cached models
+(taken from their size on disk) exceeds ``max_bytes``.
+
+>>> from cltk.utils.model_registry import registry
+>>> tagger = registry.load('/path/to/tnt.pickle', language='latin')  # doctest: +SKIP
+>>> registry.load('/path/to/tnt.pickle', language='latin') is tagger  # doctest: +SKIP
+True
+"""
+
+from collections import OrderedDict
+import os
+import threading
+from typing import Any, Callable, Iterable, List, Tuple
+
+from cltk.utils.file_operations import open_pickle
+
+__license__ = 'MIT License. See LICENSE.'
+
+
+# Default budget for the approximate footprint of all cached models: 2 GiB,
+# overridable with the ``$CLTK_MODEL_CACHE_BYTES`` environment variable.
+DEFAULT_MAX_BYTES = int(os.environ.get('CLTK_MODEL_CACHE_BYTES', 2 * 1024 ** 3))
+
+
+class ModelRegistry:
+    """Thread-safe LRU cache of loaded models."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param max_bytes: Approximate upper bound on the total on-disk size of
+            the models held in memory; least recently used models are evicted
+            beyond it. The most recently loaded model is always kept.
+        :type max_bytes: int
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (model, size)
+        self._key_locks = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _make_key(path: str, language: str = None,
+                  loader: Callable[[str], Any] = open_pickle) -> Tuple[str, str, float, Callable]:
+        """Build the cache key for a model file; raises ``FileNotFoundError``
+        when the file is missing, as ``open_pickle()`` does.
+        """
+        path = os.path.abspath(os.path.expanduser(path))
+        return language, path, os.path.getmtime(path), loader
+
+    def load(self, path: str, language: str = None, loader: Callable[[str], Any] = open_pickle):
+        """Return the model stored at ``path``, loading it on first use.
+
+        :param path: File path to the model.
+        :type path: str
+        :param language: Language the model belongs to; part of the cache key.
+        :type language: str
+        :param loader: Callable taking the path and returning the model;
+            defaults to ``open_pickle()``. Part of the cache key.
+        :rtype: object
+        """
+        key = self._make_key(path, language, loader)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Load outside of the registry lock so that other models stay
+        # available; the per-key lock stops two threads loading the same file.
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key][0]
+            model = loader(key[1])
+            size = os.path.getsize(key[1])
+            with self._lock:
+                self._discard_stale(key)
+                self._entries[key] = (model, size)
+                self._key_locks.pop(key, None)
+                self._shrink()
+        return model
+
+    def preload(self, paths: Iterable[str], language: str = None,
+                loader: Callable[[str], Any] = open_pickle) -> List[Any]:
+        """Load several models ahead of time, e.g. before forking workers.
+
+        :param paths: File paths of the models to load.
+        :type paths: iterable
+        :param language: Language the models belong to.
+        :type language: str
+        :rtype: list
+        """
+        return [self.load(path, language=language, loader=loader) for path in paths]
+
+    def evict(self, path: str = None, language: str = None) -> int:
+        """Drop cached models. With no arguments the whole registry is
+        cleared; otherwise only entries matching ``path`` and/or ``language``.
+
+        :param path: File path of the model to drop.
+        :type path: str
+        :param language: Drop all models for this language.
+        :type language: str
+        :return: Number of entries removed.
+        :rtype: int
+        """
+        if path is not None:
+            path = os.path.abspath(os.path.expanduser(path))
+        with self._lock:
+            doomed = [key for key in self._entries
+                      if (path is None or key[1] == path)
+                      and (language is None or key[0] == language)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    @property
+    def size(self) -> int:
+        """Approximate footprint in bytes of all cached models."""
+        with self._lock:
+            return sum(size for _, size in self._entries.values())
+
+    def _discard_stale(self, key):
+        """Remove entries for the same file and loader with an older mtime."""
+        stale = [old for old in self._entries
+                 if old[:2] == key[:2] and old[3] == key[3] and old != key]
+        for old in stale:
+            del self._entries[old]
+
+    def _shrink(self):
+        """Evict least recently used models until within ``max_bytes``."""
+        total = sum(size for _, size in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            total -= size
+
+    def __contains__(self, path: str) -> bool:
+        path = os.path.abspath(os.path.expanduser(path))
+        with self._lock:
+            return any(key[1] == path for key in self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'<{type(self).__name__}: {len(self)} models, {self.size} bytes>'
+
+
+registry = ModelRegistry()  # pylint: disable=invalid-name
+
+
+def load_model(path: str, language: str = None, loader: Callable[[str], Any] = open_pickle):
+    """Load a model through the process-wide ``registry``.
+
+    :param path: File path to the model.
+    :type path: str
+    :param language: Language the model belongs to.
+    :type language: str
+    :param loader: Callable taking the path and returning the model.
+    :rtype: object
+    """
+    return registry.load(path, language=language, loader=loader)
@@ -32,9 +32,21 @@ from cltk.tokenize.sentence import TokenizeSentence
 from cltk.tokenize.word import WordTokenizer
 
 
-def gen_docs(corpus, lemmatize, rm_stops):
+def _cleaned_texts(filepaths, text_cleaner):
+    """Yield the text of each file after a light first-pass cleanup, before sentence tokenization
+    (which relies on punctuation)."""
+    for filepath in filepaths:
+        with open(filepath) as f:
+            text = f.read()
+        yield text_cleaner(text, rm_punctuation=False, rm_periods=False)
+
+
+def gen_docs(corpus, lemmatize, rm_stops, processes=1):
     """Open and process files from a corpus. Return a list of sentences for an author. Each sentence
     is itself a list of tokenized words.
+
+    :param processes: Number of processes to split the files into sentences with; None for one per
+        CPU.
     """
 
     assert corpus in ['phi5', 'tlg']
@@ -65,17 +77,13 @@ def gen_docs(corpus, lemmatize, rm_stops):
 
     sent_tokenizer = TokenizeSentence(language)
 
-    for filepath in filepaths:
-        with open(filepath) as f:
-            text = f.read()
-        # light first-pass cleanup, before sentence tokenization (which relies on punctuation)
-        text = text_cleaner(text, rm_punctuation=False, rm_periods=False)
-        sent_tokens = sent_tokenizer.tokenize_sentences(text)
+    texts = _cleaned_texts(filepaths, text_cleaner)
+    for sent_tokens in sent_tokenizer.tokenize_sentences_batch(texts, processes=processes):
         # doc_sentences = []
         for sentence in sent_tokens:
             # a second cleanup at sentence-level, to rm all punctuation
             sentence = text_cleaner(sentence, rm_punctuation=True, rm_periods=True)
-            sentence = word_tokenizer(sentence)
+            sentence = word_tokenizer.tokenize(sentence)
             sentence = [s.lower() for s in sentence]
             sentence = [w for w in sentence if w]
             if language == 'latin':
@@ -101,13 +109,13 @@ def gen_docs(corpus, lemmatize, rm_stops):
 
 
 def make_model(corpus, lemmatize=False, rm_stops=False, size=100, window=10, min_count=5, workers=4, sg=1,
-               save_path=None):
+               save_path=None, processes=1):
     """Train W2V model."""
 
     # Simple training, with one large list
     t0 = time.time()
 
-    sentences_stream = gen_docs(corpus, lemmatize=lemmatize, rm_stops=rm_stops)
+    sentences_stream = gen_docs(corpus, lemmatize=lemmatize, rm_stops=rm_stops, processes=processes)
     # sentences_list = []
     # for sent in sentences_stream:
     #    sentences_list.append(sent)
@@ -35,8 +35,12 @@ setup(
     long_description='The Classical Language Toolkit (CLTK) is a framework for natural language processing for Classical languages.',  # pylint: disable=C0301,
     name='cltk',
     packages=find_packages(),
+    python_requires='>=3.7',
+    package_data={'cltk.corpus.greek': ['*.idx'],
+                  'cltk.corpus.greek.tlg': ['*.idx'],
+                  'cltk.corpus.latin': ['*.idx']},
     url='https://github.com/cltk/cltk',
     version='0.1.117',
-    zip_safe=True,
+    zip_safe=False,
     test_suite='cltk.tests.test_cltk',
 )